@@ -0,0 +1,249 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/python
+"""
+Module containing micro-benchmarks of the hot paths of the model.
+Usage: python -m benchmark.micro [CASE ...] [--min-time SECONDS]
+"""
+import argparse
+import fnmatch
+import gc
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+from model.python.link_config import LinkConfig
+from model.python.tapi_node import TapiNode
+from model.python.tapi_node_edge_point import TapiNodeEdgePoint
+from model.python.tapi_topology import TapiTopology
+
+
+class MicroBenchmark:
+    """
+    Class measuring single operations of the model classes in isolation.
+    A case depending on a count is measured for several sizes, e.g. the
+    number of southbound node-edge-points of a fronthaul gateway, the other
+    cases once. Reported are the time per operation, the memory blocks
+    retained per operation (allocations of the created objects) and the peak
+    of the traced memory per operation (including temporary objects).
+    """
+
+    UUID: str = "a0b1c2d3-e4f5-4a6b-8c7d-9e0f1a2b3c4d"
+    # number of southbound node-edge-points of the fronthaul gateway or
+    # number of connection-edge-points of a node-edge-point, within the
+    # counts of the configuration schema (1..8)
+    SIZES: List[int] = [1, 2, 4, 8]
+    # cases independent of the size, measured once
+    INVARIANT: List[str] = ["node/smo", "node/near-rt-ric", "node/o-du",
+                            "node/o-ru", "x_offset_by_cep_name",
+                            "y_offset_by_cep_name"]
+
+    __cases: List[str] = None
+    __min_time: float = 0.2
+    __results: List[Dict] = None
+
+    # constructor
+    def __init__(self, cases: List[str] = None, min_time: float = 0.2):
+        self.__cases = cases or ["*"]
+        self.__min_time = min_time
+        self.__results = []
+
+    # getters
+    def cases(self) -> Dict[str, Callable[[int], Callable]]:
+        """
+        Getter returning all cases.
+        :return Functions creating the operation for a size by case name.
+        """
+        return {
+            "node/smo": lambda size: self.__anchor("smo", size),
+            "node/near-rt-ric": lambda size: self.__anchor("near-rt-ric", size),
+            "node/o-du": lambda size: self.__anchor("o-du", size),
+            "node/fronthaul-gateway":
+                lambda size: self.__anchor("fronthaul-gateway", size),
+            "node/o-ru": lambda size: self.__anchor("o-ru", size),
+            "node-edge-point": self.__node_edge_point,
+            "link-config": self.__link_config,
+            "node_edge_point_by_cep_name": self.__node_edge_point_by_cep_name,
+            "x_offset_by_cep_name": lambda size: self.__offset("x", size),
+            "y_offset_by_cep_name": lambda size: self.__offset("y", size),
+            "svg": lambda size: self.__svg(size)
+        }
+
+    def results(self) -> List[Dict]:
+        """
+        Getter returning the results.
+        :return List of case, size (None for invariant cases), ns/op,
+                blocks/op and peak bytes/op.
+        """
+        return self.__results
+
+    # methods
+    def run(self) -> 'MicroBenchmark':
+        """
+        Method measuring the selected cases.
+        :return The MicroBenchmark object.
+        """
+        for name, factory in self.cases().items():
+            if not any([fnmatch.fnmatch(name, case) for case in self.__cases]):
+                continue
+            for size in [None] if name in self.INVARIANT else self.SIZES:
+                operation = factory(size or 1)
+                self.__results.append({
+                    "case": name,
+                    "size": size,
+                    "ns/op": self.__time(operation),
+                    "blocks/op": self.__blocks(operation),
+                    "peak-bytes/op": self.__peak(operation)
+                })
+        return self
+
+    def show(self):
+        """
+        Method printing the results as table.
+        """
+        row = "{:<28} {:>6} {:>12} {:>10} {:>14}"
+        print(row.format("case", "size", "ns/op", "blocks/op", "peak bytes/op"))
+        for result in self.__results:
+            print(row.format(result["case"],
+                             "-" if result["size"] is None else result["size"],
+                             "{:,.0f}".format(result["ns/op"]),
+                             "{:.1f}".format(result["blocks/op"]),
+                             "{:,}".format(result["peak-bytes/op"])))
+
+    # private
+    def __topology(self, size: int) -> TapiTopology:
+        return TapiTopology({"network": {
+            "name": "micro-benchmark",
+            "uuid": self.UUID,
+            "pattern": {"smo": 1, "o-cloud": 1, "near-rt-ric": 1, "o-cu": 1,
+                        "o-du": 1, "fronthaul-gateway": 1, "o-ru": size,
+                        "user-equipment": 1}}}, populate=False)
+
+    def __nodes(self, size: int) -> Dict[str, TapiNode]:
+        # one node per level, the fronthaul gateway with 'size' southbound
+        # node-edge-points
+        topology = self.__topology(size)
+        smo = topology.anchor("smo", None, "0")
+        near_rt_ric = topology.anchor("near-rt-ric", smo, "00")
+        o_cu_cp = topology.anchor("o-cu-cp", near_rt_ric, "000")
+        o_du = topology.anchor("o-du", o_cu_cp, "0000")
+        fronthaul_gateway = topology.anchor("fronthaul-gateway", o_du, "00000")
+        o_ru = topology.anchor("o-ru", fronthaul_gateway, "00000" + str(size - 1))
+        return {"smo": smo, "near-rt-ric": near_rt_ric, "o-cu-cp": o_cu_cp,
+                "o-du": o_du, "fronthaul-gateway": fronthaul_gateway,
+                "o-ru": o_ru}
+
+    def __anchor(self, node_type: str, size: int) -> Callable:
+        topology = self.__topology(size)
+        parent = None
+        parent_type = {"near-rt-ric": "smo", "o-du": "o-cu-cp",
+                       "fronthaul-gateway": "o-du", "o-ru": "fronthaul-gateway"}
+        if node_type in parent_type:
+            parent = self.__nodes(size)[parent_type[node_type]]
+        local_id = "0" * (TapiTopology.LEVELS.index(node_type) + 1)
+        return lambda: topology.anchor(node_type, parent, local_id)
+
+    def __node_edge_point(self, size: int) -> Callable:
+        parent = self.__nodes(1)["o-du"].identifier()
+        return lambda: TapiNodeEdgePoint({
+            "parent": parent,
+            "nodeEdgePoint": {
+                "interface": "eth",
+                "cep": [{"protocol": "ofh", "role": "consumer"}
+                        for _ in range(size)]}})
+
+    def __link_config(self, size: int) -> Callable:
+        # O-RU to fronthaul gateway, the consumer node-edge-point is searched
+        # in all southbound node-edge-points
+        nodes = self.__nodes(size)
+        return lambda: LinkConfig(self.UUID, "ofh-netconf", nodes["o-ru"],
+                                  nodes["fronthaul-gateway"])
+
+    def __node_edge_point_by_cep_name(self, size: int) -> Callable:
+        nodes = self.__nodes(size)
+        local_id = nodes["o-ru"].local_id()
+        return lambda: nodes["fronthaul-gateway"].node_edge_point_by_cep_name(
+            "eth-ofh-consumer", local_id)
+
+    def __offset(self, axis: str, size: int) -> Callable:
+        fronthaul_gateway = self.__nodes(size)["fronthaul-gateway"]
+        if axis == "x":
+            return lambda: fronthaul_gateway.x_offset_by_cep_name(
+                "eth-ofh-consumer", size - 1)
+        return lambda: fronthaul_gateway.y_offset_by_cep_name("eth-ofh-consumer")
+
+    def __svg(self, size: int) -> Callable:
+        # the fronthaul gateway with its box and all 'size' southbound
+        # node-edge-points
+        fronthaul_gateway = self.__nodes(size)["fronthaul-gateway"]
+        return lambda: fronthaul_gateway.svg(0, 0)
+
+    def __time(self, operation: Callable) -> float:
+        # doubles the number of calls until the minimal time is reached, the
+        # best of three runs is reported
+        operation()
+        count = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(count):
+                operation()
+            elapsed = time.perf_counter() - start
+            if elapsed >= self.__min_time / 3:
+                break
+            count *= 2
+        best = elapsed
+        for _ in range(2):
+            start = time.perf_counter()
+            for _ in range(count):
+                operation()
+            best = min(best, time.perf_counter() - start)
+        return best / count * 1e9
+
+    def __blocks(self, operation: Callable, count: int = 100) -> float:
+        gc.collect()
+        before = sys.getallocatedblocks()
+        results = [operation() for _ in range(count)]
+        after = sys.getallocatedblocks()
+        del results
+        # the list holding the results is not accounted
+        return max(0, after - before - 1) / count
+
+    def __peak(self, operation: Callable) -> int:
+        gc.collect()
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        operation()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return peak - baseline
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Measures the hot paths of the model in isolation.")
+    parser.add_argument("cases", nargs="*", default=["*"],
+                        help="names or patterns of the cases (default: all)")
+    parser.add_argument("--min-time", type=float, default=0.2,
+                        help="minimal measurement time per case and size in "
+                        "seconds (default: 0.2)")
+    parser.add_argument("--list", action="store_true",
+                        help="list the cases")
+    arguments = parser.parse_args()
+
+    benchmark = MicroBenchmark(arguments.cases, arguments.min_time)
+    if arguments.list:
+        print("\n".join(benchmark.cases().keys()))
+    else:
+        benchmark.run().show()
@@ -0,0 +1,133 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/python
+"""
+Module containing a soak benchmark, which repeats the generation of a TAPI
+topology in one process and checks that the memory stays flat.
+Usage: python -m benchmark.soak [config.json] [--iterations N]
+"""
+import argparse
+import gc
+import sys
+import time
+from typing import Dict, List
+from controller.memory_diagnostics import rss, rss_peak
+from controller.network_generator import TopologyGenerator
+from controller.parameter_validator import ParameterValidator
+from view.network_viewer import NetworkViewer
+
+
+class SoakBenchmark:
+    """
+    Class generating a TAPI topology and its json and svg documents many
+    times in the same process, sampling the resident memory.
+    """
+
+    __configuration: dict = None
+    __iterations: int = 1000
+    __samples: List[Dict[str, float]] = None
+
+    # constructor
+    def __init__(self, configuration: dict, iterations: int = 1000):
+        self.__configuration = configuration
+        self.__iterations = iterations
+        self.__samples = []
+
+    # getters
+    def configuration(self) -> dict:
+        """
+        Getter returning the object configuration
+        :return The configuration
+        """
+        return self.__configuration
+
+    def samples(self) -> List[Dict[str, float]]:
+        """
+        Getter returning the memory samples taken during the run.
+        :return List of samples with iteration, seconds and rss in bytes.
+        """
+        return self.__samples
+
+    def growth(self) -> int:
+        """
+        Getter returning the growth of the resident memory between the end of
+        the warm-up (first tenth of the iterations) and the end of the run.
+        :return Growth in bytes.
+        """
+        warm = [sample for sample in self.__samples
+                if sample["iteration"] >= self.__iterations // 10]
+        if len(warm) < 2:
+            return 0
+        return warm[-1]["rss"] - warm[0]["rss"]
+
+    # methods
+    def run(self) -> 'SoakBenchmark':
+        """
+        Method running the generations and sampling the memory.
+        :return The SoakBenchmark object.
+        """
+        interval = max(1, self.__iterations // 50)
+        start = time.perf_counter()
+        for iteration in range(self.__iterations):
+            viewer = NetworkViewer(
+                TopologyGenerator(self.__configuration).generate())
+            viewer.json_document()
+            viewer.svg_document()
+            del viewer
+            if (iteration + 1) % interval == 0:
+                gc.collect()
+                self.__samples.append({
+                    "iteration": iteration + 1,
+                    "seconds": time.perf_counter() - start,
+                    "rss": rss()
+                })
+        return self
+
+    def show(self):
+        """
+        Method printing the memory samples and the result.
+        """
+        for sample in self.__samples:
+            print("{:>8} {:>9.1f}s {:>9.1f} MiB".format(
+                sample["iteration"], sample["seconds"],
+                sample["rss"] / 1024 / 1024))
+        print("growth after warm-up:",
+              round(self.growth() / 1024 / 1024, 2), "MiB")
+        print("peak rss:", round(rss_peak() / 1024 / 1024, 1), "MiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Repeats the generation in one process and checks, that "
+        "the memory stays flat.")
+    parser.add_argument("configuration", nargs="?", default="config.json",
+                        help="the configuration file (json)")
+    parser.add_argument("--iterations", type=int, default=1000,
+                        help="number of generations (default: 1000)")
+    parser.add_argument("--max-growth", type=float, default=5, metavar="MIB",
+                        help="fail, if the memory grows by more than MIB "
+                        "after the warm-up (default: 5)")
+    arguments = parser.parse_args()
+
+    validator = ParameterValidator([sys.argv[0], arguments.configuration])
+    if not validator.is_valid():
+        sys.exit(str(validator.error_message()))
+
+    benchmark = SoakBenchmark(
+        validator.configuration(), arguments.iterations).run()
+    benchmark.show()
+    if benchmark.growth() > arguments.max_growth * 1024 * 1024:
+        sys.exit("Memory grows by more than " +
+                 str(arguments.max_growth) + " MiB.")
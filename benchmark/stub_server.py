@@ -0,0 +1,181 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+#!/usr/bin/python
+"""
+Module containing a local HTTP stub server receiving the requests of the
+RESTCONF push and similar clients.
+Usage: python -m benchmark.stub_server [--port PORT] [--failure-rate RATE]
+"""
+import argparse
+import asyncio
+import random
+import threading
+from http import HTTPStatus
+from typing import Dict, List, Tuple, Union
+from controller import http_request
+
+
+class StubServer:
+    """
+    Class providing an HTTP/1.1 server with keep-alive, which accepts every
+    request with a fixed status and counts the connections, requests and
+    received bytes. Failures (HTTP 503) and latency can be injected to
+    exercise the retries and the concurrency of a client. The server runs
+    in its own thread with its own event loop.
+    """
+
+    __host: str = "127.0.0.1"
+    __port: int = 0
+    __status: int = 204
+    __failure_rate: float = 0.0
+    __latency: float = 0.0
+    __keep: bool = False
+    __random: random.Random = None
+    __requests: List[Tuple[str, str, Dict[str, str], bytes]] = None
+    __statistics: Dict[str, Union[int, Dict[str, int]]] = None
+    __loop: asyncio.AbstractEventLoop = None
+    __server: asyncio.AbstractServer = None
+    __thread: threading.Thread = None
+
+    # constructor
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 status: int = 204, failure_rate: float = 0.0,
+                 latency: float = 0.0, keep: bool = False, seed: int = 0):
+        self.__host = host
+        self.__port = port
+        self.__status = status
+        self.__failure_rate = failure_rate
+        self.__latency = latency
+        self.__keep = keep
+        self.__random = random.Random(seed)
+        self.__requests = []
+        self.__statistics = {"connections": 0, "requests": 0, "failures": 0,
+                             "bytes": 0, "paths": {}}
+
+    # getters
+    def url(self) -> str:
+        """
+        Getter returning the base url of the running server.
+        :return URL as string, e.g. "http://127.0.0.1:40123".
+        """
+        return "http://" + self.__host + ":" + str(self.__port)
+
+    def requests(self) -> List[Tuple[str, str, Dict[str, str], bytes]]:
+        """
+        Getter returning the received requests, if they are kept.
+        :return List of method, path, headers and body.
+        """
+        return self.__requests
+
+    def statistics(self) -> Dict[str, Union[int, Dict[str, int]]]:
+        """
+        Getter returning the counters of the server.
+        :return Number of connections, requests, injected failures, received
+                body bytes and requests per path.
+        """
+        return self.__statistics
+
+    # methods
+    def start(self) -> 'StubServer':
+        """
+        Method starting the server in a background thread.
+        :return The StubServer object, listening.
+        """
+        started = threading.Event()
+        self.__loop = asyncio.new_event_loop()
+
+        def run():
+            asyncio.set_event_loop(self.__loop)
+            self.__server = self.__loop.run_until_complete(
+                asyncio.start_server(self.__handle, self.__host, self.__port))
+            self.__port = self.__server.sockets[0].getsockname()[1]
+            started.set()
+            self.__loop.run_forever()
+            self.__server.close()
+            self.__loop.run_until_complete(self.__server.wait_closed())
+            self.__loop.close()
+
+        self.__thread = threading.Thread(target=run, daemon=True)
+        self.__thread.start()
+        started.wait()
+        return self
+
+    def stop(self):
+        """
+        Method stopping the server.
+        """
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join()
+
+    # private
+    async def __handle(self, reader: asyncio.StreamReader,
+                       writer: asyncio.StreamWriter):
+        self.__statistics["connections"] += 1
+        try:
+            keep_alive = True
+            while keep_alive:
+                request = await http_request.read(reader)
+                if request is None:
+                    break
+                method, path, headers, body, keep_alive = request
+
+                self.__statistics["requests"] += 1
+                self.__statistics["bytes"] += len(body)
+                paths = self.__statistics["paths"]
+                paths[path] = paths.get(path, 0) + 1
+                if self.__latency > 0:
+                    await asyncio.sleep(self.__latency)
+                status = self.__status
+                if self.__random.random() < self.__failure_rate:
+                    status = 503
+                    self.__statistics["failures"] += 1
+                elif self.__keep:
+                    self.__requests.append((method, path, headers, body))
+
+                writer.write("\r\n".join([
+                    " ".join(["HTTP/1.1", str(status), HTTPStatus(status).phrase]),
+                    "Content-Length: 0",
+                    "Connection: " + ("keep-alive" if keep_alive else "close"),
+                    "", ""]).encode("latin-1"))
+                await writer.drain()
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Runs an HTTP stub server accepting all requests.")
+    parser.add_argument("--port", type=int, default=8181,
+                        help="TCP port (default: 8181)")
+    parser.add_argument("--status", type=int, default=204,
+                        help="HTTP status of the responses (default: 204)")
+    parser.add_argument("--failure-rate", type=float, default=0.0,
+                        help="share of requests answered with HTTP 503")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="delay of each response in seconds")
+    arguments = parser.parse_args()
+
+    stub = StubServer(port=arguments.port, status=arguments.status,
+                      failure_rate=arguments.failure_rate,
+                      latency=arguments.latency).start()
+    print("Serving on " + stub.url())
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        stub.stop()
+        print(stub.statistics())
@@ -0,0 +1,275 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/python
+"""
+Module containing the end-to-end benchmark suite, which generates a ladder of
+patterns and compares the results with a baseline.
+Usage: python -m benchmark.suite [--up-to STEP] [--save-baseline]
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+from controller.memory_diagnostics import rss_peak
+from controller.size_estimator import SizeEstimator
+
+
+class BenchmarkSuite:
+    """
+    Class measuring the startup of the generator (a dry run of the command
+    line interface) and running TopologyGenerator.generate, NetworkViewer.save
+    and NetworkViewer.svg for a ladder of patterns from about hundred up to more
+    than a million TAPI objects (nodes, node-edge-points,
+    connection-edge-points and links).
+    Each step runs in a new process, so that the peak memory of a step is not
+    influenced by the previous steps. Of several repetitions the fastest is
+    kept.
+    """
+
+    LADDER: Dict[str, Dict[str, int]] = {
+        "tiny": {"smo": 1, "o-cloud": 1, "near-rt-ric": 1, "o-cu": 1, "o-du": 1,
+                 "fronthaul-gateway": 1, "o-ru": 1, "user-equipment": 1},
+        "small": {"smo": 1, "o-cloud": 1, "near-rt-ric": 1, "o-cu": 2, "o-du": 2,
+                  "fronthaul-gateway": 1, "o-ru": 2, "user-equipment": 2},
+        "medium": {"smo": 1, "o-cloud": 2, "near-rt-ric": 2, "o-cu": 2, "o-du": 3,
+                   "fronthaul-gateway": 1, "o-ru": 3, "user-equipment": 3},
+        "large": {"smo": 1, "o-cloud": 2, "near-rt-ric": 2, "o-cu": 4, "o-du": 4,
+                  "fronthaul-gateway": 2, "o-ru": 4, "user-equipment": 4},
+        "xlarge": {"smo": 1, "o-cloud": 2, "near-rt-ric": 4, "o-cu": 4, "o-du": 8,
+                   "fronthaul-gateway": 2, "o-ru": 8, "user-equipment": 4},
+        "xxlarge": {"smo": 1, "o-cloud": 2, "near-rt-ric": 4, "o-cu": 8, "o-du": 8,
+                    "fronthaul-gateway": 4, "o-ru": 8, "user-equipment": 8},
+        "huge": {"smo": 1, "o-cloud": 8, "near-rt-ric": 8, "o-cu": 8, "o-du": 8,
+                 "fronthaul-gateway": 8, "o-ru": 8, "user-equipment": 8}
+    }
+    OPERATIONS: List[str] = ["startup", "generate", "save", "svg"]
+    # slowdowns below this absolute difference are considered as noise
+    NOISE_SECONDS: float = 0.005
+    BASELINE: str = os.path.join(os.path.dirname(
+        os.path.realpath(__file__)), "baseline.json")
+    GENERATOR: str = os.path.join(os.path.dirname(os.path.dirname(
+        os.path.realpath(__file__))), "tapi_topology_generator.py")
+
+    __steps: List[str] = None
+    __repeat: int = 5
+    __results: Dict[str, Dict] = None
+
+    # constructor
+    def __init__(self, steps: List[str], repeat: int = 5):
+        self.__steps = steps
+        self.__repeat = repeat
+        self.__results = {}
+
+    # getters
+    def results(self) -> Dict[str, Dict]:
+        """
+        Getter returning the results of the run.
+        :return Elements and per operation time, peak rss and output size
+                by step name.
+        """
+        return self.__results
+
+    @staticmethod
+    def configuration(step: str) -> dict:
+        """
+        Getter returning the configuration of a ladder step.
+        :param step: The name of the step, e.g. "medium".
+        :return The configuration of the step.
+        """
+        return {"network": {
+            "name": "benchmark-" + step,
+            "uuid": "a0b1c2d3-e4f5-4a6b-8c7d-9e0f1a2b3c4d",
+            "pattern": BenchmarkSuite.LADDER[step]}}
+
+    # methods
+    def run(self) -> 'BenchmarkSuite':
+        """
+        Method running all steps in separate processes.
+        :return The BenchmarkSuite object.
+        """
+        for step in self.__steps:
+            runs = [self.__run_process(step) for _ in range(self.__repeat)]
+            result = runs[0]
+            for operation in self.OPERATIONS:
+                result[operation] = min(
+                    [run[operation] for run in runs],
+                    key=lambda measurement: measurement["seconds"])
+            self.__results[step] = result
+            print(step, "done:", ", ".join([
+                operation + " {:.3f}s".format(result[operation]["seconds"])
+                for operation in self.OPERATIONS]), file=sys.stderr)
+        return self
+
+    def save_baseline(self, filename: str = BASELINE):
+        """
+        Method saving the results as baseline.
+        :param filename: A valid path to a file on the system.
+        :type filename: string
+        """
+        baseline = {}
+        if os.path.isfile(filename):
+            with open(filename, encoding='utf-8') as content:
+                baseline = json.load(content)
+        baseline.update(self.__results)
+        with open(filename, "w", encoding='utf-8') as json_file:
+            json.dump(baseline, json_file, ensure_ascii=False, indent=2)
+        print("File '" + filename + "' saved!")
+
+    def report(self, threshold: float, filename: str = BASELINE) -> bool:
+        """
+        Method printing the results compared with the baseline.
+        :param threshold: Relative slowdown, which is flagged as regression.
+        :param filename: The baseline file.
+        :return True, if no regression was found.
+        """
+        baseline = {}
+        if os.path.isfile(filename):
+            with open(filename, encoding='utf-8') as content:
+                baseline = json.load(content)
+
+        passed = True
+        row = "{:<8} {:>9} {:<9} {:>10} {:>10} {:>8} {:>10} {:>12}  {}"
+        print(row.format("step", "elements", "operation", "seconds",
+                         "baseline", "ratio", "peak rss", "bytes", "status"))
+        for step, result in self.__results.items():
+            for operation in self.OPERATIONS:
+                current = result[operation]
+                previous = baseline.get(step, {}).get(operation)
+                ratio, status = "-", "no baseline"
+                if previous is not None:
+                    ratio = current["seconds"] / previous["seconds"]
+                    status = "ok"
+                    if ratio > 1 + threshold and current["seconds"] - \
+                            previous["seconds"] > self.NOISE_SECONDS:
+                        status = "REGRESSION"
+                        passed = False
+                    ratio = "{:.2f}".format(ratio)
+                print(row.format(
+                    step, result["elements"], operation,
+                    "{:.3f}".format(current["seconds"]),
+                    "{:.3f}".format(previous["seconds"]) if previous else "-",
+                    ratio, str(round(current["rss-peak"] / 1024 / 1024)) + " MiB"
+                    if "rss-peak" in current else "-",
+                    current.get("bytes", "-"), status))
+        return passed
+
+    @staticmethod
+    def measure(step: str, folder: str) -> Dict:
+        """
+        Method measuring the operations of a step in the current process.
+        :param step: The name of the step.
+        :param folder: The folder for the output files.
+        :return Elements and per operation time, peak rss and output size.
+        """
+        # imported here, so that the suite process does not load the model
+        # pylint: disable=import-outside-toplevel,unused-import
+        from controller.network_generator import TopologyGenerator
+        from view.network_viewer import NetworkViewer
+        # lxml and the svg shapes are loaded on demand, their import belongs
+        # to the startup and not to the svg operation
+        from model.python.svg import fronthaul_gateway, near_tr_ric, \
+            node_edge_point, o_cloud, o_cu_cp, o_cu_up, o_du
+
+        configuration = BenchmarkSuite.configuration(step)
+        result = {"elements": sum(
+            SizeEstimator(configuration).counts().values())}
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            network = TopologyGenerator(configuration).generate()
+            result["generate"] = BenchmarkSuite.__measurement(start)
+
+            viewer = NetworkViewer(network)
+            filename = os.path.join(folder, step + ".json")
+            start = time.perf_counter()
+            viewer.json().save(filename)
+            result["save"] = BenchmarkSuite.__measurement(start, filename)
+
+            filename = os.path.join(folder, step + ".svg")
+            start = time.perf_counter()
+            viewer.svg(filename)
+            result["svg"] = BenchmarkSuite.__measurement(start, filename)
+        return result
+
+    # private
+    @staticmethod
+    def __measurement(start: float, filename: str = None) -> Dict:
+        result = {
+            "seconds": time.perf_counter() - start,
+            "rss-peak": rss_peak()
+        }
+        if filename is not None:
+            result["bytes"] = os.path.getsize(filename)
+        return result
+
+    def __run_process(self, step: str) -> Dict:
+        with tempfile.TemporaryDirectory() as folder:
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmark.suite",
+                 "--step", step, "--folder", folder],
+                check=True, capture_output=True, text=True).stdout
+            result = json.loads(output)
+            result["startup"] = self.__startup(step, folder)
+        return result
+
+    def __startup(self, step: str, folder: str) -> Dict:
+        # wall time of a dry run of the command line interface, from the
+        # process start to its exit; the configuration is remembered by an
+        # untimed run, so that the startup is measured without jsonschema
+        filename = os.path.join(folder, step + ".config.json")
+        with open(filename, "w", encoding='utf-8') as json_file:
+            json.dump(self.configuration(step), json_file)
+        command = [sys.executable, self.GENERATOR, filename, "--dry-run",
+                   "--remember"]
+        subprocess.run(command, check=True, capture_output=True)
+        start = time.perf_counter()
+        subprocess.run(command, check=True, capture_output=True)
+        return {"seconds": time.perf_counter() - start}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Runs the end-to-end benchmarks on a ladder of patterns.")
+    parser.add_argument("--up-to", default="large",
+                        choices=list(BenchmarkSuite.LADDER.keys()),
+                        help="the largest step of the ladder (default: large)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="runs per step, the fastest is kept (default: 5)")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="relative slowdown flagged as regression "
+                        "(default: 0.2)")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="save the results as baseline")
+    parser.add_argument("--step", help=argparse.SUPPRESS)
+    parser.add_argument("--folder", help=argparse.SUPPRESS)
+    arguments = parser.parse_args()
+
+    if arguments.step:
+        print(json.dumps(BenchmarkSuite.measure(arguments.step, arguments.folder)))
+        sys.exit()
+
+    ladder = list(BenchmarkSuite.LADDER.keys())
+    suite = BenchmarkSuite(ladder[:ladder.index(arguments.up_to) + 1],
+                           arguments.repeat).run()
+    if arguments.save_baseline:
+        suite.save_baseline()
+    if not suite.report(arguments.threshold):
+        sys.exit("Regression of more than " +
+                 str(round(arguments.threshold * 100)) + "% found.")
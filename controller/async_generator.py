@@ -0,0 +1,175 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+#!/usr/bin/python
+"""
+Module containing a class to use the generator in asyncio applications.
+"""
+import asyncio
+import concurrent.futures
+import threading
+import time
+from typing import AsyncIterator, Dict, List, Tuple, Union
+from controller.network_generator import TopologyGenerator
+from model.python.tapi_common_context import TapiCommonContext
+from model.python.top import Top
+
+
+class GenerationCancelled(Exception):
+    """
+    Exception raised in the generation thread to stop a cancelled generation.
+    """
+
+
+class AsyncTopologyGenerator:
+    """
+    Class generating a TAPI topology in an executor thread and yielding the
+    json objects of the nodes and links in batches to an asyncio consumer,
+    while the generation continues.
+    The batches are passed through a bounded queue: if the consumer is
+    slower than the generation, the generation waits (backpressure). If the
+    consumer stops the iteration or its task is cancelled, the generation is
+    stopped.
+    """
+
+    __configuration: dict = None
+    __batch_size: int = 64
+    __queue_size: int = 8
+    __executor: concurrent.futures.Executor = None
+    __network: TapiCommonContext = None
+    __queue: asyncio.Queue = None
+    __cancelled: threading.Event = None
+    __batch: List[Tuple[str, Dict]] = None
+    __statistics: Dict[str, Union[int, float]] = None
+
+    # constructor
+    def __init__(self, configuration: dict, batch_size: int = 64,
+                 queue_size: int = 8,
+                 executor: concurrent.futures.ThreadPoolExecutor = None):
+        self.__configuration = configuration
+        self.__batch_size = batch_size
+        self.__queue_size = queue_size
+        self.__executor = executor
+
+    # getters
+    def network(self) -> TapiCommonContext:
+        """
+        Getter returning the generated network after a complete iteration.
+        :return The TapiCommonContext object or None.
+        """
+        return self.__network
+
+    def statistics(self) -> Dict[str, Union[int, float]]:
+        """
+        Getter returning the statistics of the last iteration.
+        :return Number of nodes, links and batches and the seconds the
+                generation waited for the consumer.
+        """
+        return self.__statistics
+
+    # methods
+    async def generate(self) -> TapiCommonContext:
+        """
+        Method generating the network in the executor without iteration.
+        :return The TapiCommonContext object.
+        """
+        loop = asyncio.get_running_loop()
+        self.__network = await loop.run_in_executor(
+            self.__executor, TopologyGenerator(self.__configuration).generate)
+        return self.__network
+
+    async def batches(self) -> AsyncIterator[List[Tuple[str, Dict]]]:
+        """
+        Method yielding the nodes and links in the order of their generation.
+        :return Async iterator of batches of "node" or "link" and the json
+                object.
+        """
+        loop = asyncio.get_running_loop()
+        self.__network = None
+        self.__queue = asyncio.Queue(maxsize=self.__queue_size)
+        self.__cancelled = threading.Event()
+        self.__batch = []
+        self.__statistics = {"node": 0, "link": 0, "batch": 0,
+                             "backpressure": 0.0}
+        future = loop.run_in_executor(self.__executor, self.__generate, loop)
+        try:
+            while True:
+                batch = await self.__queue.get()
+                if batch is None:
+                    break
+                yield batch
+            self.__network = await future
+        finally:
+            if not future.done():
+                self.__cancelled.set()
+                # a generation waiting for space in the queue continues and
+                # notices the cancellation
+                while not future.done():
+                    while not self.__queue.empty():
+                        self.__queue.get_nowait()
+                    await asyncio.wait([future], timeout=0.05)
+                if future.exception() is not None and \
+                        not isinstance(future.exception(), GenerationCancelled):
+                    raise future.exception()
+
+    async def __aiter__(self) -> AsyncIterator[Tuple[str, Dict]]:
+        """
+        Method yielding the nodes and links one by one.
+        :return Async iterator of "node" or "link" and the json object.
+        """
+        async for batch in self.batches():
+            for item in batch:
+                yield item
+
+    # private
+    def __generate(self, loop: asyncio.AbstractEventLoop) -> TapiCommonContext:
+        # executed in the executor thread
+        try:
+            network = TopologyGenerator(self.__configuration).generate(
+                lambda kind, item: self.__listen(kind, item, loop))
+            if len(self.__batch) > 0:
+                self.__put(self.__batch, loop)
+        except GenerationCancelled:
+            return None
+        finally:
+            if not self.__cancelled.is_set():
+                self.__put(None, loop)
+        return network
+
+    def __listen(self, kind: str, item: Top, loop: asyncio.AbstractEventLoop):
+        if self.__cancelled.is_set():
+            raise GenerationCancelled()
+        if kind not in ["node", "link"]:
+            return
+        self.__batch.append((kind, item.json()))
+        self.__statistics[kind] += 1
+        if len(self.__batch) >= self.__batch_size:
+            self.__put(self.__batch, loop)
+            self.__batch = []
+
+    def __put(self, batch: List[Tuple[str, Dict]], loop: asyncio.AbstractEventLoop):
+        start = time.perf_counter()
+        put = asyncio.run_coroutine_threadsafe(self.__queue.put(batch), loop)
+        while True:
+            try:
+                put.result(timeout=0.1)
+                break
+            except concurrent.futures.TimeoutError:
+                if self.__cancelled.is_set():
+                    put.cancel()
+                    raise GenerationCancelled() from None
+        if batch is not None:
+            self.__statistics["batch"] += 1
+        self.__statistics["backpressure"] += time.perf_counter() - start
@@ -0,0 +1,206 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/python
+"""
+Module containing a class generating TAPI topologies for many configurations.
+"""
+import glob
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple, Union
+from controller.network_generator import TopologyGenerator
+from controller.parameter_validator import ParameterValidator
+from controller.topology_digest import TopologyDigest
+from view.output_pipeline import OutputPipeline
+
+
+def network_name(configuration: dict) -> str:
+    """
+    Function returning the name of the output files of a configuration.
+    :param configuration: A valid configuration.
+    :return The network name or "network" if no name is configured.
+    """
+    return configuration['network'].get('name') or "network"
+
+
+def generate(configuration: dict, folder: str) -> Dict[str, float]:
+    """
+    Function generating a TAPI topology and saving its json, svg and metadata
+    files, executed by the worker processes.
+    :param configuration: A valid configuration.
+    :param folder: The folder for the output files.
+    :return Number of nodes and links, generation and write time in seconds.
+    """
+    start = time.perf_counter()
+    network = TopologyGenerator(configuration).generate()
+    # the svg layout requires the ancestors of a subtree
+    pipeline = OutputPipeline(network, ["json"] if "subtree" in
+                              configuration['network'] else ["json", "svg"])
+    documents: Dict[str, bytes] = {
+        pipeline.sink(output_format).EXTENSION: pipeline.document(output_format)
+        for output_format in pipeline.formats()}
+    documents[".metadata.json"] = json.dumps(
+        TopologyDigest(network, pipeline.json()).metadata(),
+        ensure_ascii=False, indent=2).encode("utf-8")
+    generated = time.perf_counter()
+
+    name = network_name(configuration)
+    for extension, document in documents.items():
+        with open(os.path.join(folder, name + extension), "wb") as file:
+            file.write(document)
+
+    topology = network.topology_context().topologies()[0].data()
+    return {
+        "node": len(topology["node"]),
+        "link": len(topology["link"]),
+        "generate": generated - start,
+        "write": time.perf_counter() - generated
+    }
+
+
+class BatchGenerator:
+    """
+    Class generating the TAPI topologies of many configurations in one
+    invocation. The configurations are read from a directory, a glob pattern
+    or a JSONL file (one configuration per line). Each configuration is
+    validated once, the topologies are generated and written by a pool of
+    worker processes.
+    """
+
+    __source: str = None
+    __folder: str = "output"
+    __workers: int = None
+    __results: List[Dict] = None
+
+    # constructor
+    def __init__(self, source: str, folder: str = "output", workers: int = None):
+        self.__source = source
+        self.__folder = folder
+        self.__workers = workers
+        self.__results = []
+
+    # getters
+    def source(self) -> str:
+        """
+        Getter returning the source of the configurations.
+        :return Directory, glob pattern or JSONL file.
+        """
+        return self.__source
+
+    def configurations(self) -> List[Tuple[str, Union[dict, ValueError]]]:
+        """
+        Getter reading the configurations of the source.
+        :return List of labels (file or file:line) and configurations, or
+                the decode error of a malformed line or file.
+        """
+        result: List[Tuple[str, Union[dict, ValueError]]] = []
+        if os.path.isfile(self.__source) and self.__source.endswith(".jsonl"):
+            with open(self.__source, encoding="utf-8") as content:
+                for number, line in enumerate(content, start=1):
+                    if line.strip():
+                        result.append((self.__source + ":" + str(number),
+                                       self.__decode(line)))
+            return result
+
+        pattern = self.__source
+        if os.path.isdir(self.__source):
+            pattern = os.path.join(self.__source, "*.json")
+        for filename in sorted(glob.glob(pattern)):
+            with open(filename, encoding="utf-8") as content:
+                result.append((filename, self.__decode(content.read())))
+        return result
+
+    def results(self) -> List[Dict]:
+        """
+        Getter returning the results of the generation.
+        :return List of results per configuration in source order.
+        """
+        return self.__results
+
+    # methods
+    def generate(self) -> 'BatchGenerator':
+        """
+        Method validating all configurations and generating the valid ones
+        in parallel.
+        :return The BatchGenerator object.
+        """
+        os.makedirs(self.__folder, exist_ok=True)
+        self.__results = []
+        names = set()
+        for label, configuration in self.configurations():
+            result = {"configuration": label, "status": "ok"}
+            if isinstance(configuration, ValueError):
+                result["status"] = "invalid: " + str(configuration)
+                self.__results.append(result)
+                continue
+            validator = ParameterValidator([label], configuration)
+            if not validator.is_valid():
+                result["status"] = "invalid: " + \
+                    str(validator.error_message().message)
+            elif network_name(configuration) in names:
+                result["status"] = "duplicate network name"
+            else:
+                names.add(network_name(configuration))
+                # the model requires the name of the network
+                configuration['network']['name'] = network_name(configuration)
+                result["network"] = configuration
+            self.__results.append(result)
+
+        # forked workers share the imported modules and the compiled schema
+        with ProcessPoolExecutor(max_workers=self.__workers) as executor:
+            futures = {}
+            for index, result in enumerate(self.__results):
+                if result["status"] == "ok":
+                    futures[index] = executor.submit(
+                        generate, result.pop("network"), self.__folder)
+            for index, future in futures.items():
+                try:
+                    self.__results[index].update(future.result())
+                except Exception as error:  # pylint: disable=broad-except
+                    self.__results[index]["status"] = "failed: " + repr(error)
+        return self
+
+    def show(self):
+        """
+        Method printing the results as table.
+        """
+        width = max([len("configuration")] +
+                    [len(result["configuration"]) for result in self.__results])
+        row = "{:<" + str(width) + "} {:>6} {:>6} {:>10} {:>8}  {}"
+        print(row.format("configuration", "nodes", "links",
+                         "generate", "write", "status"))
+        for result in self.__results:
+            if result["status"] == "ok":
+                print(row.format(
+                    result["configuration"], result["node"], result["link"],
+                    "{:.3f}s".format(result["generate"]),
+                    "{:.3f}s".format(result["write"]), result["status"]))
+            else:
+                print(row.format(result["configuration"], "-", "-", "-", "-",
+                                 result["status"]))
+        succeeded = [result for result in self.__results
+                     if result["status"] == "ok"]
+        print(len(succeeded), "of", len(self.__results),
+              "configurations generated.")
+
+    # private
+    @staticmethod
+    def __decode(content: str) -> Union[dict, ValueError]:
+        try:
+            return json.loads(content)
+        except ValueError as error:
+            return error
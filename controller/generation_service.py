@@ -0,0 +1,196 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/python
+"""
+Module containing a local HTTP service generating TAPI topologies.
+"""
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from http import HTTPStatus
+from typing import Dict, Tuple
+from controller import http_request
+from controller.network_generator import TopologyGenerator
+from controller.parameter_validator import ParameterValidator
+from view.output_pipeline import OutputPipeline
+
+
+def generate(configuration: dict, output_format: str) -> bytes:
+    """
+    Function generating a TAPI topology, executed by the worker processes.
+    :param configuration: A valid configuration.
+    :param output_format: The requested format, "json" or "svg".
+    :return The TAPI topology as document.
+    """
+    network = TopologyGenerator(configuration).generate()
+    return OutputPipeline(network, [output_format]).document(output_format)
+
+
+class GenerationService:
+    """
+    Class providing a long-running HTTP service generating TAPI topologies.
+    A configuration is posted to "/topology.json" or "/topology.svg". It is
+    validated against the compiled configuration schema and the topology is
+    generated in a pool of worker processes. A response is built as complete
+    document by the worker and then sent with chunked transfer encoding, so
+    the service holds the whole document in memory. Identical requests are
+    served from an in-memory LRU cache.
+    """
+
+    CHUNK_SIZE: int = 64 * 1024
+    CONTENT_TYPES: Dict[str, str] = {
+        "json": "application/json",
+        "svg": "image/svg+xml"
+    }
+
+    __host: str = "127.0.0.1"
+    __port: int = 8080
+    __workers: int = None
+    __cache_size: int = 32
+    __cache: OrderedDict = None
+    __pending: Dict[str, asyncio.Future] = None
+    __executor: ProcessPoolExecutor = None
+
+    # constructor
+    def __init__(self, host: str = "127.0.0.1", port: int = 8080,
+                 workers: int = None, cache_size: int = 32):
+        self.__host = host
+        self.__port = port
+        self.__workers = workers
+        self.__cache_size = cache_size
+        self.__cache = OrderedDict()
+        self.__pending = {}
+
+    # getters
+    def host(self) -> str:
+        """
+        Getter returning the host address the service listens on.
+        :return Host address as string.
+        """
+        return self.__host
+
+    def port(self) -> int:
+        """
+        Getter returning the TCP port the service listens on.
+        :return TCP port.
+        """
+        return self.__port
+
+    # methods
+    def run(self):
+        """
+        Method running the service until it is interrupted.
+        """
+        # compile the configuration schema once at start-up, the schema
+        # cache is read and written before the event loop runs
+        ParameterValidator(["service"], {})
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            print("Service stopped.")
+
+    async def serve(self):
+        """
+        Coroutine serving HTTP requests until it is cancelled.
+        """
+        with ProcessPoolExecutor(max_workers=self.__workers) as executor:
+            self.__executor = executor
+            server = await asyncio.start_server(
+                self.__handle, self.__host, self.__port)
+            print("Serving on http://" + self.__host + ":" + str(self.__port))
+            async with server:
+                await server.serve_forever()
+
+    # private
+    async def __handle(self, reader: asyncio.StreamReader,
+                       writer: asyncio.StreamWriter):
+        try:
+            keep_alive = True
+            while keep_alive:
+                request = await http_request.read(reader)
+                if request is None:
+                    break
+                method, path, _, body, keep_alive = request
+                status, content_type, content, cached = await self.__respond(
+                    method, path, body)
+                await self.__write(writer, status, content_type, content,
+                                   cached, keep_alive)
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def __respond(self, method: str, path: str,
+                        body: bytes) -> Tuple[int, str, bytes, bool]:
+        output_format = path.split("?")[0].rpartition(".")[2]
+        if path.split("?")[0] not in ["/topology.json", "/topology.svg"]:
+            return 404, "text/plain", b"Use /topology.json or /topology.svg", False
+        if method != "POST":
+            return 405, "text/plain", b"Use POST with a configuration", False
+
+        try:
+            configuration = json.loads(body)
+        except ValueError as error:
+            return 400, "text/plain", str(error).encode("utf-8"), False
+        validator = ParameterValidator(["service"], configuration)
+        if not validator.is_valid():
+            return 400, "text/plain", \
+                str(validator.error_message()).encode("utf-8"), False
+
+        key = hashlib.sha256("".join([
+            output_format,
+            json.dumps(configuration, sort_keys=True, separators=(",", ":"))
+        ]).encode("utf-8")).hexdigest()
+
+        if key in self.__cache:
+            self.__cache.move_to_end(key)
+            return 200, self.CONTENT_TYPES[output_format], self.__cache[key], True
+
+        # identical requests in progress share the same generation
+        if key not in self.__pending:
+            loop = asyncio.get_running_loop()
+            self.__pending[key] = loop.run_in_executor(
+                self.__executor, generate, configuration, output_format)
+        try:
+            content = await self.__pending[key]
+        except Exception as error:  # pylint: disable=broad-except
+            # the schema does not cover all inputs of the generation
+            return 500, "text/plain", repr(error).encode("utf-8"), False
+        finally:
+            self.__pending.pop(key, None)
+
+        self.__cache[key] = content
+        while len(self.__cache) > self.__cache_size:
+            self.__cache.popitem(last=False)
+        return 200, self.CONTENT_TYPES[output_format], content, False
+
+    async def __write(self, writer: asyncio.StreamWriter, status: int,
+                      content_type: str, content: bytes, cached: bool,
+                      keep_alive: bool):
+        writer.write("\r\n".join([
+            " ".join(["HTTP/1.1", str(status), HTTPStatus(status).phrase]),
+            "Content-Type: " + content_type,
+            "Transfer-Encoding: chunked",
+            "X-Cache: " + ("HIT" if cached else "MISS"),
+            "Connection: " + ("keep-alive" if keep_alive else "close"),
+            "", ""]).encode("latin-1"))
+        for start in range(0, len(content), self.CHUNK_SIZE):
+            chunk = content[start:start + self.CHUNK_SIZE]
+            writer.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
@@ -0,0 +1,232 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+#!/usr/bin/python
+"""
+Module containing a spatial index of the nodes of a TAPI topology.
+"""
+import math
+from typing import List, Tuple
+import numpy
+from model.python.tapi_node import TapiNode
+
+
+class GeoIndex:
+    """
+    Class providing nearest and within-radius queries on the geolocations of
+    TAPI nodes. The locations are projected to meters (equirectangular, for
+    areas up to some hundred kilometers) and sorted into a uniform grid,
+    stored as compressed sparse rows: the node indexes sorted by cell and the
+    offset of each cell. The nearest node of many points is searched for all
+    points at once in the 3x3 cells around each point, then for the points
+    without a node closer than the grid outside of the searched cells in a
+    square of doubled size, and so on. A point outside of the grid is
+    searched around the nearest cell of the grid.
+    """
+
+    METERS_PER_DEGREE: float = 111320.0
+
+    __nodes: List[TapiNode] = None
+    __scale: float = 1.0
+    __origin: numpy.ndarray = None
+    __cell_size: float = 1.0
+    __shape: Tuple[int, int] = None
+    __order: numpy.ndarray = None
+    __points: numpy.ndarray = None
+    __offsets: numpy.ndarray = None
+
+    # constructor
+    def __init__(self, nodes: List[TapiNode], cell_size: float = None):
+        self.__nodes = nodes
+        locations = numpy.array([
+            [float(node.data()["o-ran-sc-topology:geolocation"]["longitude"]),
+             float(node.data()["o-ran-sc-topology:geolocation"]["latitude"])]
+            for node in nodes], dtype=float).reshape(len(nodes), 2)
+        self.__scale = math.cos(math.radians(
+            locations[:, 1].mean())) if len(nodes) > 0 else 1.0
+        points = self.__project(locations[:, 0], locations[:, 1])
+        self.__origin = points.min(axis=0) if len(nodes) > 0 else numpy.zeros(2)
+        extent = points.max(axis=0) - self.__origin if len(nodes) > 0 \
+            else numpy.zeros(2)
+        if cell_size is None:
+            # about four nodes per cell
+            cell_size = 2 * math.sqrt(max(extent[0] * extent[1], 1.0) /
+                                      max(len(nodes), 1))
+        self.__cell_size = max(cell_size, 1.0)
+        cells = numpy.floor((points - self.__origin) /
+                            self.__cell_size).astype(numpy.int64)
+        self.__shape = tuple(int(value) for value in
+                             (extent // self.__cell_size + 1))
+        linear = cells[:, 0] * self.__shape[1] + cells[:, 1]
+        self.__order = numpy.argsort(linear, kind="stable")
+        self.__points = points[self.__order]
+        self.__offsets = numpy.searchsorted(
+            linear[self.__order], numpy.arange(self.__shape[0] * self.__shape[1] + 1))
+
+    # getters
+    def nodes(self) -> List[TapiNode]:
+        """
+        Getter returning the indexed nodes, the queries return indexes of
+        this list.
+        :return List of TAPI Nodes.
+        """
+        return self.__nodes
+
+    def cell_size(self) -> float:
+        """
+        Getter returning the edge length of the grid cells.
+        :return Cell size in meters.
+        """
+        return self.__cell_size
+
+    # methods
+    def within(self, longitude: float, latitude: float,
+               radius: float) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Method returning the nodes within a radius around a location.
+        :param longitude: Longitude in degrees.
+        :param latitude: Latitude in degrees.
+        :param radius: Radius in meters.
+        :return Indexes of the nodes and their distances in meters.
+        """
+        point = self.__project(numpy.array([longitude]), numpy.array([latitude]))[0]
+        return self.__within(point, radius)
+
+    def nearest(self, longitudes: numpy.ndarray,
+                latitudes: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Method returning the nearest node of each location.
+        :param longitudes: Longitudes in degrees.
+        :param latitudes: Latitudes in degrees.
+        :return Indexes of the nodes (-1 without nodes) and the distances in
+                meters.
+        """
+        points = self.__project(numpy.asarray(longitudes, dtype=float),
+                                numpy.asarray(latitudes, dtype=float))
+        best = numpy.full(len(points), numpy.inf)
+        result = numpy.full(len(points), -1, dtype=numpy.int64)
+        if len(self.__nodes) == 0:
+            return result, best
+        # cells of points outside the grid are moved to its border
+        cells = numpy.clip(numpy.floor((points - self.__origin) /
+                                       self.__cell_size).astype(numpy.int64),
+                           0, numpy.array(self.__shape) - 1)
+        pending = numpy.arange(len(points))
+        searched = -1
+        reach = 1
+        while len(pending) > 0:
+            for delta_x in range(-reach, reach + 1):
+                for delta_y in range(-reach, reach + 1):
+                    if max(abs(delta_x), abs(delta_y)) > searched:
+                        self.__search(points, cells, pending, delta_x, delta_y,
+                                      best, result)
+            if reach >= max(self.__shape):
+                break
+            # a node in an unsearched cell is not closer than the grid
+            # outside of the searched cells
+            pending = pending[best[pending] > self.__bound(
+                points[pending], cells[pending], reach)]
+            searched = reach
+            reach *= 2
+        result = self.__order[result]
+        return result, best
+
+    # private
+    def __project(self, longitudes: numpy.ndarray,
+                  latitudes: numpy.ndarray) -> numpy.ndarray:
+        return numpy.column_stack([
+            longitudes * self.METERS_PER_DEGREE * self.__scale,
+            latitudes * self.METERS_PER_DEGREE])
+
+    def __bound(self, points: numpy.ndarray, cells: numpy.ndarray,
+                reach: int) -> numpy.ndarray:
+        # distance of each point to the parts of the grid before and after
+        # the searched square of cells on each axis
+        grid_low = self.__origin
+        grid_high = self.__origin + numpy.array(self.__shape) * self.__cell_size
+        low = self.__origin + (cells - reach) * self.__cell_size
+        high = self.__origin + (cells + reach + 1) * self.__cell_size
+        result = numpy.full(len(points), numpy.inf)
+        for axis, other in [(0, 1), (1, 0)]:
+            across = numpy.maximum(numpy.maximum(
+                grid_low[other] - points[:, other],
+                points[:, other] - grid_high[other]), 0)
+            before = numpy.maximum(numpy.maximum(
+                grid_low[axis] - points[:, axis],
+                points[:, axis] - low[:, axis]), 0)
+            after = numpy.maximum(numpy.maximum(
+                high[:, axis] - points[:, axis],
+                points[:, axis] - grid_high[axis]), 0)
+            result = numpy.minimum(result, numpy.where(
+                low[:, axis] > grid_low[axis],
+                numpy.hypot(before, across), numpy.inf))
+            result = numpy.minimum(result, numpy.where(
+                high[:, axis] < grid_high[axis],
+                numpy.hypot(after, across), numpy.inf))
+        return result
+
+    def __search(self, points: numpy.ndarray, cells: numpy.ndarray,
+                 queries: numpy.ndarray, delta_x: int, delta_y: int,
+                 best: numpy.ndarray, result: numpy.ndarray):
+        # updates the nearest node of the queries by the nodes of the cell at
+        # an offset from the cell of each query
+        cell_x = cells[queries, 0] + delta_x
+        cell_y = cells[queries, 1] + delta_y
+        inside = (cell_x >= 0) & (cell_x < self.__shape[0]) & \
+            (cell_y >= 0) & (cell_y < self.__shape[1])
+        queries = queries[inside]
+        linear = cell_x[inside] * self.__shape[1] + cell_y[inside]
+        starts = self.__offsets[linear]
+        counts = self.__offsets[linear + 1] - starts
+        occupied = counts > 0
+        queries, starts, counts = queries[occupied], starts[occupied], counts[occupied]
+        if len(queries) == 0:
+            return
+        # the candidates of a query are contiguous, the minimum per query is
+        # a segmented reduction
+        segments = numpy.cumsum(counts) - counts
+        candidates = numpy.repeat(starts - segments, counts) + \
+            numpy.arange(int(counts.sum()))
+        distances = numpy.hypot(
+            *(self.__points[candidates] - numpy.repeat(points[queries], counts,
+                                                       axis=0)).T)
+        minimum = numpy.minimum.reduceat(distances, segments)
+        closer = minimum < best[queries]
+        position = numpy.flatnonzero(distances == numpy.repeat(minimum, counts))
+        # the first candidate with the minimal distance of each query
+        position = position[numpy.diff(
+            numpy.searchsorted(segments, position, side="right"), prepend=0) != 0]
+        best[queries[closer]] = minimum[closer]
+        result[queries[closer]] = candidates[position[closer]]
+
+    def __within(self, point: numpy.ndarray,
+                 radius: float) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        low = numpy.floor((point - radius - self.__origin) /
+                          self.__cell_size).astype(numpy.int64)
+        high = numpy.floor((point + radius - self.__origin) /
+                           self.__cell_size).astype(numpy.int64)
+        low = numpy.maximum(low, 0)
+        high = numpy.minimum(high, numpy.array(self.__shape) - 1)
+        # the cells of a column are consecutive
+        candidates = [numpy.arange(
+            self.__offsets[cell_x * self.__shape[1] + low[1]],
+            self.__offsets[cell_x * self.__shape[1] + high[1] + 1])
+            for cell_x in range(low[0], high[0] + 1) if low[1] <= high[1]]
+        candidates = numpy.concatenate(candidates) if len(candidates) > 0 \
+            else numpy.zeros(0, dtype=numpy.int64)
+        distances = numpy.hypot(*(self.__points[candidates] - point).T)
+        inside = distances <= radius
+        indexes = candidates[inside]
+        return self.__order[indexes], distances[inside]
@@ -0,0 +1,50 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/python
+"""
+Module containing a function reading HTTP/1.1 requests with keep-alive from
+an asyncio stream, shared by the generation service and the stub server.
+"""
+import asyncio
+from typing import Dict, Optional, Tuple
+
+
+async def read(reader: asyncio.StreamReader) -> \
+        Optional[Tuple[str, str, Dict[str, str], bytes, bool]]:
+    """
+    Coroutine reading the request line, the headers and the body of the next
+    request of a connection.
+    :param reader: The stream of the connection.
+    :return Method, path, headers (lower case names), body and whether the
+            connection is kept alive, or None, if the connection is closed.
+    :raise ValueError: The request line is malformed.
+    :raise asyncio.IncompleteReadError: The body is shorter than announced.
+    """
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    method, path, version = request_line.decode("latin-1").split()
+    headers: Dict[str, str] = {}
+    while True:
+        line = (await reader.readline()).decode("latin-1").strip()
+        if not line:
+            break
+        key, _, value = line.partition(":")
+        headers[key.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers.get("content-length", 0)))
+    connection = headers.get("connection", "").lower()
+    keep_alive = connection != "close" if version == "HTTP/1.1" \
+        else connection == "keep-alive"
+    return method, path, headers, body, keep_alive
@@ -0,0 +1,263 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/python
+"""
+Module containing a class for the incremental generation of a TAPI topology.
+"""
+import json
+from typing import Dict, List, Set, Tuple, Union
+from model.python.tapi_node import TapiNode
+from model.python.tapi_topology import TapiTopology
+
+
+class IncrementalGenerator:
+    """
+    Class updating a previously generated TAPI topology to a changed
+    configuration. Unchanged nodes and links keep their identifiers. Only the
+    added subtrees and their links are generated, removed subtrees and their
+    links are dropped. The number of children is compared per parent, so
+    patterns with lists or distributions are updated branch by branch.
+    """
+
+    LEVELS: List[str] = TapiTopology.LEVELS
+
+    __previous: dict = None
+    __configuration: dict = None
+    __topology: TapiTopology = None
+    __modified: List[TapiNode] = None
+    __removed: Set[str] = None
+    __old: Dict[str, int] = None
+    __new: Dict[str, int] = None
+    __children: Dict[Tuple[str, str], int] = None
+    __changed: Set[str] = None
+
+    # constructor
+    def __init__(self, previous: dict, configuration: dict):
+        self.__previous = previous
+        self.__configuration = configuration
+        self.__modified = []
+        self.__removed = set()
+
+    # getters
+    def configuration(self) -> dict:
+        """
+        Getter returning the object configuration
+        :return The new configuration.
+        """
+        return self.__configuration
+
+    def previous_pattern(self) -> Dict[str, int]:
+        """
+        Getter returning the pattern of the previous topology. It is
+        calculated from the local identifiers of the nodes.
+        :return The previous pattern.
+        """
+        result: Dict[str, int] = {}
+        for node in self.__previous_topology()["node"]:
+            node_type, local_id = self.__type_and_local_id(node)
+            for digit, level in zip(local_id, self.__levels(node_type)):
+                result[level] = max(result.get(level, 0), int(digit) + 1)
+        return result
+
+    def pattern(self) -> Dict[str, int]:
+        """
+        Getter returning the pattern of the new topology.
+        :return The new pattern.
+        """
+        return self.__configuration['network']['pattern']
+
+    def topology(self) -> dict:
+        """
+        Getter returning the full updated TAPI Common Context.
+        :return TAPI Common Context as json object.
+        """
+        previous = self.__previous_topology()
+        modified: Dict[str, dict] = {}
+        for node in self.__modified:
+            modified[node.identifier()] = node.json()
+
+        topology = previous.copy()
+        topology["node"] = [
+            modified.get(node["uuid"], node) for node in previous["node"]
+            if node["uuid"] not in self.__removed]
+        topology["node"].extend(
+            [node.json() for node in self.__topology.data()["node"]])
+        topology["link"] = [
+            link for link in previous["link"] if not self.__is_removed(link)]
+        topology["link"].extend(
+            [link.json() for link in self.__topology.data()["link"]])
+
+        context = self.__previous["tapi-common:context"].copy()
+        context["tapi-topology:topology-context"] = {"topology": [topology]}
+        return {"tapi-common:context": context}
+
+    def delta(self) -> dict:
+        """
+        Getter returning the changes between the previous and the updated
+        TAPI Topology.
+        :return The changes as json object.
+        """
+        previous = self.__previous_topology()
+        return {
+            "topology-uuid": previous["uuid"],
+            "pattern": {
+                "previous": self.previous_pattern(),
+                "current": self.pattern()
+            },
+            "node": {
+                "create": [node.json() for node in self.__topology.data()["node"]],
+                "update": [node.json() for node in self.__modified],
+                "delete": [node["uuid"] for node in previous["node"]
+                           if node["uuid"] in self.__removed]
+            },
+            "link": {
+                "create": [link.json() for link in self.__topology.data()["link"]],
+                "delete": [link["uuid"] for link in previous["link"]
+                           if self.__is_removed(link)]
+            }
+        }
+
+    # methods
+    def generate(self) -> 'IncrementalGenerator':
+        """
+        Method to start the incremental generation process. The effort is
+        proportional to the changes of the pattern.
+        :return The IncrementalGenerator object.
+        """
+        previous = self.__previous_topology()
+        configuration = json.loads(json.dumps(self.__configuration))
+        configuration['network']['uuid'] = previous["uuid"]
+        self.__topology = TapiTopology(configuration, populate=False)
+
+        self.__old = self.previous_pattern()
+        self.__new = self.pattern()
+        # number of children per level and local identifier of the parent
+        self.__children = {}
+        for node in previous["node"]:
+            node_type, local_id = self.__type_and_local_id(node)
+            key = (self.__levels(node_type)[-1], local_id[:-1])
+            self.__children[key] = max(self.__children.get(key, 0),
+                                       int(local_id[-1]) + 1)
+            if not self.__exists(self.__levels(node_type), local_id):
+                self.__removed.add(node["uuid"])
+
+        self.__changed = set(
+            [level for level in self.LEVELS + ["o-cloud"]
+             if (level in self.__old) != (level in self.__new)])
+        for (level, prefix), count in self.__children.items():
+            if self.__exists(self.__levels(level)[:-1], prefix) and \
+                    count != self.__topology.count(level, prefix):
+                self.__changed.add(level)
+
+        self.__update(0, None, "")
+        return self
+
+    def save(self, filename: str):
+        """
+        Method saving the updated TAPI topology to a file in json format.
+        :param filename: A valid path to a file on the system.
+        :type filename: string
+        """
+        with open(filename, "w", encoding='utf-8') as json_file:
+            json.dump(self.topology(), json_file, ensure_ascii=False, indent=2)
+        print("Nodes: +" + str(len(self.__topology.data()["node"])),
+              "~" + str(len(self.__modified)),
+              "-" + str(len(self.__removed)))
+        print("File '" + filename + "' saved!")
+
+    def save_delta(self, filename: str):
+        """
+        Method saving the changes to a file in json format.
+        :param filename: A valid path to a file on the system.
+        :type filename: string
+        """
+        delta = self.delta()
+        with open(filename, "w", encoding='utf-8') as json_file:
+            json.dump(delta, json_file, ensure_ascii=False, indent=2)
+        print("Links: +" + str(len(delta["link"]["create"])),
+              "-" + str(len(delta["link"]["delete"])))
+        print("File '" + filename + "' saved!")
+
+    # private
+    def __previous_topology(self) -> dict:
+        return (self.__previous
+                ["tapi-common:context"]
+                ["tapi-topology:topology-context"]
+                ["topology"][0])
+
+    def __type_and_local_id(self, node: dict) -> tuple:
+        name = node["name"][0]["value"]
+        local_id = node["name"][1]["value"]
+        return name[:-(len(local_id) + 1)], local_id
+
+    def __levels(self, node_type: str) -> List[str]:
+        if node_type == "o-cloud":
+            return ["smo", "o-cloud"]
+        if node_type in ["o-cu-cp", "o-cu-up"]:
+            node_type = "o-cu"
+        return self.LEVELS[:self.LEVELS.index(node_type) + 1]
+
+    def __is_removed(self, link: dict) -> bool:
+        for endpoint in link["node-edge-point"]:
+            if endpoint["node-uuid"] in self.__removed:
+                return True
+        return False
+
+    def __exists(self, levels: List[str], local_id: str) -> bool:
+        # all digits are within the new counts of their parents
+        return not any(int(local_id[index]) >= self.__topology.count(
+            level, local_id[:index]) for index, level in enumerate(levels))
+
+    def __extend(self, level: str, parent: Union[TapiNode, Dict[str, TapiNode]],
+                 prefix: str):
+        old = self.__children.get((level, prefix), 0)
+        new = self.__topology.count(level, prefix)
+        if new > old:
+            self.__topology.extend(level, parent, old, new)
+
+    def __update(self, depth: int, parent: Union[TapiNode, Dict[str, TapiNode]],
+                 prefix: str):
+        """
+        Method adding the new nodes of a level below a parent and descending
+        into the unchanged nodes, as long as a lower level was changed.
+        """
+        level = self.LEVELS[depth]
+        if level == "near-rt-ric":
+            self.__extend("o-cloud", parent, prefix)
+        self.__extend(level, parent, prefix)
+
+        below = self.LEVELS[depth + 1:]
+        if level == "smo":
+            below = below + ["o-cloud"]
+        if len(self.__changed.intersection(below)) == 0:
+            return
+
+        for index in range(min(self.__children.get((level, prefix), 0),
+                               self.__topology.count(level, prefix))):
+            local_id = prefix + str(index)
+            if level == "o-cu":
+                node = {}
+                for plane in ["cp", "up"]:
+                    node[plane] = self.__topology.anchor(
+                        "-".join([level, plane]), parent, local_id)
+            elif level == "o-du":
+                node = self.__topology.anchor(level, parent["cp"], local_id)
+            else:
+                node = self.__topology.anchor(level, parent, local_id)
+                if level == "fronthaul-gateway" and \
+                        self.__children.get(("o-ru", local_id), 0) != \
+                        self.__topology.count("o-ru", local_id):
+                    self.__modified.append(node)
+            self.__update(depth + 1, node, local_id)
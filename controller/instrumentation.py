@@ -0,0 +1,219 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/python
+"""
+Module containing the instrumentation recording wall and CPU time per phase
+and counters of the generation process.
+The module functions use a process wide recorder, which is disabled by
+default. When disabled, phases and counters cost a flag check only.
+"""
+import contextlib
+import functools
+import json
+import time
+from typing import Callable, Dict, List
+
+
+class Instrumentation:
+    """
+    Class recording phases and counters.
+    Phases may be nested. Besides the total time of a phase, its self time
+    without the nested phases is recorded, e.g. the generation of the O-DUs
+    without the generation of their fronthaul gateways.
+    """
+
+    __enabled: bool = False
+    __start: Dict[str, float] = None
+    __phases: Dict[str, Dict[str, float]] = None
+    __counters: Dict[str, int] = None
+    __stack: List[List] = None
+    __listeners: List[Callable[[str, bool], None]] = None
+    __disabled = contextlib.nullcontext()
+
+    # constructor
+    def __init__(self):
+        self.__listeners = []
+        self.reset()
+
+    # getters
+    def enabled(self) -> bool:
+        """
+        Getter returning whether the recording is enabled.
+        :return True, if phases and counters are recorded.
+        """
+        return self.__enabled
+
+    def phases(self) -> Dict[str, Dict[str, float]]:
+        """
+        Getter returning the recorded phases.
+        :return Calls, wall and cpu time in seconds (total and self) by phase.
+        """
+        return self.__phases
+
+    def counters(self) -> Dict[str, int]:
+        """
+        Getter returning the recorded counters.
+        :return Values by counter name.
+        """
+        return self.__counters
+
+    def json(self) -> Dict:
+        """
+        Getter returning the recording as json object.
+        :return Total time, phases and counters as json object.
+        """
+        return {
+            "total": {
+                "wall": time.perf_counter() - self.__start["wall"],
+                "cpu": time.process_time() - self.__start["cpu"]
+            },
+            "phase": self.__phases,
+            "counter": self.__counters
+        }
+
+    # methods
+    def enable(self) -> 'Instrumentation':
+        """
+        Method starting the recording.
+        :return The Instrumentation object.
+        """
+        self.reset()
+        self.__enabled = True
+        return self
+
+    def disable(self) -> 'Instrumentation':
+        """
+        Method stopping the recording. The recorded values are kept.
+        :return The Instrumentation object.
+        """
+        self.__enabled = False
+        return self
+
+    def reset(self):
+        """
+        Method removing all recorded values.
+        """
+        self.__start = {"wall": time.perf_counter(), "cpu": time.process_time()}
+        self.__phases = {}
+        self.__counters = {}
+        self.__stack = []
+
+    def phase(self, name: str):
+        """
+        Method returning a context manager recording a phase.
+        :param name: The name of the phase, e.g. "json-write".
+        :return A context manager.
+        """
+        if not self.__enabled:
+            return self.__disabled
+        return self.__phase(name)
+
+    def listen(self, listener: Callable[[str, bool], None]):
+        """
+        Method adding a listener, which is called at the start and at the end
+        of each top-level phase.
+        :param listener: A function called with the phase name and True at
+                         the start or False at the end of the phase.
+        """
+        self.__listeners.append(listener)
+
+    def count(self, name: str, value: int = 1):
+        """
+        Method increasing a counter.
+        :param name: The name of the counter, e.g. "node".
+        :param value: The increment.
+        """
+        if self.__enabled:
+            self.__counters[name] = self.__counters.get(name, 0) + value
+
+    def save(self, filename: str):
+        """
+        Method saving the recording to a file in json format.
+        :param filename: A valid path to a file on the system.
+        :type filename: string
+        """
+        with open(filename, "w", encoding='utf-8') as json_file:
+            json.dump(self.json(), json_file, ensure_ascii=False, indent=2)
+        print("File '" + filename + "' saved!")
+
+    # private
+    @contextlib.contextmanager
+    def __phase(self, name: str):
+        # name, wall start, cpu start, wall and cpu time of nested phases
+        record = self.__phases.setdefault(name, {
+            "calls": 0, "wall": 0.0, "cpu": 0.0,
+            "self-wall": 0.0, "self-cpu": 0.0})
+        if len(self.__stack) == 0:
+            for listener in self.__listeners:
+                listener(name, True)
+        frame = [name, time.perf_counter(), time.process_time(), 0.0, 0.0]
+        self.__stack.append(frame)
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - frame[1]
+            cpu = time.process_time() - frame[2]
+            self.__stack.pop()
+            if len(self.__stack) > 0:
+                self.__stack[-1][3] += wall
+                self.__stack[-1][4] += cpu
+            else:
+                for listener in self.__listeners:
+                    listener(name, False)
+            record["calls"] += 1
+            record["wall"] += wall
+            record["cpu"] += cpu
+            record["self-wall"] += wall - frame[3]
+            record["self-cpu"] += cpu - frame[4]
+
+
+RECORDER: Instrumentation = Instrumentation()
+
+
+def phase(name: str):
+    """
+    Function returning a context manager recording a phase with the process
+    wide recorder.
+    :param name: The name of the phase.
+    :return A context manager.
+    """
+    return RECORDER.phase(name)
+
+
+def count(name: str, value: int = 1):
+    """
+    Function increasing a counter of the process wide recorder.
+    :param name: The name of the counter.
+    :param value: The increment.
+    """
+    RECORDER.count(name, value)
+
+
+def timed(name: str) -> Callable:
+    """
+    Function returning a decorator, which records each call of the decorated
+    function as phase with the process wide recorder.
+    :param name: The name of the phase.
+    :return The decorator.
+    """
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not RECORDER.enabled():
+                return function(*args, **kwargs)
+            with RECORDER.phase(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
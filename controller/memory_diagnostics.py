@@ -0,0 +1,238 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/python
+"""
+Module containing a class accounting the memory of the generation process.
+"""
+import gc
+import json
+import os
+import resource
+import sys
+import threading
+import time
+import tracemalloc
+import types
+from typing import Dict, List
+from controller.instrumentation import Instrumentation
+from model.python.link_config import LinkConfig
+from model.python.tapi_common_context import TapiCommonContext
+from model.python.tapi_connection_edge_point import TapiConnectionEdgePoint
+from model.python.tapi_link import TapiLink
+from model.python.tapi_node import TapiNode
+from model.python.tapi_node_edge_point import TapiNodeEdgePoint
+from model.python.tapi_topology import TapiTopology
+
+
+def rss() -> int:
+    """
+    Function returning the resident set size of the process. /proc is
+    available on Linux only, elsewhere the peak is returned.
+    :return Resident set size in bytes.
+    """
+    if os.path.isfile("/proc/self/statm"):
+        with open("/proc/self/statm", encoding="utf-8") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    return rss_peak()
+
+
+def rss_peak() -> int:
+    """
+    Function returning the peak resident set size over the lifetime of the
+    process.
+    :return Peak resident set size in bytes.
+    """
+    # ru_maxrss is reported in KiB on Linux and in bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class MemoryDiagnostics:
+    """
+    Class taking tracemalloc snapshots at the boundaries of the top-level
+    phases of an Instrumentation recorder and calculating the deep size of a
+    network per model class. The peak rss of a phase is the maximum of the
+    rss sampled by a thread during the phase.
+    An object belongs to the nearest model object it is reachable from, e.g.
+    the data dict and the name strings of a TAPI Node to the TapiNode, its
+    node-edge-points to the TapiNodeEdgePoint objects.
+    """
+
+    # model classes in the order of precedence, subclasses (e.g.
+    # TapiNodeSmo) are accounted to their model class
+    CLASSES: List[type] = [TapiNode, TapiNodeEdgePoint, TapiConnectionEdgePoint,
+                           TapiLink, LinkConfig, TapiTopology, TapiCommonContext]
+    SKIPPED: tuple = (type, types.ModuleType, types.FunctionType,
+                      types.BuiltinFunctionType, types.CodeType)
+    TOP: int = 5
+
+    __phases: List[Dict] = None
+    __classes: Dict[str, Dict[str, int]] = None
+    __snapshot: tracemalloc.Snapshot = None
+    __interval: float = 0.001
+    __rss_peak: int = 0
+    __thread: threading.Thread = None
+    __running: threading.Event = None
+    __lock: threading.Lock = None
+
+    # constructor
+    def __init__(self, interval: float = 0.001):
+        self.__phases = []
+        self.__classes = {}
+        self.__interval = interval
+        self.__running = threading.Event()
+        self.__lock = threading.Lock()
+
+    # getters
+    def phases(self) -> List[Dict]:
+        """
+        Getter returning the memory per phase.
+        :return Traced memory, traced peak, rss, peak rss and the top
+                allocations by phase.
+        """
+        return self.__phases
+
+    def classes(self) -> Dict[str, Dict[str, int]]:
+        """
+        Getter returning the deep size per model class.
+        :return Number of instances and bytes by class name.
+        """
+        return self.__classes
+
+    def json(self) -> Dict:
+        """
+        Getter returning the memory accounting as json object.
+        :return Phases and classes as json object.
+        """
+        nodes = self.__classes.get(TapiNode.__name__, {}).get("instances", 0)
+        total = sum([entry["bytes"] for entry in self.__classes.values()])
+        return {
+            "phase": self.__phases,
+            "class": self.__classes,
+            "bytes-per-node": round(total / nodes) if nodes > 0 else None
+        }
+
+    # methods
+    def start(self, recorder: Instrumentation) -> 'MemoryDiagnostics':
+        """
+        Method starting tracemalloc and listening to the phases of a
+        recorder.
+        :param recorder: An enabled Instrumentation object.
+        :return The MemoryDiagnostics object.
+        """
+        tracemalloc.start()
+        self.__snapshot = tracemalloc.take_snapshot()
+        self.__rss_peak = rss()
+        self.__running.set()
+        self.__thread = threading.Thread(target=self.__sample, daemon=True)
+        self.__thread.start()
+        recorder.listen(self.__listen)
+        return self
+
+    def stop(self) -> 'MemoryDiagnostics':
+        """
+        Method stopping tracemalloc and the sampling of the rss.
+        :return The MemoryDiagnostics object.
+        """
+        self.__running.clear()
+        self.__thread.join()
+        tracemalloc.stop()
+        self.__snapshot = None
+        return self
+
+    def measure(self, network: TapiCommonContext) -> 'MemoryDiagnostics':
+        """
+        Method calculating the deep size of a network per model class.
+        :param network: The generated TAPI Common Context.
+        :return The MemoryDiagnostics object.
+        """
+        self.__classes = {}
+        seen = set()
+        stack = [(network, TapiCommonContext.__name__)]
+        while len(stack) > 0:
+            item, owner = stack.pop()
+            if id(item) in seen or isinstance(item, self.SKIPPED):
+                continue
+            seen.add(id(item))
+            for model_class in self.CLASSES:
+                if isinstance(item, model_class):
+                    owner = model_class.__name__
+                    self.__entry(owner)["instances"] += 1
+                    break
+            self.__entry(owner)["bytes"] += sys.getsizeof(item)
+            for referent in gc.get_referents(item):
+                stack.append((referent, owner))
+        return self
+
+    def save(self, filename: str):
+        """
+        Method saving the memory accounting to a file in json format.
+        :param filename: A valid path to a file on the system.
+        :type filename: string
+        """
+        with open(filename, "w", encoding='utf-8') as json_file:
+            json.dump(self.json(), json_file, ensure_ascii=False, indent=2)
+        print("File '" + filename + "' saved!")
+
+    def show(self):
+        """
+        Method printing the memory per phase and per model class.
+        """
+        row = "{:<24} {:>10} {:>10} {:>10} {:>10}"
+        print(row.format("phase", "traced", "peak", "rss", "peak rss"))
+        for entry in self.__phases:
+            print(row.format(entry["phase"], *[
+                self.__megabytes(entry[key]) for key in
+                ["traced", "traced-peak", "rss", "rss-peak"]]))
+        print(row.format("class", "instances", "bytes", "", ""))
+        for name, entry in self.__classes.items():
+            print(row.format(name, entry["instances"],
+                             self.__megabytes(entry["bytes"]), "", ""))
+        print("bytes per node:", self.json()["bytes-per-node"])
+
+    # private
+    def __listen(self, name: str, start: bool):
+        if start:
+            tracemalloc.reset_peak()
+            with self.__lock:
+                self.__rss_peak = rss()
+            return
+        traced, peak = tracemalloc.get_traced_memory()
+        current = rss()
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)])
+        top = snapshot.compare_to(self.__snapshot, "lineno")[:self.TOP]
+        self.__snapshot = snapshot
+        self.__phases.append({
+            "phase": name,
+            "traced": traced,
+            "traced-peak": peak,
+            "rss": current,
+            "rss-peak": max(current, self.__rss_peak),
+            "top": [str(statistic) for statistic in top]
+        })
+
+    def __entry(self, name: str) -> Dict[str, int]:
+        return self.__classes.setdefault(name, {"instances": 0, "bytes": 0})
+
+    def __sample(self):
+        while self.__running.is_set():
+            current = rss()
+            with self.__lock:
+                self.__rss_peak = max(self.__rss_peak, current)
+            time.sleep(self.__interval)
+
+    def __megabytes(self, size: int) -> str:
+        return str(round(size / 1024 / 1024, 2)) + " MiB"
@@ -16,7 +16,9 @@
 """
 Module containing the Generator class.
 """
+from typing import Callable
 from model.python.tapi_common_context import TapiCommonContext
+from model.python.top import Top
 
 class TopologyGenerator:
     """
@@ -39,9 +41,12 @@ class TopologyGenerator:
         return self.__configuration
 
     # returns a JSON serializable object
-    def generate(self) -> TapiCommonContext:
+    def generate(self, listener: Callable[[str, Top], None] = None) -> TapiCommonContext:
         """
         Method to start the generation process.
+        :param listener: Optional function called with "context", "topology",
+                         "node" or "link" and the object, as soon as the
+                         object is complete.
         :return The TapiCommonContext object.
         """
-        return TapiCommonContext(self.configuration())
+        return TapiCommonContext(self.configuration(), listener)
@@ -16,11 +16,12 @@
 """
 Module containing a class for parameter validation
 """
+import hashlib
 import os
 import os.path
 import json
 from typing import Dict, Union
-import jsonschema
+from controller import instrumentation
 
 
 class ParameterValidator:
@@ -35,27 +36,37 @@ class ParameterValidator:
     __config_schema: dict = {}
     __error_messsage: str = ""
     __is_valid: bool = False
+    __remember: bool = False
+    # compiled schema validator, shared by all instances of a process
+    __schema_validator = None
+    # the checked schema, cached across processes, so that the schema is only
+    # checked against its meta-schema once, and on request the digests of
+    # valid configurations, so that jsonschema is only loaded for new ones
+    __cache_file: str = os.path.join(
+        os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")),
+        "network-topology-instance-generator", "configuration.schema.cache.json")
+    __cache: dict = None
+    __cache_size: int = 256
 
     # constructor
-    def __init__(self, args):
+    def __init__(self, args, configuration: dict = None, remember: bool = False):
         self.args = args
+        self.__remember = remember
 
         if len(self.args) > 1:
             self.__config_file = args[1]
 
-        if os.path.isfile(self.__config_file) is False:
+        if configuration is not None:
+            self.__configuration = configuration
+        elif os.path.isfile(self.__config_file) is False:
             print("File", self.__config_file, "does not exist.")
         else:
-            with open(self.__config_file) as content:
-                self.__configuration = json.load(content)
+            with instrumentation.phase("configuration-load"):
+                with open(self.__config_file) as content:
+                    self.__configuration = json.load(content)
 
-        if os.path.isfile(self.__configuration_schema_file) is False:
-            print("File", self.__configuration_schema_file, "does not exist.")
-        else:
-            with open(self.__configuration_schema_file) as content:
-                self.__config_schema = json.load(content)
-        self.__is_valid = self.__is_json_valid(
-            self.__configuration, self.__config_schema)
+        with instrumentation.phase("schema-validation"):
+            self.__is_valid = self.__is_json_valid(self.__configuration)
 
     def configuration_file(self) -> str:
         """
@@ -88,14 +99,123 @@ class ParameterValidator:
 
     # private
 
-    def __is_json_valid(self, json_data, json_schema) -> bool:
+    @classmethod
+    def __load_cache(cls) -> dict:
+        """
+        Method returning the cache, which is reset if the schema file has
+        changed. The cache is loaded once per process. The schema file is
+        only read and hashed, if its modification time or size differ from
+        the cached ones.
+        """
+        if cls.__cache is None:
+            schema_stat = None
+            if os.path.isfile(cls.__configuration_schema_file):
+                stat = os.stat(cls.__configuration_schema_file)
+                schema_stat = [stat.st_mtime_ns, stat.st_size]
+            try:
+                with open(cls.__cache_file, encoding="utf-8") as content:
+                    cls.__cache = json.load(content)
+            except (OSError, ValueError):
+                cls.__cache = {}
+            if not isinstance(cls.__cache, dict):
+                cls.__cache = {}
+            if cls.__cache.get("schema-stat") != schema_stat:
+                schema_digest = None
+                if schema_stat is not None:
+                    with open(cls.__configuration_schema_file, "rb") as content:
+                        schema_digest = hashlib.sha256(content.read()).hexdigest()
+                if cls.__cache.get("schema-digest") != schema_digest:
+                    cls.__cache = {"schema-digest": schema_digest,
+                                   "schema": None, "valid": []}
+                cls.__cache["schema-stat"] = schema_stat
+                cls.__save_cache()
+        return cls.__cache
+
+    @classmethod
+    def __save_cache(cls):
+        """
+        Method writing the cache, a not writable cache folder is ignored.
+        """
+        try:
+            os.makedirs(os.path.dirname(cls.__cache_file), exist_ok=True)
+            temporary = cls.__cache_file + "." + str(os.getpid())
+            with open(temporary, "w", encoding="utf-8") as content:
+                json.dump(cls.__cache, content)
+            os.replace(temporary, cls.__cache_file)
+        except OSError:
+            pass
+
+    @classmethod
+    def __validator(cls):
         """
-        Method validating json against a schema
+        Method returning the compiled validator of the configuration schema.
+        The schema is loaded and compiled once per process, the check of the
+        schema against its meta-schema only once per schema file.
         """
+        # pylint: disable=import-outside-toplevel
+        import jsonschema
+        if cls.__schema_validator is None:
+            cache = cls.__load_cache()
+            if cache["schema"] is not None:
+                cls.__config_schema = cache["schema"]
+                validator_class = jsonschema.validators.validator_for(
+                    cls.__config_schema)
+            else:
+                if os.path.isfile(cls.__configuration_schema_file) is False:
+                    print("File", cls.__configuration_schema_file,
+                          "does not exist.")
+                else:
+                    with open(cls.__configuration_schema_file) as content:
+                        cls.__config_schema = json.load(content)
+                validator_class = jsonschema.validators.validator_for(
+                    cls.__config_schema)
+                validator_class.check_schema(cls.__config_schema)
+                cache["schema"] = cls.__config_schema
+                cls.__save_cache()
+            cls.__schema_validator = validator_class(cls.__config_schema)
+        return cls.__schema_validator
+
+    def __is_json_valid(self, json_data) -> bool:
+        """
+        Method validating json against the configuration schema
+        """
+        cache = self.__load_cache()
+        digest = hashlib.sha256(json.dumps(
+            json_data, sort_keys=True).encode("utf-8")).hexdigest()
+        if self.__remember and digest in cache["valid"]:
+            self.__error_messsage = ""
+            return True
+
+        # pylint: disable=import-outside-toplevel
+        import jsonschema
         try:
-            jsonschema.validate(instance=json_data, schema=json_schema)
+            self.__validator().validate(json_data)
+            self.__check_distributions(json_data)
             self.__error_messsage = ""
         except jsonschema.exceptions.ValidationError as err:
             self.__error_messsage = err
             return False
+        if self.__remember:
+            cache["valid"] = (cache["valid"] + [digest])[-self.__cache_size:]
+            self.__save_cache()
         return True
+
+    def __check_distributions(self, json_data):
+        """
+        Method checking the ranges of the distributions in the pattern, which
+        cannot be expressed by the schema. The defaults are documented in the
+        schema (minimum: 1, maximum: 8).
+        """
+        # pylint: disable=import-outside-toplevel
+        import jsonschema
+        pattern = json_data["network"].get("pattern", {})
+        for node_type, value in pattern.items():
+            if not isinstance(value, dict):
+                continue
+            minimum, maximum = value.get("minimum", 1), value.get("maximum", 8)
+            if minimum > maximum:
+                raise jsonschema.exceptions.ValidationError(
+                    "The minimum " + str(minimum) + " of the " + node_type +
+                    " distribution is greater than its maximum " +
+                    str(maximum) + ".",
+                    path=["network", "pattern", node_type])
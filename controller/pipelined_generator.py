@@ -0,0 +1,199 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+#!/usr/bin/python
+"""
+Module containing a class overlapping the generation of a TAPI topology with
+its json serialization and the file writing.
+"""
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, \
+    ThreadPoolExecutor
+from typing import Dict, Union
+from controller.network_generator import TopologyGenerator
+from model.python.tapi_common_context import TapiCommonContext
+from model.python.top import Top
+from view import json_chunks
+
+
+class PipelinedGenerator:
+    """
+    Class generating a TAPI topology and writing its json file at the same
+    time. The generation emits each completed node and link. They are
+    collected into chunks, encoded by serializer processes (or a serializer
+    thread) and written by a writer thread with large buffered writes. The
+    links follow all nodes in the json file, so their encoded chunks are
+    spooled to a temporary file until the nodes of the topology are written.
+    The queue between generation and writer is bounded, a slow serializer or
+    writer blocks the generation, so the memory for the pending chunks stays
+    bounded.
+    The json file is byte-identical to NetworkViewer.save.
+    """
+
+    WRITE_BUFFER: int = 1024 * 1024
+    # link chunks are kept in memory up to this size, then on disk
+    SPOOL_SIZE: int = 16 * 1024 * 1024
+
+    __configuration: dict = None
+    __filename: str = None
+    __serializers: int = 1
+    __queue_size: int = 16
+    __chunk_size: int = 256
+    __executor: Executor = None
+    __queue: queue.Queue = None
+    __writer: threading.Thread = None
+    __error: BaseException = None
+    __chunks: json_chunks.JsonChunks = None
+    __statistics: Dict[str, Union[int, float]] = None
+
+    # constructor
+    def __init__(self, configuration: dict, filename: str, serializers: int = 1,
+                 queue_size: int = 16, chunk_size: int = 256):
+        self.__configuration = configuration
+        self.__filename = filename
+        self.__serializers = serializers
+        self.__queue_size = queue_size
+        self.__chunk_size = chunk_size
+
+    # getters
+    def filename(self) -> str:
+        """
+        Getter returning the json file.
+        :return The path of the json file.
+        """
+        return self.__filename
+
+    def statistics(self) -> Dict[str, Union[int, float]]:
+        """
+        Getter returning the statistics of the last generation.
+        :return Wall time, time blocked by backpressure, writer busy time,
+                maximal queue length and bytes written.
+        """
+        return self.__statistics
+
+    # methods
+    def generate(self) -> TapiCommonContext:
+        """
+        Method generating the TAPI topology and writing its json file.
+        :return The TapiCommonContext object.
+        """
+        self.__statistics = {"wall": 0.0, "generation": 0.0, "backpressure": 0.0,
+                             "writer": 0.0, "queue-max": 0, "bytes": 0,
+                             "node": 0, "link": 0}
+        self.__queue = queue.Queue(maxsize=self.__queue_size)
+        self.__error = None
+        if self.__serializers > 0:
+            self.__executor = ProcessPoolExecutor(self.__serializers)
+        else:
+            self.__executor = ThreadPoolExecutor(1)
+        self.__chunks = json_chunks.JsonChunks(
+            self.__executor, self.__put, self.__chunk_size)
+        self.__writer = threading.Thread(target=self.__write, daemon=True)
+        self.__writer.start()
+
+        start = time.perf_counter()
+        try:
+            network = TopologyGenerator(self.__configuration).generate(
+                self.__listen)
+            self.__statistics["generation"] = time.perf_counter() - start
+            self.__chunks.end()
+        finally:
+            self.__put_stop()
+            self.__writer.join()
+            self.__executor.shutdown()
+        if self.__error is not None:
+            raise self.__error
+        self.__statistics["wall"] = time.perf_counter() - start
+        print("Nodes:", self.__statistics["node"])
+        print("Links:", self.__statistics["link"])
+        print("File '" + self.__filename + "' saved!")
+        return network
+
+    def show(self):
+        """
+        Method printing the statistics of the last generation.
+        """
+        for key in ["wall", "generation", "backpressure", "writer"]:
+            print("{:<14} {:>10.3f}s".format(key, self.__statistics[key]))
+        for key in ["queue-max", "bytes"]:
+            print("{:<14} {:>11}".format(key, self.__statistics[key]))
+
+    # private
+    def __listen(self, kind: str, item: Top):
+        if self.__error is not None:
+            raise self.__error
+        if kind == "context":
+            self.__chunks.begin(item)
+        elif kind == "topology":
+            self.__chunks.begin_topology(item)
+        else:
+            self.__chunks.add(kind, item)
+            self.__statistics[kind] += 1
+
+    def __put(self, kind: str, payload: Union[bytes, Future, None]):
+        start = time.perf_counter()
+        while True:
+            if self.__error is not None:
+                raise self.__error
+            try:
+                self.__queue.put((kind, payload), timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        self.__statistics["backpressure"] += time.perf_counter() - start
+        self.__statistics["queue-max"] = max(
+            self.__statistics["queue-max"], self.__queue.qsize())
+
+    def __put_stop(self):
+        # the writer may have stopped after an error, the queue is not
+        # consumed anymore then
+        while self.__writer.is_alive():
+            try:
+                self.__queue.put(None, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def __write(self):
+        try:
+            with open(self.__filename, "wb", buffering=self.WRITE_BUFFER) as output:
+                spool = tempfile.SpooledTemporaryFile(max_size=self.SPOOL_SIZE)
+                while True:
+                    message = self.__queue.get()
+                    if message is None:
+                        break
+                    kind, payload = message
+                    if isinstance(payload, Future):
+                        payload = payload.result()
+                    start = time.perf_counter()
+                    if kind == "write":
+                        output.write(payload)
+                    elif kind == "spool":
+                        spool.write(payload)
+                    else:
+                        spool.seek(0)
+                        shutil.copyfileobj(spool, output, self.WRITE_BUFFER)
+                        spool.close()
+                        spool = tempfile.SpooledTemporaryFile(
+                            max_size=self.SPOOL_SIZE)
+                    self.__statistics["writer"] += time.perf_counter() - start
+                spool.close()
+                self.__statistics["bytes"] = output.tell()
+        except BaseException as error:  # pylint: disable=broad-except
+            self.__error = error
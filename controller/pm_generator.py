@@ -0,0 +1,280 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+#!/usr/bin/python
+"""
+Module containing a class generating performance measurement files of the
+network functions of a TAPI topology.
+"""
+import calendar
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple, Union
+from model.python.tapi_common_context import TapiCommonContext
+
+# 3GPP TS 32.435 measurement collection file, one measInfo per file
+XML_TEMPLATE: str = """<?xml version="1.0" encoding="UTF-8"?>
+<measCollecFile xmlns="http://www.3gpp.org/ftp/specs/archive/32_series/32.435#measCollec">
+  <fileHeader fileFormatVersion="32.435 V10.0" vendorName="O-RAN-SC">
+    <fileSender localDn="%(name)s" elementType="%(type)s"/>
+    <measCollec beginTime="%(begin)s"/>
+  </fileHeader>
+  <measData>
+    <managedElement localDn="%(name)s" userLabel="%(uuid)s"/>
+    <measInfo measInfoId="%(type)s">
+      <job jobId="pm-%(type)s"/>
+      <granPeriod duration="PT%(granularity)sS" endTime="%(end)s"/>
+      <repPeriod duration="PT%(granularity)sS"/>
+      <measTypes>%(types)s</measTypes>
+      <measValue measObjLdn="ManagedElement=%(name)s">
+        <measResults>%(results)s</measResults>
+      </measValue>
+    </measInfo>
+  </measData>
+  <fileFooter>
+    <measCollec endTime="%(end)s"/>
+  </fileFooter>
+</measCollecFile>
+"""
+
+
+def generate(sources: List[Tuple[str, str]], function: str,
+             counters: Dict[str, float], seed: List[int], start: int,
+             periods: int, granularity: int, folder: str,
+             formats: List[str]) -> Tuple[int, int]:
+    """
+    Function generating the measurement files of network functions of the
+    same type for all periods, executed by the worker processes. The
+    counters of all network functions and periods are calculated at once
+    as random walks around a daily profile, the derived counters as ratios
+    of their base counter.
+    :param sources: Name and uuid of the network functions.
+    :param function: The network function label, e.g. "O-DU".
+    :param counters: Mean value per counter name.
+    :param seed: The seed of the random generator.
+    :param start: The begin of the first period in seconds since the epoch.
+    :param periods: The number of reporting periods.
+    :param granularity: The length of a reporting period in seconds.
+    :param folder: The folder for the files.
+    :param formats: "xml" and/or "csv".
+    :return Number of files and bytes written.
+    """
+    import numpy  # pylint: disable=import-outside-toplevel
+
+    random = numpy.random.default_rng(seed)
+    shape = (len(sources), periods, len(counters))
+    walk = numpy.exp(numpy.cumsum(
+        random.normal(0.0, PmGenerator.VOLATILITY, shape), axis=1))
+    hours = (start + granularity * numpy.arange(periods)) % 86400 / 3600
+    profile = 1 + 0.5 * numpy.sin((hours - 9) / 24 * 2 * numpy.pi)
+    means = numpy.array(list(counters.values()), dtype=float)
+    values = numpy.rint(means * walk * profile[:, None])
+
+    # a derived counter is its base counter times a ratio, which varies
+    # around the ratio of the means and stays on the same side of 1, e.g.
+    # RRC.ConnEstabSucc <= RRC.ConnEstabAtt and RRC.ConnMax >= RRC.ConnMean
+    names = list(counters.keys())
+    pairs = [(names.index(derived), names.index(base))
+             for derived, base in PmGenerator.DERIVED.items()
+             if derived in counters and base in counters]
+    spread = numpy.exp(random.normal(
+        0.0, PmGenerator.VOLATILITY, shape[:2] + (len(pairs),)))
+    for number, (derived, base) in enumerate(pairs):
+        ratio = 1 + (means[derived] / means[base] - 1) * spread[..., number]
+        values[..., derived] = numpy.rint(
+            values[..., base] * numpy.maximum(ratio, 0))
+    for percentage in PmGenerator.PERCENTAGES:
+        if percentage in counters:
+            index = names.index(percentage)
+            values[..., index] = numpy.minimum(values[..., index], 100)
+    values = values.astype(numpy.int64).tolist()
+
+    stamps = [start + granularity * index for index in range(periods + 1)]
+    iso = [time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(stamp))
+           for stamp in stamps]
+    # 3GPP TS 32.432 file names, e.g. A20221019.0000+0000-0015+0000_o-du-0102
+    names = ["A" + time.strftime("%Y%m%d.%H%M+0000", time.gmtime(stamps[index])) +
+             time.strftime("-%H%M+0000_", time.gmtime(stamps[index + 1]))
+             for index in range(periods)]
+    types = " ".join(counters.keys())
+    header = ",".join(["measObjLdn", "beginTime", "endTime"] +
+                      list(counters.keys())) + "\n"
+
+    files = 0
+    size = 0
+    for source, (name, uuid) in enumerate(sources):
+        for period in range(periods):
+            results = values[source][period]
+            documents = {}
+            if "xml" in formats:
+                documents[".xml"] = XML_TEMPLATE % {
+                    "name": name, "uuid": uuid, "type": function,
+                    "begin": iso[period], "end": iso[period + 1],
+                    "granularity": granularity, "types": types,
+                    "results": " ".join(map(str, results))}
+            if "csv" in formats:
+                documents[".csv"] = header + ",".join(
+                    ["ManagedElement=" + name, iso[period], iso[period + 1]] +
+                    list(map(str, results))) + "\n"
+            for extension, document in documents.items():
+                content = document.encode("utf-8")
+                with open(os.path.join(folder, names[period] + name + extension),
+                          "wb") as file:
+                    file.write(content)
+                files += 1
+                size += len(content)
+    return files, size
+
+
+class PmGenerator:
+    """
+    Class generating performance measurement files for each network function
+    with an "o1-file" link to the SMO, one file per network function and
+    reporting period in 3GPP XML (TS 32.435) and/or CSV format. The
+    network functions are processed in chunks of the same type by a pool of
+    worker processes. The counter values of a chunk are calculated with
+    NumPy for all periods at once.
+    """
+
+    # mean counter values per reporting period by network function
+    COUNTERS: Dict[str, Dict[str, float]] = {
+        "O-DU": {
+            "RRU.PrbUsedDl": 60000, "RRU.PrbUsedUl": 40000,
+            "RRU.PrbAvailDl": 100000, "RRU.PrbAvailUl": 100000,
+            "DRB.UEThpDl": 150000, "DRB.UEThpUl": 50000,
+            "RRC.ConnMean": 200, "RRC.ConnMax": 400},
+        "O-CU-CP": {
+            "RRC.ConnEstabAtt": 1500, "RRC.ConnEstabSucc": 1450,
+            "RRC.ConnMean": 800, "RRC.ConnMax": 1600,
+            "MM.HoExeInterReq": 300, "MM.HoExeInterSucc": 290},
+        "O-CU-UP": {
+            "DRB.PdcpSduVolumeDL": 9000000, "DRB.PdcpSduVolumeUL": 3000000,
+            "DRB.PdcpSduDelayDl": 12},
+        "default": {
+            "VR.VCPUUsageMean": 40, "VR.VMemoryUsageMean": 60,
+            "VR.VDiskUsageMean": 30}
+    }
+    # derived counters and their base counter
+    DERIVED: Dict[str, str] = {
+        "RRU.PrbUsedDl": "RRU.PrbAvailDl",
+        "RRU.PrbUsedUl": "RRU.PrbAvailUl",
+        "RRC.ConnMax": "RRC.ConnMean",
+        "RRC.ConnEstabSucc": "RRC.ConnEstabAtt",
+        "MM.HoExeInterSucc": "MM.HoExeInterReq"
+    }
+    # counters in percent
+    PERCENTAGES: List[str] = ["VR.VCPUUsageMean", "VR.VMemoryUsageMean",
+                              "VR.VDiskUsageMean"]
+    # standard deviation of the relative change per period
+    VOLATILITY: float = 0.05
+    CHUNK_SIZE: int = 64
+
+    __network: TapiCommonContext = None
+    __folder: str = "output/pm"
+    __start: int = None
+    __periods: int = 96
+    __granularity: int = 900
+    __formats: List[str] = None
+    __workers: int = None
+    __seed: int = 0
+    __sources: Dict[str, List[Tuple[str, str]]] = None
+    __statistics: Dict[str, Union[int, float]] = None
+
+    # constructor
+    def __init__(self, network: TapiCommonContext, folder: str = "output/pm",
+                 start: int = None, periods: int = 96, granularity: int = 900,
+                 formats: List[str] = None, workers: int = None, seed: int = 0):
+        self.__network = network
+        self.__folder = folder
+        if start is None:
+            # midnight (UTC) of the current day
+            start = calendar.timegm(time.gmtime()[:3] + (0, 0, 0))
+        self.__start = start
+        self.__periods = periods
+        self.__granularity = granularity
+        self.__formats = formats or ["xml"]
+        self.__workers = workers
+        self.__seed = seed
+        self.__sources = {}
+        names = set()
+        for topology in network.topology_context().topologies():
+            for link in topology.data()["link"]:
+                node = link.configuration()["provider"]
+                if link.configuration()["name_prefix"] == "o1-file" and \
+                        node.name() not in names:
+                    names.add(node.name())
+                    self.__sources.setdefault(node.function_label(), []).append(
+                        (node.name(), node.identifier()))
+
+    # getters
+    def folder(self) -> str:
+        """
+        Getter returning the folder of the measurement files.
+        :return The path of the folder.
+        """
+        return self.__folder
+
+    def sources(self) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Getter returning the network functions with measurement files.
+        :return Name and uuid of the network functions by function label.
+        """
+        return self.__sources
+
+    def statistics(self) -> Dict[str, Union[int, float]]:
+        """
+        Getter returning the statistics of the last generation.
+        :return Number of network functions, files, bytes and wall time.
+        """
+        return self.__statistics
+
+    # methods
+    def generate(self) -> 'PmGenerator':
+        """
+        Method generating the measurement files.
+        :return The PmGenerator object.
+        """
+        os.makedirs(self.__folder, exist_ok=True)
+        start = time.perf_counter()
+        self.__statistics = {"sources": 0, "files": 0, "bytes": 0}
+        with ProcessPoolExecutor(max_workers=self.__workers) as executor:
+            futures = []
+            for function, sources in self.__sources.items():
+                counters = self.COUNTERS.get(function, self.COUNTERS["default"])
+                for index in range(0, len(sources), self.CHUNK_SIZE):
+                    # the seed of a chunk does not depend on the workers
+                    futures.append(executor.submit(
+                        generate, sources[index:index + self.CHUNK_SIZE],
+                        function, counters,
+                        [self.__seed, len(futures)], self.__start,
+                        self.__periods, self.__granularity, self.__folder,
+                        self.__formats))
+                self.__statistics["sources"] += len(sources)
+            for future in futures:
+                files, size = future.result()
+                self.__statistics["files"] += files
+                self.__statistics["bytes"] += size
+        self.__statistics["wall"] = time.perf_counter() - start
+        return self
+
+    def show(self):
+        """
+        Method printing the statistics of the last generation.
+        """
+        for key in ["sources", "files", "bytes"]:
+            print("{:<8} {:>11}".format(key, self.__statistics[key]))
+        print("{:<8} {:>10.3f}s".format("wall", self.__statistics["wall"]))
+        print("Files in '" + self.__folder + "' saved!")
@@ -0,0 +1,147 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/python
+"""
+Module containing a class profiling the generation process.
+"""
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import List, Tuple
+
+
+class Profiler:
+    """
+    Class profiling the current thread with cProfile and, at the same time,
+    with a sampling thread. The cProfile statistics are saved as '.pstats',
+    the samples as collapsed stacks ('.collapsed'), which are the input of
+    flame graph tools like flamegraph.pl or speedscope.
+    """
+
+    # the repository root, functions below it are reported as hot methods
+    ROOT: str = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+
+    __interval: float = 0.001
+    __profile: cProfile.Profile = None
+    __samples: Counter = None
+    __thread: threading.Thread = None
+    __thread_id: int = None
+    __running: threading.Event = None
+
+    # constructor
+    def __init__(self, interval: float = 0.001):
+        self.__interval = interval
+        self.__profile = cProfile.Profile()
+        self.__samples = Counter()
+        self.__running = threading.Event()
+
+    # getters
+    def stats(self) -> pstats.Stats:
+        """
+        Getter returning the cProfile statistics.
+        :return The statistics of the profiled code.
+        """
+        return pstats.Stats(self.__profile)
+
+    def samples(self) -> Counter:
+        """
+        Getter returning the sampled stacks.
+        :return Number of samples by collapsed stack (root first, ';'
+                separated).
+        """
+        return self.__samples
+
+    def hot_methods(self, limit: int = 20) -> List[Tuple[str, int, float, float]]:
+        """
+        Getter returning the functions of this project with the highest own
+        time.
+        :param limit: Maximal number of functions.
+        :return List of name, calls, own time and cumulative time in seconds.
+        """
+        result: List[Tuple[str, int, float, float]] = []
+        for (filename, line, function), entry in self.stats().stats.items():
+            if not filename.startswith(self.ROOT):
+                continue
+            module = os.path.splitext(os.path.relpath(filename, self.ROOT))[0]
+            name = module.replace(os.sep, ".") + ":" + function
+            result.append((name + ":" + str(line), entry[1], entry[2], entry[3]))
+        result.sort(key=lambda item: item[2], reverse=True)
+        return result[:limit]
+
+    # methods
+    def start(self) -> 'Profiler':
+        """
+        Method starting the profiling of the current thread.
+        :return The Profiler object.
+        """
+        self.__thread_id = threading.get_ident()
+        self.__running.set()
+        self.__thread = threading.Thread(target=self.__sample, daemon=True)
+        self.__thread.start()
+        self.__profile.enable()
+        return self
+
+    def stop(self) -> 'Profiler':
+        """
+        Method stopping the profiling.
+        :return The Profiler object.
+        """
+        self.__profile.disable()
+        self.__running.clear()
+        self.__thread.join()
+        return self
+
+    def save(self, prefix: str):
+        """
+        Method saving the cProfile statistics and the collapsed stacks.
+        :param prefix: A valid path on the system without extension.
+        :type prefix: string
+        """
+        self.__profile.dump_stats(prefix + ".pstats")
+        print("File '" + prefix + ".pstats' saved!")
+        with open(prefix + ".collapsed", "w", encoding='utf-8') as collapsed:
+            for stack, count in sorted(self.__samples.items()):
+                collapsed.write(stack + " " + str(count) + "\n")
+        print("File '" + prefix + ".collapsed' saved!")
+
+    def report(self, limit: int = 20):
+        """
+        Method printing the hot methods of this project.
+        :param limit: Maximal number of methods.
+        """
+        print("{:>8} {:>10} {:>10}  {}".format(
+            "calls", "own [s]", "cum [s]", "method"))
+        for name, calls, own, cumulative in self.hot_methods(limit):
+            print("{:>8} {:>10.4f} {:>10.4f}  {}".format(
+                calls, own, cumulative, name))
+        print(sum(self.__samples.values()), "samples taken.")
+
+    # private
+    def __sample(self):
+        while self.__running.is_set():
+            frame = sys._current_frames().get(self.__thread_id)
+            stack: List[str] = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(os.path.basename(code.co_filename) + ":" +
+                             getattr(code, "co_qualname", code.co_name))
+                frame = frame.f_back
+            if len(stack) > 0:
+                self.__samples[";".join(reversed(stack))] += 1
+            time.sleep(self.__interval)
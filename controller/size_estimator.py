@@ -0,0 +1,178 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/python
+"""
+Module containing a class estimating the size of a TAPI topology.
+"""
+from typing import Dict
+
+
+class SizeEstimator:
+    """
+    Class calculating the number of TAPI objects and the approximate output
+    and memory sizes of a topology in closed form from the configuration
+    pattern, without generating the topology. For a pattern with lists or
+    distributions the counts per branch are sampled, but no node is created.
+    """
+
+    # per network-function type: TAPI nodes, node-edge-points,
+    # connection-edge-points and links created per instance
+    # (see TapiNode subclasses and TapiTopology.__create_* methods)
+    RULES: Dict[str, Dict[str, int]] = {
+        "smo": {"node": 1, "node-edge-point": 5, "connection-edge-point": 5, "link": 0},
+        "o-cloud": {"node": 1, "node-edge-point": 1, "connection-edge-point": 1, "link": 1},
+        "near-rt-ric": {"node": 1, "node-edge-point": 3, "connection-edge-point": 5, "link": 4},
+        "o-cu": {"node": 2, "node-edge-point": 8, "connection-edge-point": 12, "link": 9},
+        "o-du": {"node": 1, "node-edge-point": 4, "connection-edge-point": 6, "link": 10},
+        "fronthaul-gateway": {"node": 1, "node-edge-point": 2, "connection-edge-point": 2, "link": 2},
+        "o-ru": {"node": 1, "node-edge-point": 2, "connection-edge-point": 2, "link": 2},
+        "user-equipment": {"node": 1, "node-edge-point": 1, "connection-edge-point": 1, "link": 1}
+    }
+
+    # network-function types and their parent type
+    PARENTS: Dict[str, str] = {
+        "smo": None,
+        "o-cloud": "smo",
+        "near-rt-ric": "smo",
+        "o-cu": "near-rt-ric",
+        "o-du": "o-cu",
+        "fronthaul-gateway": "o-du",
+        "o-ru": "fronthaul-gateway",
+        "user-equipment": "o-ru"
+    }
+
+    # approximate bytes per object, measured on generated topologies
+    JSON_BYTES: Dict[str, int] = {
+        "document": 650, "node": 1590, "node-edge-point": 930,
+        "connection-edge-point": 1210, "link": 2320}
+    SVG_BYTES: Dict[str, int] = {
+        "document": 900, "node": 370, "node-edge-point": 320,
+        "connection-edge-point": 360, "link": 240}
+    MEMORY_BYTES: Dict[str, int] = {
+        "document": 2800000, "node": 6100, "node-edge-point": 3800,
+        "connection-edge-point": 4500, "link": 9300}
+
+    __configuration: dict = None
+    __totals: Dict[str, int] = None
+
+    # constructor
+    def __init__(self, configuration: dict):
+        self.__configuration = configuration
+
+    # getters
+    def configuration(self) -> dict:
+        """
+        Getter returning the object configuration
+        :return The configuration
+        """
+        return self.__configuration
+
+    def instances(self) -> Dict[str, int]:
+        """
+        Getter returning the number of instances per network-function type.
+        A level is only generated, if its parent level is generated.
+        :return Number of instances by network-function type.
+        """
+        pattern = self.__configuration['network']['pattern']
+        if any(isinstance(value, (list, dict)) for value in pattern.values()):
+            if self.__totals is None:
+                # NumPy is only loaded for counts per branch
+                from model.python.branch_counts import BranchCounts  # pylint: disable=import-outside-toplevel
+                counts = BranchCounts(self.__configuration)
+                self.__totals = {function_type: counts.total(function_type)
+                                 for function_type in self.PARENTS}
+            return dict(self.__totals)
+        result: Dict[str, int] = {}
+        for function_type, parent in self.PARENTS.items():
+            count = pattern.get(function_type, 0)
+            if parent is not None:
+                count = count * result[parent]
+            result[function_type] = count
+        return result
+
+    def counts(self) -> Dict[str, int]:
+        """
+        Getter returning the number of TAPI objects of the topology.
+        :return Number of nodes, node-edge-points, connection-edge-points
+                and links.
+        """
+        instances = self.instances()
+        result: Dict[str, int] = {
+            "node": 0, "node-edge-point": 0, "connection-edge-point": 0, "link": 0}
+        for function_type, count in instances.items():
+            for key in result:
+                result[key] += count * self.RULES[function_type][key]
+
+        # each fronthaul gateway has a southbound node-edge-point per O-RU
+        southbound = instances["o-ru"]
+        result["node-edge-point"] += southbound
+        result["connection-edge-point"] += southbound
+        return result
+
+    def json_size(self) -> int:
+        """
+        Getter returning the approximate size of the TAPI topology json file.
+        :return Size in bytes.
+        """
+        return self.__size(self.JSON_BYTES)
+
+    def svg_size(self) -> int:
+        """
+        Getter returning the approximate size of the svg file.
+        :return Size in bytes.
+        """
+        return self.__size(self.SVG_BYTES)
+
+    def memory(self) -> int:
+        """
+        Getter returning the approximate memory required for the generation
+        of the TAPI topology and its json and svg representations.
+        :return Size in bytes.
+        """
+        return self.__size(self.MEMORY_BYTES)
+
+    def json(self) -> Dict:
+        """
+        Getter returning the estimation as json object.
+        :return The estimation as json object.
+        """
+        return {
+            "instances": self.instances(),
+            "counts": self.counts(),
+            "json-bytes": self.json_size(),
+            "svg-bytes": self.svg_size(),
+            "memory-bytes": self.memory()
+        }
+
+    # methods
+    def show(self):
+        """
+        Method printing the estimation.
+        """
+        for key, value in self.counts().items():
+            print(key + "s:", value)
+        print("json: ~" + self.__megabytes(self.json_size()), "MiB")
+        print("svg: ~" + self.__megabytes(self.svg_size()), "MiB")
+        print("memory: ~" + self.__megabytes(self.memory()), "MiB")
+
+    # private
+    def __size(self, bytes_per_object: Dict[str, int]) -> int:
+        result = bytes_per_object["document"]
+        for key, count in self.counts().items():
+            result += count * bytes_per_object[key]
+        return result
+
+    def __megabytes(self, size: int) -> str:
+        return str(round(size / 1024 / 1024, 1))
@@ -0,0 +1,317 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+#!/usr/bin/python
+"""
+Module containing a class simulating changes of the operational state of the
+nodes, node-edge-points and links of a TAPI topology.
+"""
+import json
+import random
+import time
+from typing import Dict, Iterator, List, Tuple, Union
+import numpy
+from model.python.tapi_common_context import TapiCommonContext
+from model.python.tapi_node import TapiNode
+
+NOTIFICATION: str = "".join([
+    '{"sequence-number": %d, "event-time-stamp": "%s", ',
+    '"notification-type": "ATTRIBUTE_VALUE_CHANGE", ',
+    '"target-object-type": "%s", "target-object-identifier": "%s", ',
+    '"changed-attributes": [{"value-name": "operational-state", ',
+    '"old-value": "%s", "new-value": "%s"}]}\n'])
+
+
+class StateSimulator:
+    """
+    Class simulating failures and recoveries of nodes and links and emitting
+    the resulting changes of the operational state as TAPI notifications.
+    A node is disabled, if it or one of its ancestors failed, the
+    node-edge-points follow their node, a link is disabled, if it failed or
+    one of its nodes is disabled.
+    The states are kept in NumPy arrays. The nodes are ordered depth-first,
+    so the descendants of a node are a range of the node array and the
+    node-edge-points of a range of nodes are a range of the node-edge-point
+    array. A failure increments a counter of blocked ancestors for the range,
+    a recovery decrements it.
+    """
+
+    STATES: List[str] = ["DISABLED", "ENABLED"]
+
+    __nodes: List[str] = None
+    __names: Dict[str, Tuple[str, int]] = None
+    __end: numpy.ndarray = None
+    __failed: numpy.ndarray = None
+    __blocked: numpy.ndarray = None
+    __neps: List[str] = None
+    __nep_offsets: numpy.ndarray = None
+    __links: List[str] = None
+    __link_nodes: numpy.ndarray = None
+    __link_failed: numpy.ndarray = None
+    __link_enabled: numpy.ndarray = None
+    __node_links: numpy.ndarray = None
+    __node_link_offsets: numpy.ndarray = None
+    __random: random.Random = None
+    __sequence: int = 0
+    __statistics: Dict[str, Union[int, float]] = None
+
+    # constructor
+    def __init__(self, network: TapiCommonContext, seed: int = None):
+        nodes: List[TapiNode] = []
+        links = []
+        for topology in network.topology_context().topologies():
+            nodes.extend(topology.data()["node"])
+            links.extend(topology.data()["link"])
+
+        # depth-first order, the end of the range of the descendants
+        children: Dict[str, List[TapiNode]] = {}
+        uuids = set([node.identifier() for node in nodes])
+        roots = []
+        for node in nodes:
+            parent = node.parent()
+            if parent is None or parent.identifier() not in uuids:
+                roots.append(node)
+            else:
+                children.setdefault(parent.identifier(), []).append(node)
+        order: List[TapiNode] = []
+        end: List[int] = []
+        positions: Dict[str, int] = {}
+        stack = [(node, False) for node in reversed(roots)]
+        while len(stack) > 0:
+            node, done = stack.pop()
+            if done:
+                end[positions[node.identifier()]] = len(order)
+                continue
+            positions[node.identifier()] = len(order)
+            order.append(node)
+            end.append(0)
+            stack.append((node, True))
+            stack.extend([(child, False) for child
+                          in reversed(children.get(node.identifier(), []))])
+
+        self.__nodes = [node.identifier() for node in order]
+        self.__names = {}
+        for index, node in enumerate(order):
+            self.__names[node.name()] = ("node", index)
+            self.__names[node.identifier()] = ("node", index)
+        self.__end = numpy.array(end, dtype=numpy.int64)
+        self.__failed = numpy.zeros(len(order), dtype=bool)
+        self.__blocked = numpy.zeros(len(order), dtype=numpy.int32)
+        self.__neps = []
+        nep_offsets = [0]
+        for node in order:
+            self.__neps.extend([nep.identifier() for nep
+                                in node.data()["owned-node-edge-point"]])
+            nep_offsets.append(len(self.__neps))
+        self.__nep_offsets = numpy.array(nep_offsets, dtype=numpy.int64)
+
+        self.__links = [link.identifier() for link in links]
+        self.__link_nodes = numpy.array(
+            [[positions[endpoint["node-uuid"]] for endpoint
+              in link.data()["node-edge-point"]] for link in links],
+            dtype=numpy.int64).reshape(len(links), 2)
+        for index, link in enumerate(links):
+            self.__names[link.name()] = ("link", index)
+            self.__names[link.identifier()] = ("link", index)
+        self.__link_failed = numpy.zeros(len(links), dtype=bool)
+        self.__link_enabled = numpy.ones(len(links), dtype=bool)
+        # the links of each node (compressed sparse rows)
+        ends = self.__link_nodes.reshape(-1)
+        sort = numpy.argsort(ends, kind="stable")
+        self.__node_links = sort // 2
+        self.__node_link_offsets = numpy.searchsorted(
+            ends[sort], numpy.arange(len(order) + 1))
+
+        self.__random = random.Random(seed)
+        self.__sequence = 0
+        self.__statistics = {"events": 0, "node": 0, "node-edge-point": 0,
+                             "link": 0, "wall": 0.0, "changes/s": 0.0}
+
+    # getters
+    def disabled(self) -> Dict[str, int]:
+        """
+        Getter returning the number of disabled objects.
+        :return Number of disabled nodes, node-edge-points and links.
+        """
+        nodes = self.__blocked > 0
+        counts = numpy.diff(self.__nep_offsets)
+        return {"node": int(nodes.sum()),
+                "node-edge-point": int(counts[nodes].sum()),
+                "link": int((~self.__link_enabled).sum())}
+
+    def statistics(self) -> Dict[str, Union[int, float]]:
+        """
+        Getter returning the statistics of the simulation.
+        :return Number of events and state changes per object type, wall time
+                and changes per second of the last run.
+        """
+        return self.__statistics
+
+    # methods
+    def fail(self, name: str) -> Dict[str, Tuple[numpy.ndarray, bool]]:
+        """
+        Method failing a node with its descendants or a link.
+        :param name: The name or uuid of a node or link.
+        :return The indexes of the changed objects and their new state by type.
+        """
+        return self.__change(name, True)
+
+    def recover(self, name: str) -> Dict[str, Tuple[numpy.ndarray, bool]]:
+        """
+        Method recovering a failed node or link.
+        :param name: The name or uuid of a node or link.
+        :return The indexes of the changed objects and their new state by type.
+        """
+        return self.__change(name, False)
+
+    def random_events(self, count: int, links: float = 0.3,
+                      interval: float = 1.0) -> Iterator[Dict]:
+        """
+        Method creating random events, failures of enabled objects and
+        recoveries of failed objects with the same probability.
+        :param count: The number of events.
+        :param links: The share of link events.
+        :param interval: The seconds between two events.
+        :return Iterator of events with time, operation and object name.
+        """
+        failed: List[str] = []
+        for index in range(count):
+            if len(failed) > 0 and self.__random.random() < 0.5:
+                name = failed.pop(self.__random.randrange(len(failed)))
+                yield {"time": index * interval, "operation": "recover",
+                       "name": name}
+                continue
+            if self.__random.random() < links and len(self.__links) > 0:
+                name = self.__links[self.__random.randrange(len(self.__links))]
+            else:
+                name = self.__nodes[self.__random.randrange(len(self.__nodes))]
+            if name not in failed:
+                failed.append(name)
+            yield {"time": index * interval, "operation": "fail", "name": name}
+
+    def notifications(self, events: Iterator[Dict],
+                      start: float = None) -> Iterator[str]:
+        """
+        Method applying events and returning the changes as notifications.
+        :param events: Events with time (seconds from start), operation
+                       ("fail" or "recover") and name or uuid of the object.
+        :param start: The time of the first event in seconds since the epoch,
+                      default now.
+        :return Iterator of notifications, each a json line.
+        """
+        start = time.time() if start is None else start
+        begin = time.perf_counter()
+        changes = 0
+        self.__statistics = {"events": 0, "node": 0, "node-edge-point": 0,
+                             "link": 0, "wall": 0.0, "changes/s": 0.0}
+        for event in events:
+            result = self.__change(event["name"], event["operation"] == "fail")
+            self.__statistics["events"] += 1
+            stamp = start + event.get("time", 0)
+            timestamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(stamp)) + \
+                ".%06dZ" % int((stamp % 1) * 1000000)
+            for kind, (indexes, enabled) in result.items():
+                identifiers = {"node": self.__nodes,
+                               "node-edge-point": self.__neps,
+                               "link": self.__links}[kind]
+                object_type = kind.upper().replace("-", "_")
+                old, new = self.STATES[not enabled], self.STATES[enabled]
+                self.__statistics[kind] += len(indexes)
+                changes += len(indexes)
+                for index in indexes.tolist():
+                    self.__sequence += 1
+                    yield NOTIFICATION % (self.__sequence, timestamp, object_type,
+                                          identifiers[index], old, new)
+        wall = time.perf_counter() - begin
+        self.__statistics["wall"] = wall
+        self.__statistics["changes/s"] = changes / wall if wall > 0 else 0.0
+
+    def save(self, filename: str, events: Iterator[Dict], start: float = None):
+        """
+        Method applying events and saving the notifications as JSON lines.
+        :param filename: A valid path to a file on the system.
+        :type filename: string
+        :param events: Events, see notifications().
+        :param start: The time of the first event, see notifications().
+        """
+        with open(filename, "w", encoding="utf-8", buffering=1024 * 1024) as file:
+            file.writelines(self.notifications(events, start))
+        print("Events:", self.__statistics["events"])
+        print("Changes:", ", ".join([
+            str(self.__statistics[kind]) + " " + kind
+            for kind in ["node", "node-edge-point", "link"]]))
+        print("File '" + filename + "' saved!")
+
+    def show(self):
+        """
+        Method printing the statistics of the last run.
+        """
+        for key in ["events", "node", "node-edge-point", "link"]:
+            print("{:<16} {:>11}".format(key, self.__statistics[key]))
+        print("{:<16} {:>10.3f}s".format("wall", self.__statistics["wall"]))
+        print("{:<16} {:>11.0f}".format("changes/s", self.__statistics["changes/s"]))
+
+    # private
+    def __change(self, name: str,
+                 failure: bool) -> Dict[str, Tuple[numpy.ndarray, bool]]:
+        if name not in self.__names:
+            raise ValueError("Unknown node or link: " + name)
+        kind, index = self.__names[name]
+        if kind == "link":
+            if self.__link_failed[index] == failure:
+                return {}
+            self.__link_failed[index] = failure
+            return self.__links_of(numpy.array([index], dtype=numpy.int64),
+                                   not failure)
+
+        if self.__failed[index] == failure:
+            return {}
+        self.__failed[index] = failure
+        blocked = self.__blocked[index:self.__end[index]]
+        if failure:
+            changed = numpy.flatnonzero(blocked == 0)
+            blocked += 1
+        else:
+            blocked -= 1
+            changed = numpy.flatnonzero(blocked == 0)
+        changed += index
+        result = {"node": (changed, not failure),
+                  "node-edge-point": (self.__ranges(
+                      self.__nep_offsets, changed, None), not failure)}
+        links = numpy.unique(self.__ranges(
+            self.__node_link_offsets, changed, self.__node_links))
+        result.update(self.__links_of(links, not failure))
+        return result
+
+    def __links_of(self, links: numpy.ndarray,
+                   state: bool) -> Dict[str, Tuple[numpy.ndarray, bool]]:
+        # a failure only disables and a recovery only enables objects, the
+        # changed links are returned
+        enabled = ~self.__link_failed[links] & \
+            (self.__blocked[self.__link_nodes[links, 0]] == 0) & \
+            (self.__blocked[self.__link_nodes[links, 1]] == 0)
+        changed = links[enabled != self.__link_enabled[links]]
+        self.__link_enabled[links] = enabled
+        return {"link": (changed, state)}
+
+    def __ranges(self, offsets: numpy.ndarray, rows: numpy.ndarray,
+                 values: numpy.ndarray) -> numpy.ndarray:
+        # the concatenated entries of the rows of compressed sparse rows
+        starts = offsets[rows]
+        counts = offsets[rows + 1] - starts
+        total = int(counts.sum())
+        shift = numpy.repeat(starts - numpy.cumsum(counts) + counts, counts)
+        indexes = shift + numpy.arange(total)
+        return indexes if values is None else values[indexes]
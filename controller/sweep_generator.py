@@ -0,0 +1,239 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/python
+"""
+Module containing a class generating families of TAPI topologies from a
+sweep specification.
+"""
+import hashlib
+import itertools
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Union
+from controller.batch_generator import generate
+from controller.parameter_validator import ParameterValidator
+from controller.size_estimator import SizeEstimator
+
+
+class SweepGenerator:
+    """
+    Class expanding a sweep specification into configurations and generating
+    their TAPI topologies in parallel. A specification contains a base
+    configuration ("network") and value lists or ranges for pattern keys
+    ("sweep"), e.g.
+    {"network": {...}, "sweep": {"o-du": {"from": 1, "to": 8}, "o-ru": [1, 2, 4]}}.
+    The points of the cartesian product are generated largest first, points
+    which are unchanged since the previous run are taken from the manifest.
+    """
+
+    EXTENSIONS: List[str] = [".json", ".svg", ".metadata.json"]
+    # the maximal count of a level, limited by one digit per level in the
+    # local identifiers
+    MAXIMUM: int = 8
+
+    __specification: dict = None
+    __folder: str = "output"
+    __workers: int = None
+    __points: List[Dict] = None
+
+    # constructor
+    def __init__(self, specification: dict, folder: str = "output",
+                 workers: int = None):
+        self.__specification = specification
+        self.__folder = folder
+        self.__workers = workers
+        self.__points = []
+
+    # getters
+    def specification(self) -> dict:
+        """
+        Getter returning the sweep specification.
+        :return The sweep specification as json object.
+        """
+        return self.__specification
+
+    def name(self) -> str:
+        """
+        Getter returning the name of the sweep.
+        :return The network name of the base configuration.
+        """
+        return self.__specification['network'].get('name') or "sweep"
+
+    def configurations(self) -> List[dict]:
+        """
+        Getter expanding the specification into configurations.
+        :return List of configurations, one per sweep point.
+        """
+        keys = list(self.__specification['sweep'].keys())
+        values = [self.__values(self.__specification['sweep'][key])
+                  for key in keys]
+        result: List[dict] = []
+        for point in itertools.product(*values):
+            configuration = json.loads(json.dumps(
+                {"network": self.__specification['network']}))
+            network = configuration['network']
+            network['pattern'].update(dict(zip(keys, point)))
+            network['name'] = "_".join(
+                [self.name()] + [key + "-" + str(value)
+                                 for key, value in zip(keys, point)])
+            result.append(configuration)
+        return result
+
+    def error_message(self) -> str:
+        """
+        Getter returning a message for sweep values outside of the counts of
+        a level. A local identifier has one digit per level, so a count is
+        limited to 1 to 8.
+        :return Error message or an empty string, if all values are valid.
+        """
+        messages: List[str] = []
+        for key, value in self.__specification['sweep'].items():
+            invalid = [item for item in self.__values(value)
+                       if not 1 <= item <= self.MAXIMUM]
+            if invalid:
+                messages.append(
+                    "Sweep values " + ", ".join(map(str, invalid)) + " of " +
+                    key + " are outside of 1 to " + str(self.MAXIMUM) +
+                    " (one digit per level in the local identifiers).")
+        return " ".join(messages)
+
+    def manifest(self) -> Dict:
+        """
+        Getter returning the manifest of the sweep.
+        :return Sweep points with pattern, status, files and sizes.
+        """
+        return {
+            "specification": self.__specification,
+            "point": self.__points
+        }
+
+    def manifest_file(self) -> str:
+        """
+        Getter returning the path of the manifest file.
+        :return Path of the manifest file.
+        """
+        return os.path.join(self.__folder, self.name() + ".manifest.json")
+
+    # methods
+    def generate(self) -> 'SweepGenerator':
+        """
+        Method generating all sweep points, which are not cached. Sweeps with
+        values outside of the counts of a level are rejected.
+        :return The SweepGenerator object.
+        """
+        if self.error_message():
+            raise ValueError(self.error_message())
+        os.makedirs(self.__folder, exist_ok=True)
+        cached = self.__cached_points()
+
+        self.__points = []
+        jobs: List[Dict] = []
+        for configuration in self.configurations():
+            network = configuration['network']
+            point = {
+                "name": network['name'],
+                "pattern": network['pattern'],
+                "digest": self.__digest(configuration),
+                "status": "ok"
+            }
+            self.__points.append(point)
+            validator = ParameterValidator([network['name']], configuration)
+            if not validator.is_valid():
+                point["status"] = "invalid: " + \
+                    str(validator.error_message().message)
+                continue
+            point["estimate"] = SizeEstimator(configuration).counts()
+            previous = cached.get(point["digest"])
+            if previous is not None and self.__exist(previous["file"]):
+                point["file"] = previous["file"]
+                point["status"] = "cached"
+                continue
+            jobs.append({"point": point, "configuration": configuration,
+                         "memory": SizeEstimator(configuration).memory()})
+
+        # the largest points first, so that small points fill the gaps
+        jobs.sort(key=lambda job: job["memory"], reverse=True)
+        with ProcessPoolExecutor(max_workers=self.__workers) as executor:
+            futures = [(job["point"], executor.submit(
+                generate, job["configuration"], self.__folder)) for job in jobs]
+            for point, future in futures:
+                try:
+                    point.update(future.result())
+                    point["file"] = self.__files(point["name"])
+                except Exception as error:  # pylint: disable=broad-except
+                    point["status"] = "failed: " + repr(error)
+        return self
+
+    def save(self):
+        """
+        Method saving the manifest in json format.
+        """
+        with open(self.manifest_file(), "w", encoding='utf-8') as json_file:
+            json.dump(self.manifest(), json_file, ensure_ascii=False, indent=2)
+        print("File '" + self.manifest_file() + "' saved!")
+
+    def show(self):
+        """
+        Method printing the sweep points as table.
+        """
+        width = max([len("name")] + [len(point["name"])
+                                     for point in self.__points])
+        row = "{:<" + str(width) + "} {:>6} {:>6} {:>12}  {}"
+        print(row.format("name", "nodes", "links", "json bytes", "status"))
+        for point in self.__points:
+            estimate = point.get("estimate", {})
+            json_file = point.get("file", {}).get(".json", {})
+            print(row.format(point["name"], estimate.get("node", "-"),
+                             estimate.get("link", "-"),
+                             json_file.get("bytes", "-"), point["status"]))
+
+    # private
+    def __values(self, value: Union[int, List[int], Dict[str, int]]) -> List[int]:
+        if isinstance(value, dict):
+            return list(range(value['from'], value['to'] + 1,
+                              value.get('step', 1)))
+        if isinstance(value, list):
+            return value
+        return [value]
+
+    def __digest(self, configuration: dict) -> str:
+        return hashlib.sha256(json.dumps(
+            configuration, sort_keys=True, separators=(",", ":")
+        ).encode("utf-8")).hexdigest()
+
+    def __files(self, name: str) -> Dict[str, Dict]:
+        result: Dict[str, Dict] = {}
+        for extension in self.EXTENSIONS:
+            path = os.path.join(self.__folder, name + extension)
+            if os.path.isfile(path):
+                result[extension] = {
+                    "path": path, "bytes": os.path.getsize(path)}
+        return result
+
+    def __exist(self, files: Dict[str, Dict]) -> bool:
+        for file in files.values():
+            if not os.path.isfile(file["path"]) or \
+                    os.path.getsize(file["path"]) != file["bytes"]:
+                return False
+        return len(files) > 0
+
+    def __cached_points(self) -> Dict[str, Dict]:
+        if not os.path.isfile(self.manifest_file()):
+            return {}
+        with open(self.manifest_file(), encoding="utf-8") as content:
+            manifest = json.load(content)
+        return {point["digest"]: point for point in manifest["point"]
+                if point["status"] in ["ok", "cached"]}
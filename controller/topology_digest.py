@@ -0,0 +1,207 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+#!/usr/bin/python
+"""
+Module containing a class calculating Merkle digests of a TAPI topology.
+"""
+import hashlib
+import json
+from typing import Dict, List
+from controller import instrumentation
+from model.python.tapi_common_context import TapiCommonContext
+from model.python.tapi_node import TapiNode
+from model.python.tapi_topology import TapiTopology
+
+
+class TopologyDigest:
+    """
+    Class calculating a content hash for each TAPI Node subtree and rolling
+    the hashes up along the network-function hierarchy (SMO, Near-RT-RIC,
+    O-CU, O-DU, ...) into Merkle digests.
+    A node hash covers the node, its NEPs/CEPs and its incident links. The
+    digest of a node covers its own hash and the digests of its children.
+    The json objects of the nodes and links are taken from the json output,
+    if it is passed, instead of building them again.
+    """
+
+    ALGORITHM: str = "sha256"
+
+    __network: TapiCommonContext = None
+    __topologies: Dict[str, Dict] = None
+
+    # constructor
+    def __init__(self, network: TapiCommonContext, document: Dict = None):
+        self.__network = network
+        self.__topologies = {}
+        if document is not None:
+            for topology in document["tapi-common:context"][
+                    "tapi-topology:topology-context"]["topology"]:
+                self.__topologies[topology["uuid"]] = topology
+
+    # getters
+    def network(self) -> TapiCommonContext:
+        """
+        Getter returning the network the digests are calculated for.
+        :return The TapiCommonContext object.
+        """
+        return self.__network
+
+    def json(self) -> Dict:
+        """
+        Method calculating the Merkle tree of all topologies of the network.
+        :return Merkle tree as json object, keyed by topology name.
+        """
+        topologies = {}
+        for topology in self.__network.topology_context().topologies():
+            topologies[topology.name()] = self.__topology_tree(topology)
+        return {
+            "algorithm": self.ALGORITHM,
+            "digest": self.__hash("".join(
+                [tree["digest"] for tree in topologies.values()])),
+            "topology": topologies
+        }
+
+    def metadata(self) -> Dict:
+        """
+        Getter returning the output metadata: the network configuration and
+        the Merkle tree.
+        :return Output metadata as json object.
+        """
+        return {
+            "network": self.__network.configuration()['network'],
+            "merkle": self.json()
+        }
+
+    def save(self, filename: str):
+        """
+        Method saving the digests as output metadata in json format.
+        :param filename: A valid path to a file on the system.
+        :type filename: string
+        """
+        with instrumentation.phase("metadata"):
+            metadata = self.metadata()
+        with open(filename, "w", encoding='utf-8') as json_file:
+            json.dump(metadata, json_file, ensure_ascii=False, indent=2)
+        print("File '" + filename + "' saved!")
+
+    # methods
+    @staticmethod
+    def compare(old: Dict, new: Dict) -> Dict[str, List[str]]:
+        """
+        Method comparing two Merkle trees top-down. The comparison descends
+        only into branches whose digests differ.
+        :param old: Merkle tree (json) of the previous topology.
+        :param new: Merkle tree (json) of the current topology.
+        :return Names of added, removed and changed nodes. Added and removed
+                subtrees are reported by their root node only.
+        """
+        result: Dict[str, List[str]] = {
+            "added": [], "removed": [], "changed": []}
+        if old["digest"] == new["digest"]:
+            return result
+        for name, tree in new["topology"].items():
+            if name in old["topology"]:
+                TopologyDigest.__compare_children(
+                    old["topology"][name]["children"], tree["children"], result)
+            else:
+                result["added"].extend(tree["children"].keys())
+        for name, tree in old["topology"].items():
+            if name not in new["topology"]:
+                result["removed"].extend(tree["children"].keys())
+        return result
+
+    # private
+    @staticmethod
+    def __compare_children(old: Dict, new: Dict, result: Dict[str, List[str]]):
+        for name, branch in new.items():
+            if name not in old:
+                result["added"].append(name)
+            elif branch["digest"] != old[name]["digest"]:
+                if branch["node-digest"] != old[name]["node-digest"]:
+                    result["changed"].append(name)
+                TopologyDigest.__compare_children(
+                    old[name]["children"], branch["children"], result)
+        for name in old:
+            if name not in new:
+                result["removed"].append(name)
+
+    def __hash(self, content: str) -> str:
+        return hashlib.new(self.ALGORITHM, content.encode("utf-8")).hexdigest()
+
+    def __canonical(self, content) -> str:
+        return json.dumps(content, sort_keys=True, separators=(",", ":"),
+                          ensure_ascii=False)
+
+    def __topology_tree(self, topology: TapiTopology) -> Dict:
+        nodes: List[TapiNode] = topology.data()["node"]
+        document = self.__topologies.get(topology.identifier())
+        if document is None:
+            links: List[Dict] = [
+                link.json() for link in topology.data()["link"]]
+            jsons: Dict[str, Dict] = {
+                node.identifier(): node.json() for node in nodes}
+        else:
+            links = document["link"]
+            jsons = {node["uuid"]: node for node in document["node"]}
+
+        links_by_node: Dict[str, List[Dict]] = {}
+        for link in links:
+            for endpoint in link["node-edge-point"]:
+                links_by_node.setdefault(
+                    endpoint["node-uuid"], []).append(link)
+
+        # a node without parent in the topology is a root, e.g. the root of
+        # a generated subtree
+        children_by_node: Dict[str, List[TapiNode]] = {}
+        roots: List[TapiNode] = []
+        for node in nodes:
+            if node.parent() is None or \
+                    node.parent().identifier() not in jsons:
+                roots.append(node)
+            else:
+                children_by_node.setdefault(
+                    node.parent().identifier(), []).append(node)
+
+        children = self.__branches(roots, children_by_node, links_by_node,
+                                   jsons)
+        return {
+            "uuid": topology.identifier(),
+            "digest": self.__hash("".join(
+                [branch["digest"] for branch in children.values()])),
+            "children": children
+        }
+
+    def __branches(self, nodes: List[TapiNode],
+                   children_by_node: Dict[str, List[TapiNode]],
+                   links_by_node: Dict[str, List[Dict]],
+                   jsons: Dict[str, Dict]) -> Dict[str, Dict]:
+        result: Dict[str, Dict] = {}
+        for node in sorted(nodes, key=lambda node: node.name()):
+            incident = sorted(links_by_node.get(node.identifier(), []),
+                              key=lambda link: link["name"][0]["value"])
+            node_digest = self.__hash(self.__canonical(
+                {"node": jsons[node.identifier()], "link": incident}))
+            children = self.__branches(
+                children_by_node.get(node.identifier(), []),
+                children_by_node, links_by_node, jsons)
+            result[node.name()] = {
+                "uuid": node.identifier(),
+                "node-digest": node_digest,
+                "digest": self.__hash("".join(
+                    [node_digest] +
+                    [branch["digest"] for branch in children.values()])),
+                "children": children
+            }
+        return result
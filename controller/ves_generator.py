@@ -0,0 +1,293 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+#!/usr/bin/python
+"""
+Module containing a class sending VES events of the network functions of a
+generated TAPI topology to a VES collector.
+"""
+import asyncio
+import http.client
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple, Union
+from urllib.parse import urlsplit
+from model.python.tapi_common_context import TapiCommonContext
+from model.python.tapi_node import TapiNode
+
+
+class VesGenerator:
+    """
+    Class generating VES events (heartbeat, fault and stateChange) for each
+    network function with an "o1-ves" link to the SMO and posting them to a
+    VES collector with a configured aggregate rate. The events are posted
+    one by one or as event batches over a pool of keep-alive connections,
+    the number of connections caps the concurrent requests. If the collector
+    is slower than the rate, the events are sent late and the delay is
+    reported.
+    """
+
+    MIX: Dict[str, float] = {"heartbeat": 0.6, "fault": 0.2, "stateChange": 0.2}
+    SEVERITIES: List[str] = ["CRITICAL", "MAJOR", "MINOR", "WARNING", "NORMAL"]
+    VERSION: str = "7.2.1"
+
+    __network: TapiCommonContext = None
+    __url: str = None
+    __rate: float = 100.0
+    __duration: float = 10.0
+    __batch_size: int = 1
+    __connections: int = 4
+    __mix: Dict[str, float] = None
+    __timeout: float = 10.0
+    __random: random.Random = None
+    __sources: List[Tuple[TapiNode, List[str]]] = None
+    __sequence: Dict[str, int] = None
+    __pool: asyncio.Queue = None
+    __executor: ThreadPoolExecutor = None
+    __latencies: List[float] = None
+    __statistics: Dict[str, Union[int, float]] = None
+
+    # constructor
+    def __init__(self, network: TapiCommonContext, url: str, rate: float = 100.0,
+                 duration: float = 10.0, batch_size: int = 1,
+                 connections: int = 4, mix: Dict[str, float] = None,
+                 timeout: float = 10.0, seed: int = None):
+        self.__network = network
+        self.__url = url
+        self.__rate = rate
+        self.__duration = duration
+        self.__batch_size = batch_size
+        self.__connections = connections
+        self.__mix = mix or self.MIX
+        self.__timeout = timeout
+        self.__random = random.Random(seed)
+        # a network function may have several o1-ves links
+        sources: Dict[str, Tuple[TapiNode, List[str]]] = {}
+        for topology in network.topology_context().topologies():
+            for link in topology.data()["link"]:
+                if link.configuration()["name_prefix"] == "o1-ves":
+                    node = link.configuration()["consumer"]
+                    sources[node.identifier()] = (node, [
+                        nep.name() for nep in node.data()["owned-node-edge-point"]])
+        self.__sources = list(sources.values())
+        self.__sequence = {}
+
+    # getters
+    def url(self) -> str:
+        """
+        Getter returning the url of the VES collector, e.g.
+        "http://127.0.0.1:8443/eventListener/v7".
+        :return URL as string.
+        """
+        return self.__url
+
+    def sources(self) -> List[TapiNode]:
+        """
+        Getter returning the network functions sending VES events.
+        :return List of TAPI Nodes.
+        """
+        return [node for node, _ in self.__sources]
+
+    def statistics(self) -> Dict[str, Union[int, float]]:
+        """
+        Getter returning the statistics of the last run.
+        :return Number of events per domain, requests, failed requests, bytes
+                sent, wall time, achieved rate, latencies and maximal delay.
+        """
+        return self.__statistics
+
+    def event(self, domain: str, node: TapiNode = None,
+              interfaces: List[str] = None) -> Dict:
+        """
+        Getter returning a new VES event of a network function.
+        :param domain: "heartbeat", "fault" or "stateChange".
+        :param node: The TAPI Node, default a random source.
+        :param interfaces: The names of the node-edge-points of the node.
+        :return The VES event as json object.
+        """
+        if node is None:
+            node, interfaces = self.__random.choice(self.__sources)
+        name = node.name()
+        sequence = self.__sequence.get(name, 0)
+        self.__sequence[name] = sequence + 1
+        now = int(time.time() * 1000000)
+        header = {
+            "domain": domain,
+            "eventId": "_".join([domain, name, str(sequence)]),
+            "eventName": "_".join([domain, node.function_label()]),
+            "eventType": node.function_label(),
+            "sequence": sequence,
+            "priority": "Normal",
+            "reportingEntityId": node.identifier(),
+            "reportingEntityName": name,
+            "sourceId": node.identifier(),
+            "sourceName": name,
+            "startEpochMicrosec": now,
+            "lastEpochMicrosec": now,
+            "nfNamingCode": node.function_label(),
+            "timeZoneOffset": "+00:00",
+            "version": "4.1",
+            "vesEventListenerVersion": self.VERSION}
+        event: Dict = {"commonEventHeader": header}
+        if domain == "heartbeat":
+            event["heartbeatFields"] = {
+                "heartbeatFieldsVersion": "3.0",
+                "heartbeatInterval": 60}
+        elif domain == "fault":
+            severity = self.__random.choice(self.SEVERITIES)
+            header["priority"] = "High" if severity == "CRITICAL" else "Normal"
+            event["faultFields"] = {
+                "faultFieldsVersion": "4.0",
+                "alarmCondition": "interface-down",
+                "alarmInterfaceA": self.__random.choice(interfaces or [name]),
+                "eventSourceType": node.function_label(),
+                "specificProblem": "Link to peer lost",
+                "eventSeverity": severity,
+                "vfStatus": "Active"}
+        else:
+            in_service = self.__random.random() < 0.5
+            event["stateChangeFields"] = {
+                "stateChangeFieldsVersion": "4.0",
+                "stateInterface": self.__random.choice(interfaces or [name]),
+                "oldState": "outOfService" if in_service else "inService",
+                "newState": "inService" if in_service else "outOfService"}
+        return {"event": event}
+
+    # methods
+    def run(self) -> 'VesGenerator':
+        """
+        Method sending the events for the configured duration.
+        :return The VesGenerator object.
+        """
+        asyncio.run(self.send())
+        return self
+
+    async def send(self):
+        """
+        Coroutine sending the events, for callers with an event loop.
+        """
+        parts = urlsplit(self.__url)
+        path = parts.path or "/"
+        if self.__batch_size > 1:
+            path = path.rstrip("/") + "/eventBatch"
+        self.__latencies = []
+        self.__statistics = {"requests": 0, "failed": 0, "delivered": 0,
+                             "bytes": 0, "delay-max": 0.0}
+        self.__statistics.update({domain: 0 for domain in self.__mix})
+
+        connection_class = http.client.HTTPSConnection \
+            if parts.scheme == "https" else http.client.HTTPConnection
+        self.__pool = asyncio.Queue()
+        for _ in range(self.__connections):
+            self.__pool.put_nowait(connection_class(
+                parts.hostname, parts.port, timeout=self.__timeout))
+        self.__executor = ThreadPoolExecutor(self.__connections)
+
+        domains = list(self.__mix.keys())
+        weights = list(self.__mix.values())
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        tasks = set()
+        index = 0
+        try:
+            while len(self.__sources) > 0:
+                # each request has its due time, calculated from the rate
+                due = start + index * self.__batch_size / self.__rate
+                if due - start >= self.__duration:
+                    break
+                delay = due - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                connection = await self.__pool.get()
+                self.__statistics["delay-max"] = max(
+                    self.__statistics["delay-max"], loop.time() - due)
+                events = []
+                for domain in self.__random.choices(
+                        domains, weights, k=self.__batch_size):
+                    events.append(self.event(domain)["event"])
+                    self.__statistics[domain] += 1
+                body = {"event": events[0]} if self.__batch_size == 1 \
+                    else {"eventList": events}
+                task = asyncio.ensure_future(
+                    self.__send(connection, path, body, len(events)))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                index += 1
+            await asyncio.gather(*tasks)
+        finally:
+            while not self.__pool.empty():
+                self.__pool.get_nowait().close()
+            self.__executor.shutdown()
+
+        wall = loop.time() - start
+        latencies = sorted(self.__latencies) or [0.0]
+        self.__statistics.update({
+            "events": sum([self.__statistics[domain] for domain in domains]),
+            "wall": wall,
+            "latency-p50": latencies[len(latencies) // 2],
+            "latency-p99": latencies[int(len(latencies) * 0.99)],
+            "latency-max": latencies[-1]})
+        # attempted and delivered (successful requests only) rates
+        self.__statistics["events/s"] = self.__statistics["events"] / wall
+        self.__statistics["delivered/s"] = self.__statistics["delivered"] / wall
+
+    def show(self):
+        """
+        Method printing the statistics of the last run.
+        """
+        for key in list(self.__mix.keys()) + ["events", "delivered", "requests",
+                                              "failed", "bytes"]:
+            print("{:<12} {:>11}".format(key, self.__statistics[key]))
+        for key in ["wall", "latency-p50", "latency-p99", "latency-max",
+                    "delay-max"]:
+            print("{:<12} {:>10.3f}s".format(key, self.__statistics[key]))
+        for key in ["events/s", "delivered/s"]:
+            print("{:<12} {:>11.1f}".format(key, self.__statistics[key]))
+
+    # private
+    async def __send(self, connection: http.client.HTTPConnection, path: str,
+                     body: Dict, events: int):
+        try:
+            loop = asyncio.get_running_loop()
+            status, size = await loop.run_in_executor(
+                self.__executor, self.__request, connection, path, body)
+        finally:
+            self.__pool.put_nowait(connection)
+        self.__statistics["requests"] += 1
+        self.__statistics["bytes"] += size
+        if status == 0 or status >= 400:
+            self.__statistics["failed"] += 1
+        else:
+            self.__statistics["delivered"] += events
+
+    def __request(self, connection: http.client.HTTPConnection, path: str,
+                  body: Dict) -> Tuple[int, int]:
+        # executed in a thread of the executor, the body is encoded here
+        content = json.dumps(body).encode("utf-8")
+        start = time.perf_counter()
+        try:
+            connection.request("POST", path, content,
+                               {"Content-Type": "application/json"})
+            response = connection.getresponse()
+            response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            # the connection is opened again by the next request
+            connection.close()
+            status = 0
+        self.__latencies.append(time.perf_counter() - start)
+        return status, len(content)
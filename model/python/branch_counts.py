@@ -0,0 +1,228 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+#!/usr/bin/python
+"""
+Module containing a class providing the number of children per branch of an
+irregular pattern.
+"""
+from typing import Dict, List, Tuple, Union
+import numpy
+
+
+class BranchCounts:
+    """
+    Class providing the number of children of each node for a pattern with
+    counts per branch. A level of the pattern is a number (the same count
+    below all parents), a list of counts (per parent in the order of the
+    parents, repeated if shorter) or a distribution. The counts of a level are
+    sampled with NumPy for all parents at once and stored as offsets: the
+    children of the parent with the index i within its level have the indexes
+    offsets[i] to offsets[i + 1] - 1 within their level. A digit of a local
+    identifier is the index of a node below its parent, so the index of a node
+    within its level is a single offset lookup per level.
+    """
+
+    # network-function types and their parent type
+    PARENTS: Dict[str, str] = {
+        "smo": None,
+        "o-cloud": "smo",
+        "near-rt-ric": "smo",
+        "o-cu": "near-rt-ric",
+        "o-du": "o-cu",
+        "fronthaul-gateway": "o-du",
+        "o-ru": "fronthaul-gateway",
+        "user-equipment": "o-ru"
+    }
+    # network-function types in hierarchical order, the O-Cloud is beside
+    # the Near-RT-RIC
+    LEVELS: List[str] = [level for level in PARENTS if level != "o-cloud"]
+    DISTRIBUTIONS: List[str] = ["uniform", "poisson", "zipf"]
+    DEFAULTS: Dict = {
+        "minimum": 1,
+        "maximum": 8,
+        "mean": 3.0,
+        "exponent": 1.5,
+        "seed": 0
+    }
+
+    __pattern: Dict[str, Union[int, List[int], Dict]] = None
+    __offsets: Dict[str, numpy.ndarray] = None
+
+    # constructor
+    def __init__(self, configuration: dict):
+        self.__pattern = configuration['network']['pattern']
+        self.__offsets = {}
+        for number, (level, parent) in enumerate(self.PARENTS.items()):
+            # a level is only generated, if its parent level is generated
+            if level not in self.__pattern or \
+                    (parent is not None and parent not in self.__offsets):
+                continue
+            parents = 1 if parent is None else self.total(parent)
+            counts = self.__sample(number, self.__pattern[level], parents)
+            self.__offsets[level] = numpy.concatenate(
+                [[0], numpy.cumsum(counts)]).astype(numpy.int64)
+
+    # getters
+    def pattern(self) -> Dict[str, Union[int, List[int], Dict]]:
+        """
+        Getter returning the pattern of the configuration.
+        :return Count, list of counts or distribution by network-function type.
+        """
+        return self.__pattern
+
+    def offsets(self, node_type: str) -> numpy.ndarray:
+        """
+        Getter returning the offsets of the children of a level.
+        :param node_type: The network function type, e.g. "o-du" or "o-ru".
+        :return Index of the first child per parent and the number of
+                instances as last value.
+        """
+        return self.__offsets.get(self.__level(node_type),
+                                  numpy.zeros(1, dtype=numpy.int64))
+
+    def counts(self, node_type: str) -> numpy.ndarray:
+        """
+        Getter returning the number of children per parent of a level.
+        :param node_type: The network function type, e.g. "o-du" or "o-ru".
+        :return Counts in the order of the parents.
+        """
+        return numpy.diff(self.offsets(node_type))
+
+    def total(self, node_type: str) -> int:
+        """
+        Getter returning the number of instances of a level.
+        :param node_type: The network function type, e.g. "o-du" or "o-ru".
+        :return Number of instances.
+        """
+        return int(self.offsets(node_type)[-1])
+
+    def index(self, node_type: str, local_id: str) -> int:
+        """
+        Getter returning the index of a node within its level.
+        :param node_type: The network function type, e.g. "o-du" or "o-cu-cp".
+        :param local_id: The local identifier of the node in the hierarchy.
+        :return Index in the order of generation.
+        """
+        result = 0
+        for digit, level in zip(local_id, self.__levels(node_type)):
+            result = self.__offsets[level].item(result) + int(digit)
+        return result
+
+    def count(self, node_type: str, parent_local_id: str) -> int:
+        """
+        Getter returning the number of children of a type below a parent.
+        :param node_type: The network function type of the children.
+        :param parent_local_id: The local identifier of the parent, empty for
+                                the root level.
+        :return Number of children.
+        """
+        level = self.__level(node_type)
+        if level not in self.__offsets:
+            return 0
+        parent = 0
+        if parent_local_id:
+            parent = self.index(self.PARENTS[level], parent_local_id)
+        offsets = self.__offsets[level]
+        return offsets.item(parent + 1) - offsets.item(parent)
+
+    def layout(self, boxes: Dict[str, numpy.ndarray]) -> \
+            Tuple[Dict[str, numpy.ndarray], float]:
+        """
+        Getter returning the horizontal position of the nodes. Bottom-up, a
+        subtree gets the width of the box of its root or the sum of the widths
+        of its child subtrees, whichever is larger. Top-down, the children are
+        centered within the width of their parent. The O-Clouds of an SMO share
+        its width in equal parts.
+        :param boxes: The box width per node by level, e.g. boxes["o-du"][i]
+                      for the O-DU with the index i.
+        :return Center per node by level, relative to the left edge of the
+                first subtree, and the width of all subtrees.
+        """
+        levels = [level for level in self.LEVELS if level in self.__offsets]
+        widths: Dict[str, numpy.ndarray] = {}
+        child = None
+        for level in reversed(levels):
+            width = boxes[level].astype(float)
+            if child is not None:
+                width = numpy.maximum(width, self.__sums(child, widths[child]))
+            if level == "smo" and "o-cloud" in self.__offsets:
+                width = numpy.maximum(
+                    width, self.counts("o-cloud") * boxes["o-cloud"].max(initial=0))
+            widths[level] = width
+            child = level
+
+        lefts = {levels[0]: numpy.cumsum(widths[levels[0]]) - widths[levels[0]]}
+        for parent, level in zip(levels, levels[1:]):
+            offsets = self.__offsets[level]
+            ends = numpy.cumsum(widths[level])
+            margins = (widths[parent] - self.__sums(level, widths[level])) / 2
+            starts = numpy.concatenate([[0.0], ends])[offsets[:-1]]
+            lefts[level] = ends - widths[level] + numpy.repeat(
+                lefts[parent] + margins - starts, numpy.diff(offsets))
+        centers = {level: lefts[level] + widths[level] / 2
+                   for level in levels}
+
+        if "o-cloud" in self.__offsets:
+            offsets = self.__offsets["o-cloud"]
+            counts = numpy.diff(offsets)
+            parts = numpy.repeat(
+                widths["smo"] / numpy.maximum(counts, 1), counts)
+            ranks = numpy.arange(offsets[-1]) - numpy.repeat(offsets[:-1], counts)
+            centers["o-cloud"] = numpy.repeat(lefts["smo"], counts) + \
+                (ranks + 0.5) * parts
+        return centers, float(widths[levels[0]].sum())
+
+    # private
+    def __level(self, node_type: str) -> str:
+        if node_type in ["o-cu-cp", "o-cu-up"]:
+            return "o-cu"
+        return node_type
+
+    def __levels(self, node_type: str) -> List[str]:
+        level = self.__level(node_type)
+        if level == "o-cloud":
+            return ["smo", "o-cloud"]
+        return self.LEVELS[:self.LEVELS.index(level) + 1]
+
+    def __sums(self, level: str, values: numpy.ndarray) -> numpy.ndarray:
+        # sum of the values of the children per parent
+        ends = numpy.concatenate([[0], numpy.cumsum(values)])
+        offsets = self.__offsets[level]
+        return ends[offsets[1:]] - ends[offsets[:-1]]
+
+    def __sample(self, number: int, value: Union[int, List[int], Dict],
+                 size: int) -> numpy.ndarray:
+        if isinstance(value, list):
+            return numpy.resize(numpy.array(value, dtype=numpy.int64), size)
+        if not isinstance(value, dict):
+            return numpy.full(size, value, dtype=numpy.int64)
+        settings = dict(self.DEFAULTS)
+        settings.update(value)
+        # the level is part of the seed, so levels with the same settings
+        # are sampled independently
+        random = numpy.random.default_rng([settings["seed"], number])
+        minimum, maximum = settings["minimum"], settings["maximum"]
+        if settings["distribution"] == "uniform":
+            return random.integers(minimum, maximum + 1, size)
+        if settings["distribution"] == "poisson":
+            return numpy.clip(random.poisson(settings["mean"], size),
+                              minimum, maximum)
+        if settings["distribution"] == "zipf":
+            # truncated to the counts between minimum and maximum
+            values = numpy.arange(minimum, maximum + 1)
+            weights = values.astype(float) ** -float(settings["exponent"])
+            return random.choice(values, size, p=weights / weights.sum())
+        raise ValueError("Unknown distribution " + str(settings["distribution"]))
@@ -0,0 +1,181 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+#!/usr/bin/python
+"""
+Module containing a class calculating the geographic location of the nodes
+of a TAPI topology.
+"""
+import math
+from typing import Dict, Tuple
+import numpy
+from model.python.branch_counts import BranchCounts
+
+
+class GeoPlacement:
+    """
+    Class placing the network functions in an area: SMO, O-Cloud and
+    Near-RT-RIC in data centers, the O-CU at its Near-RT-RIC, the O-DU and
+    the fronthaul gateway at a cell site, the O-RU around its site and the
+    UE around its O-RU.
+    The data centers are sampled from the seed. The locations of a level are
+    sampled with NumPy for all nodes of the level at once, when the first
+    node of the level is placed. The random numbers of a node are a
+    counter-based hash (SplitMix64) of the seed, the level and the local
+    identifier of the node only, so a node keeps its location, if the
+    pattern changes, and is placed at the same location in a subtree or an
+    incremental generation.
+    """
+
+    METERS_PER_DEGREE: float = 111320.0
+    DEFAULTS: Dict = {
+        "area": {"west": 7.0, "south": 50.0, "east": 8.0, "north": 51.0},
+        "data-centers": 2,
+        "site-radius": 200,
+        "cell-radius": 1000,
+        "altitude": 20000,
+        "seed": 0
+    }
+    # the descendants are placed relative to the location of their parent
+    PARENTS: Dict[str, str] = {
+        "o-cu": "near-rt-ric",
+        "fronthaul-gateway": "o-du",
+        "o-ru": "fronthaul-gateway",
+        "user-equipment": "o-ru"
+    }
+    # constants of the SplitMix64 hash
+    GOLDEN: numpy.uint64 = numpy.uint64(0x9e3779b97f4a7c15)
+    MIX: Tuple[numpy.uint64, numpy.uint64] = (
+        numpy.uint64(0xbf58476d1ce4e5b9), numpy.uint64(0x94d049bb133111eb))
+
+    __settings: Dict = None
+    __counts: BranchCounts = None
+    __centers: numpy.ndarray = None
+    __keys: Dict[str, numpy.ndarray] = None
+    __locations: Dict[str, numpy.ndarray] = None
+
+    # constructor
+    def __init__(self, configuration: dict, counts: BranchCounts = None):
+        self.__settings = dict(self.DEFAULTS)
+        self.__settings.update(configuration['network'].get('geolocation', {}))
+        self.__counts = counts if counts is not None else \
+            BranchCounts(configuration)
+        area = self.__settings["area"]
+        random = numpy.random.default_rng(self.__settings["seed"])
+        size = self.__settings["data-centers"]
+        self.__centers = numpy.column_stack([
+            random.uniform(area["west"], area["east"], size),
+            random.uniform(area["south"], area["north"], size)])
+        self.__keys = {}
+        self.__locations = {}
+
+    # getters
+    def settings(self) -> Dict:
+        """
+        Getter returning the placement settings including the defaults.
+        :return Area, number of data centers, radii, altitude and seed.
+        """
+        return self.__settings
+
+    def locations(self, node_type: str) -> numpy.ndarray:
+        """
+        Getter returning the locations of all nodes of a level.
+        :param node_type: The network function type, e.g. "o-du" or "o-cu-cp".
+        :return Longitude and latitude in degrees per node in the order of
+                generation.
+        """
+        level = "o-cu" if node_type in ["o-cu-cp", "o-cu-up"] else node_type
+        if level not in self.__locations:
+            self.__locations[level] = self.__place(level)
+        return self.__locations[level]
+
+    def location(self, node_type: str, local_id: str) -> Tuple[float, float]:
+        """
+        Getter returning the location of a node.
+        :param node_type: The network function type, e.g. "o-du" or "o-cu-cp".
+        :param local_id: The local identifier of the node in the hierarchy.
+        :return Longitude and latitude in degrees.
+        """
+        longitude, latitude = self.locations(node_type)[
+            self.__counts.index(node_type, local_id)]
+        return (float(longitude), float(latitude))
+
+    def geolocation(self, node_type: str, local_id: str) -> Dict[str, str]:
+        """
+        Getter returning the geolocation of a node for the TAPI topology.
+        :param node_type: The network function type, e.g. "o-du" or "o-cu-cp".
+        :param local_id: The local identifier of the node in the hierarchy.
+        :return Longitude, latitude and altitude as json object.
+        """
+        longitude, latitude = self.location(node_type, local_id)
+        return {"longitude": "%.6f" % longitude,
+                "latitude": "%.6f" % latitude,
+                "altitude": str(self.__settings["altitude"])}
+
+    # private
+    def __place(self, level: str) -> numpy.ndarray:
+        area = self.__settings["area"]
+        if level in ["smo", "o-cloud", "near-rt-ric"]:
+            choice = self.__uniform(level, 0) * len(self.__centers)
+            return self.__centers[choice.astype(numpy.int64)]
+        if level == "o-du":
+            return numpy.column_stack([
+                area["west"] + self.__uniform(level, 0) *
+                (area["east"] - area["west"]),
+                area["south"] + self.__uniform(level, 1) *
+                (area["north"] - area["south"])])
+        result = numpy.repeat(self.locations(self.PARENTS[level]),
+                              self.__counts.counts(level), axis=0)
+        radius = {"o-ru": self.__settings["site-radius"],
+                  "user-equipment": self.__settings["cell-radius"]}
+        if level in radius:
+            # offset in meters, uniformly distributed in a disc
+            distance = radius[level] * numpy.sqrt(self.__uniform(level, 0))
+            angle = 2 * math.pi * self.__uniform(level, 1)
+            result[:, 0] += distance * numpy.cos(angle) / \
+                self.METERS_PER_DEGREE / numpy.cos(numpy.radians(result[:, 1]))
+            result[:, 1] += distance * numpy.sin(angle) / self.METERS_PER_DEGREE
+        return result
+
+    def __key(self, level: str) -> numpy.ndarray:
+        # the local identifier of each node of a level as decimal number, a
+        # digit is the index of a node below its parent
+        if level not in self.__keys:
+            parent = BranchCounts.PARENTS[level]
+            offsets = self.__counts.offsets(level)
+            counts = numpy.diff(offsets)
+            ranks = numpy.arange(offsets[-1], dtype=numpy.uint64) - \
+                numpy.repeat(offsets[:-1], counts).astype(numpy.uint64)
+            if parent is None:
+                self.__keys[level] = ranks
+            else:
+                self.__keys[level] = numpy.repeat(
+                    self.__key(parent), counts) * numpy.uint64(10) + ranks
+        return self.__keys[level]
+
+    def __uniform(self, level: str, draw: int) -> numpy.ndarray:
+        # independent of the other nodes and of the pattern
+        value = numpy.full(len(self.__key(level)),
+                           self.__settings["seed"] % 2**64, dtype=numpy.uint64)
+        for part in [numpy.uint64(list(BranchCounts.PARENTS).index(level)),
+                     self.__key(level), numpy.uint64(draw)]:
+            value = self.__mix(value ^ part)
+        return (value >> numpy.uint64(11)) * 2.0**-53
+
+    def __mix(self, value: numpy.ndarray) -> numpy.ndarray:
+        value = value + self.GOLDEN
+        value = (value ^ (value >> numpy.uint64(30))) * self.MIX[0]
+        value = (value ^ (value >> numpy.uint64(27))) * self.MIX[1]
+        return value ^ (value >> numpy.uint64(31))
@@ -18,32 +18,38 @@
 """
 Module for a class representing a TAPI Common Context
 """
-from typing import Dict, Union
+from typing import Callable, Dict, TYPE_CHECKING, Union
 import uuid
 from xml.dom.minidom import Element
-from lxml import etree
 from model.python.tapi_topology_context import TapiTopologyContext
 from model.python.top import Top
 
+if TYPE_CHECKING:
+    from lxml import etree
+
 
 class TapiCommonContext(Top):
     """
     Class representing a TAPI Common Context object.
     """
 
-    __configuration: dict = {}
+    __configuration: dict = None
     __context: TapiTopologyContext = None
-    __data: dict = {
-        "tapi-common:context": {
-            "uuid": str(uuid.uuid4()),
-            "name": [{"value-name": "context-name",
-                      "value": "Generated Topology"}]}}
+    __data: dict = None
 
     # constructor
-    def __init__(self, configuration: Dict[str, Union[str, Dict[str, int]]]):
+    def __init__(self, configuration: Dict[str, Union[str, Dict[str, int]]],
+                 listener: Callable[[str, Top], None] = None):
         super().__init__(configuration)
         self.__configuration = configuration
-        self.__context = TapiTopologyContext(configuration)
+        self.__data = {
+            "tapi-common:context": {
+                "uuid": str(uuid.uuid4()),
+                "name": [{"value-name": "context-name",
+                          "value": "Generated Topology"}]}}
+        if listener is not None:
+            listener("context", self)
+        self.__context = TapiTopologyContext(configuration, listener)
 
     # getter
     def configuration(self) -> Dict[str, Dict]:
@@ -65,7 +71,8 @@ class TapiCommonContext(Top):
         Getter for a json object representing the TAPI Topology Context.
         :return TAPI Common Context as json object.
         """
-        result = self.data().copy()
+        result = {"tapi-common:context": self.data()[
+            "tapi-common:context"].copy()}
         if self.__context is not None:
             result["tapi-common:context"].update(self.__context.json())
         return result
@@ -85,17 +92,27 @@ class TapiCommonContext(Top):
         return self.data()["tapi-common:context"]["name"][0]["value"]
 
     def __svg_width(self) -> int:
-        p = self.configuration()['network']['pattern']
-        return (p['smo'] * p['near-rt-ric'] * p['o-cu'] * p['o-du'] * p['fronthaul-gateway'] * p['o-ru'] * p['user-equipment'] + 1) * 2*2*self.FONTSIZE
+        return int(self.__context.topologies()[0].svg_width()) + 2*2*self.FONTSIZE
 
     def __svg_height(self) -> int:
         return (8 * 11 + 6) * self.FONTSIZE
 
-    def svg(self, x, y) -> etree.Element:
+    def svg(self, x, y) -> 'etree.Element':
         """
         Getter for a xml/svg Element object representing the TAPI Topology Context.
         :return TAPI Common Context as SVG object.
         """
+        root = self.svg_root()
+        root.append(self.__context.svg(x, y))
+        return root
+
+    def svg_root(self) -> 'etree.Element':
+        """
+        Getter for the svg root element without content, the TAPI Topology
+        Context is appended by the caller.
+        :return svg element with description and title.
+        """
+        from lxml import etree  # pylint: disable=import-outside-toplevel
         root: Element = etree.Element(
             "svg",
             width=str(self.__svg_width()),
@@ -115,8 +132,6 @@ class TapiCommonContext(Top):
         title=etree.Element("title")
         title.text=self.configuration()["network"]["name"]
         root.append(title)
-
-        root.append(self.__context.svg(x, y))
         return root
 
     def topology_context(self) -> TapiTopologyContext:
@@ -17,12 +17,13 @@
 Module containing a class representing a TAPI Connection Node Edge Point
 """
 import uuid
-from typing import Dict, Union
-from lxml import etree
-from model.python.svg.connection_edge_point import ConnectionEdgePoint
-from model.python.svg.svg import Svg
+from typing import Dict, TYPE_CHECKING, Union
+from controller import instrumentation
 from model.python.top import Top
 
+if TYPE_CHECKING:
+    from lxml import etree
+
 
 class TapiConnectionEdgePoint(Top):
     """
@@ -44,8 +45,10 @@ class TapiConnectionEdgePoint(Top):
     def __init__(self, configuration: Dict[str, str]):
         super().__init__(configuration)
         self.__configuration = configuration
+        instrumentation.count("connection-edge-point")
         self.__data = {
-            "uuid": str(uuid.uuid4()),
+            "uuid": str(uuid.uuid5(uuid.UUID(self.parent()["node-edge-point"]),
+                                   self.name())),
             "name": [{
                 "value-name": "connection-edge-point-name",
                 "value": self.name()
@@ -132,11 +135,13 @@ class TapiConnectionEdgePoint(Top):
         """
         return self.__configuration["parent"]
 
-    def svg(self, x: int, y: int) -> etree.Element:
+    def svg(self, x: int, y: int) -> 'etree.Element':
         """
         Getter for a xml Element object representing the TAPI Node Edge Point.
         :return TAPI Node Edge Point as SVG object.
         """
+        # pylint: disable=import-outside-toplevel
+        from model.python.svg.connection_edge_point import ConnectionEdgePoint
         return ConnectionEdgePoint(self, x, y).svg_element()
 
     def termination_direction(self) -> str:
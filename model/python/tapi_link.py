@@ -16,12 +16,15 @@
 """
 Module for the class representing a TAPI Link
 """
-from typing import Dict, Union
+from typing import Dict, TYPE_CHECKING, Union
 import uuid
-from lxml import etree
+from controller import instrumentation
 from model.python.link_config import LinkConfig
 from model.python.top import Top
 
+if TYPE_CHECKING:
+    from lxml import etree
+
 
 class TapiLink(Top):
     """
@@ -35,15 +38,19 @@ class TapiLink(Top):
     def __init__(self, configuration: dict):
         super().__init__(configuration)
         self.__configuration = configuration
-        self.__link_configuration = LinkConfig(
-            topology_reference=configuration["topology_reference"],
-            name_prefix=configuration["name_prefix"],
-            provider=configuration["provider"],
-            consumer=configuration["consumer"]
-        )
+        with instrumentation.phase("link-resolution"):
+            self.__link_configuration = LinkConfig(
+                topology_reference=configuration["topology_reference"],
+                name_prefix=configuration["name_prefix"],
+                provider=configuration["provider"],
+                consumer=configuration["consumer"]
+            )
         link_data = self.__link_configuration.json()
+        # parallel links between the same node edge points are
+        # distinguished by the plane
+        key = link_data['link']['name'] + configuration.get("plane", "")
         self.__data = {
-            "uuid": str(uuid.uuid4()),
+            "uuid": str(uuid.uuid5(uuid.UUID(configuration["topology_reference"]), key)),
             "name": [{
                 "value-name": "topology-link-name",
                 "value": link_data['link']['name']
@@ -114,11 +121,12 @@ class TapiLink(Top):
         """
         return self.__link_configuration.json()['link']['name']
 
-    def svg(self, svg_x: int, svg_y: int) -> etree.Element:
+    def svg(self, svg_x: int, svg_y: int) -> 'etree.Element':
         """
         Getter for a xml Element object representing the TAPI Link.
         :return TAPI Link as svg object.
         """
+        from lxml import etree  # pylint: disable=import-outside-toplevel
 
         group = etree.Element("g")
         group.attrib["class"] = "link"
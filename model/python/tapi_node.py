@@ -17,18 +17,15 @@
 Module containing the class for a TAPI Node.
 """
 import uuid
-from typing import Dict
-from lxml import etree
-from model.python.svg.near_tr_ric import NearRtRic
-from model.python.svg.o_cloud import OCloud
-from model.python.svg.o_cu_cp import OCuCp
-from model.python.svg.o_cu_up import OCuUp
-from model.python.svg.o_du import ODu
-from model.python.svg.fronthaul_gateway import FronthaulGateway
-from model.python.svg.node import Node
+from typing import Dict, TYPE_CHECKING
+from controller import instrumentation
 from model.python.tapi_node_edge_point import TapiNodeEdgePoint
 from model.python.top import Top
 
+if TYPE_CHECKING:
+    from lxml import etree
+    from model.python.svg.svg import Svg
+
 
 class TapiNode(Top):
     """
@@ -47,7 +44,7 @@ class TapiNode(Top):
         self.__configuration = configuration
         self.width((4 + 1) * (2.2*self.FONTSIZE))  # 4x nep
         self.__data = {
-            "uuid": str(uuid.uuid4()),
+            "uuid": configuration['node'].get('uuid', str(uuid.uuid4())),
             "name": [
                 {
                     "value-name": "topology-node-name",
@@ -78,11 +75,12 @@ class TapiNode(Top):
                 "wander-characteristic": "wander-1"
             }],
             "o-ran-sc-topology:function": configuration['node']['function'],
-            "o-ran-sc-topology:geolocation": {
-                "longitude": "0",
-                "latitude": "0",
-                "altitude": "20000"
-            }
+            "o-ran-sc-topology:geolocation": configuration['node'].get(
+                'geolocation', {
+                    "longitude": "0",
+                    "latitude": "0",
+                    "altitude": "20000"
+                })
         }
 
     # getter
@@ -128,6 +126,7 @@ class TapiNode(Top):
         if name in mapping:
             return mapping[name] + 4*self.FONTSIZE * local_id
 
+        instrumentation.count("svg-offset-miss")
         print("Node: CEP name", name, "for x postion calculation not found")
         return 0
 
@@ -171,6 +170,7 @@ class TapiNode(Top):
         if name in mapping:
             return mapping[name]
 
+        instrumentation.count("svg-offset-miss")
         print("Node: CEP name", name, "for y postion calculation not found")
         return 0
 
@@ -256,11 +256,13 @@ class TapiNode(Top):
         :return The NEP uuid or "not found"
         """
         result = []
+        instrumentation.count("node-edge-point-lookup")
         for nep in self.__data["owned-node-edge-point"]:
             for cep in nep.connection_edge_points():
                 if cep.name() == cep_name:
                     result.append(nep)
         if len(result) == 0:
+            instrumentation.count("node-edge-point-lookup-miss")
             for nep in self.__data["owned-node-edge-point"]:
                 print("# Check", cep_name, nep.json()["name"][0]["value"], nep.json()[
                       "tapi-connectivity:cep-list"]["connection-end-point"][0]["name"][0]["value"])
@@ -277,35 +279,14 @@ class TapiNode(Top):
         """
         return self.__parent
 
-    def svg(self, x: int, y: int) -> etree.Element:
+    def svg(self, x: int, y: int) -> 'etree.Element':
         """
         Getter for a xml Element object representing the TAPI Node.
         :return TAPI Node as svg object.
         """
         self.__svg_x = x
         self.__svg_y = y
-
-        svg_nep = None
-        if type(self).__name__ == "TapiNodeSmo":
-            svg_nep = Node(self, x, y)
-        elif type(self).__name__ == "TapiNodeOCloud":
-            svg_nep = OCloud(self, x, y)
-        elif type(self).__name__ == "TapiNodeNearRtRic":
-            svg_nep = NearRtRic(self, x, y)
-        elif type(self).__name__ == "TapiNodeOCuCp":
-            svg_nep = OCuCp(self, x, y)
-        elif type(self).__name__ == "TapiNodeOCuUp":
-            svg_nep = OCuUp(self, x, y)
-        elif type(self).__name__ == "TapiNodeODu":
-            svg_nep = ODu(self, x, y)
-        elif type(self).__name__ == "TapiNodeFronthaulGateway":
-            svg_nep = FronthaulGateway(self, x, y)
-        # elif type(self).__name__ == "TapiNodeORu":
-        #     svg_nep = Node(self, x, y)
-        # elif type(self).__name__ == "TapiNodeUserEquipment":
-        #     svg_nep = Node(self, x, y)
-        else:
-            svg_nep = Node(self, x, y)
+        svg_nep = self.__svg_shape(x, y)
 
         group: etree.Element = svg_nep.svg_element()
 
@@ -323,6 +304,13 @@ class TapiNode(Top):
             group.append(nep.svg(nep_x, nep_y))
         return group
 
+    def svg_width(self) -> float:
+        """
+        Getter for the width of the svg shape of the TAPI Node.
+        :return Width in pixel.
+        """
+        return self.__svg_shape(0, 0).width()
+
     def width(self, width: int) -> None:
         """
         Setter for the SVG width in px.
@@ -339,3 +327,37 @@ class TapiNode(Top):
         """
         self.__data['owned-node-edge-point'].append(nep)
         return self
+
+    # private
+    def __svg_shape(self, x: int, y: int) -> 'Svg':
+        # the svg shapes (and lxml) are loaded on demand
+        # pylint: disable=import-outside-toplevel
+        from model.python.svg.near_tr_ric import NearRtRic
+        from model.python.svg.o_cloud import OCloud
+        from model.python.svg.o_cu_cp import OCuCp
+        from model.python.svg.o_cu_up import OCuUp
+        from model.python.svg.o_du import ODu
+        from model.python.svg.fronthaul_gateway import FronthaulGateway
+        from model.python.svg.node import Node
+        svg_nep = None
+        if type(self).__name__ == "TapiNodeSmo":
+            svg_nep = Node(self, x, y)
+        elif type(self).__name__ == "TapiNodeOCloud":
+            svg_nep = OCloud(self, x, y)
+        elif type(self).__name__ == "TapiNodeNearRtRic":
+            svg_nep = NearRtRic(self, x, y)
+        elif type(self).__name__ == "TapiNodeOCuCp":
+            svg_nep = OCuCp(self, x, y)
+        elif type(self).__name__ == "TapiNodeOCuUp":
+            svg_nep = OCuUp(self, x, y)
+        elif type(self).__name__ == "TapiNodeODu":
+            svg_nep = ODu(self, x, y)
+        elif type(self).__name__ == "TapiNodeFronthaulGateway":
+            svg_nep = FronthaulGateway(self, x, y)
+        # elif type(self).__name__ == "TapiNodeORu":
+        #     svg_nep = Node(self, x, y)
+        # elif type(self).__name__ == "TapiNodeUserEquipment":
+        #     svg_nep = Node(self, x, y)
+        else:
+            svg_nep = Node(self, x, y)
+        return svg_nep
@@ -17,12 +17,14 @@
 Module containing a class representing a TAPI Node Edge Point
 """
 import uuid
-from typing import Dict, List, Union
-from lxml import etree
-from model.python.svg.node_edge_point import NodeEdgePoint
+from typing import Dict, List, TYPE_CHECKING, Union
+from controller import instrumentation
 from model.python.tapi_connection_edge_point import TapiConnectionEdgePoint
 from model.python.top import Top
 
+if TYPE_CHECKING:
+    from lxml import etree
+
 
 class TapiNodeEdgePoint(Top):
     """
@@ -45,8 +47,9 @@ class TapiNodeEdgePoint(Top):
         super().__init__(configuration)
         self.__configuration = configuration
         self.__ceps = []
+        instrumentation.count("node-edge-point")
         self.__data = {
-            "uuid": str(uuid.uuid4()),
+            "uuid": str(uuid.uuid5(uuid.UUID(self.parent()), self.__key())),
             "name": [{
                 "value-name": "interface-name",
                 "value": self.name()
@@ -73,6 +76,17 @@ class TapiNodeEdgePoint(Top):
             self.__ceps.append(TapiConnectionEdgePoint(cep))
 
     # getter
+    def __key(self) -> str:
+        """
+        Getter returning a key which is unique within the TAPI Node. It is
+        used to derive the TAPI Node Edge Point identifier from the
+        identifier of the TAPI Node.
+        :return Key as string.
+        """
+        return "|".join([self.name()] + [
+            "-".join([cep["protocol"], cep["role"]]).lower()
+            for cep in self.__configuration['nodeEdgePoint']['cep']])
+
     def __x_offset_by_cep_name(self, name) -> int:
         mapping: Dict[str, int] = {
             "o2-rest-consumer": 0*self.FONTSIZE,
@@ -236,11 +250,13 @@ class TapiNodeEdgePoint(Top):
     def svg_y(self) -> int:
         return self.__svg_y
 
-    def svg(self, x: int, y: int) -> etree.Element:
+    def svg(self, x: int, y: int) -> 'etree.Element':
         """
         Getter for a xml Element object representing the TAPI Node Edge Point.
         :return TAPI Node Edge Point as SVG object.
         """
+        # pylint: disable=import-outside-toplevel
+        from model.python.svg.node_edge_point import NodeEdgePoint
         self.__svg_x = x
         self.__svg_y = y
 
@@ -16,11 +16,13 @@
 """
 Module containing a class representing a SMO as TAPI Node.
 """
-from typing import List
-from lxml import etree
+from typing import List, TYPE_CHECKING
 from model.python.tapi_node import TapiNode
 from model.python.tapi_node_edge_point import TapiNodeEdgePoint
 
+if TYPE_CHECKING:
+    from lxml import etree
+
 
 class TapiNodeSmo(TapiNode):
     """
@@ -28,6 +30,9 @@ class TapiNodeSmo(TapiNode):
     """
     __width: 0
 
+    COMPONENTS: List[str] = ["o2-controller", "non-rt-ric", "oam-controller",
+                             "ves-collector", "file-server"]
+
     # constructor
     def __init__(self, parent: TapiNode, config):
         super().__init__(parent, config)
@@ -77,7 +82,8 @@ class TapiNodeSmo(TapiNode):
         }
         self.add(TapiNodeEdgePoint(nep_configuration))
 
-    def __smo_component(self, x: int, y: int, label: str) -> etree.Element:
+    def __smo_component(self, x: int, y: int, label: str) -> 'etree.Element':
+        from lxml import etree  # pylint: disable=import-outside-toplevel
         group = etree.Element("g")
         group.attrib["class"] = " ".join(["node", label])
 
@@ -102,16 +108,22 @@ class TapiNodeSmo(TapiNode):
         group.append(labelElement)
         return group
 
-    def svg(self, x: int, y: int) -> etree.Element:
+    def svg_width(self) -> float:
+        """
+        Getter for the width of the svg shape of the TAPI Node, the SMO
+        contains a box per component.
+        :return Width in pixel.
+        """
+        return (len(self.COMPONENTS)*5 +1) * (2.2*self.FONTSIZE)
+
+    def svg(self, x: int, y: int) -> 'etree.Element':
         """
         Getter for a xml Element object representing the TAPI Node.
         :return TAPI Node as svg object.
         """
+        from lxml import etree  # pylint: disable=import-outside-toplevel
         super().svg(x, y)
 
-        components = ["o2-controller", "non-rt-ric", "oam-controller",
-                      "ves-collector", "file-server"]
-
         group = etree.Element("g")
         group.attrib["class"] = "node"
         title = etree.Element("title")
@@ -119,7 +131,7 @@ class TapiNodeSmo(TapiNode):
             self.identifier() + "\n name: " + self.name()
         group.append(title)
 
-        width = (len(components)*5 +1) * (2.2*self.FONTSIZE)
+        width = self.svg_width()
         height = 2 * (2.2*self.FONTSIZE)
 
         rect = etree.Element("rect")
@@ -141,7 +153,7 @@ class TapiNodeSmo(TapiNode):
         label.text = self.function_label()
         group.append(label)
 
-        for component in components:
+        for component in self.COMPONENTS:
             x_mapping = {
                 "o2-controller": -4*6*self.FONTSIZE,
                 "non-rt-ric": -2*6*self.FONTSIZE,
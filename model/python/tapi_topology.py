@@ -17,9 +17,9 @@
 Module containing the main class for this project for a TAPI Topology.
 """
 import uuid
-from typing import Dict, List, Union
-from lxml import etree
+from typing import Callable, Dict, List, Tuple, TYPE_CHECKING, Union
 
+from controller import instrumentation
 from model.python.top import Top
 from model.python.tapi_node import TapiNode
 from model.python.tapi_node_smo import TapiNodeSmo
@@ -33,21 +33,62 @@ from model.python.tapi_node_o_ru import TapiNodeORu
 from model.python.tapi_node_user_equipment import TapiNodeUserEquipment
 from model.python.tapi_link import TapiLink
 
+if TYPE_CHECKING:
+    import numpy
+    from lxml import etree
+    from model.python.branch_counts import BranchCounts
+    from model.python.geo_placement import GeoPlacement
+
 
 class TapiTopology(Top):
     """
     Class representing a TAPI Topology
     """
 
+    # network-function types in hierarchical order, the index is the position
+    # of the digit in the local identifier of a node
+    LEVELS: List[str] = ["smo", "near-rt-ric", "o-cu", "o-du",
+                         "fronthaul-gateway", "o-ru", "user-equipment"]
+    # namespace of the default uuid, derived from the network name, so that
+    # the identifiers of a configuration are equal in all runs
+    NAMESPACE: uuid.UUID = uuid.UUID("6f1c2d5e-8a43-4b7e-9d21-3c5f0e8a7b64")
+    NODE_CLASSES: Dict[str, type] = {
+        "smo": TapiNodeSmo,
+        "o-cloud": TapiNodeOCloud,
+        "near-rt-ric": TapiNodeNearRtRic,
+        "o-cu-cp": TapiNodeOCuCp,
+        "o-cu-up": TapiNodeOCuUp,
+        "o-du": TapiNodeODu,
+        "fronthaul-gateway": TapiNodeFronthaulGateway,
+        "o-ru": TapiNodeORu,
+        "user-equipment": TapiNodeUserEquipment
+    }
+
     __data: Dict[str, Union[str, List[Union[Dict, TapiNode, TapiLink]]]] = None
     __configuration: dict = None
+    __listener: Callable[[str, Top], None] = None
+    __counts: 'BranchCounts' = None
+    __placement: 'GeoPlacement' = None
+    __svg_layout: Tuple[Dict[str, 'numpy.ndarray'], float] = None
 
     # constructor
-    def __init__(self, configuration: dict):
+    def __init__(self, configuration: dict, populate: bool = True,
+                 listener: Callable[[str, Top], None] = None):
         super().__init__(configuration)
         self.__configuration = configuration
+        self.__listener = listener
+        if any(isinstance(value, (list, dict))
+               for value in configuration['network']['pattern'].values()):
+            # NumPy is only loaded for counts per branch
+            from model.python.branch_counts import BranchCounts  # pylint: disable=import-outside-toplevel
+            self.__counts = BranchCounts(configuration)
+        if "geolocation" in configuration['network']:
+            # NumPy is only loaded for a configured placement
+            from model.python.geo_placement import GeoPlacement  # pylint: disable=import-outside-toplevel
+            self.__placement = GeoPlacement(configuration, self.__counts)
         self.__data = {
-            "uuid": str(uuid.uuid4()),
+            "uuid": configuration['network'].get('uuid', str(uuid.uuid5(
+                self.NAMESPACE, configuration['network']['name']))),
             "name": [{
                 "value-name": "network-name",
                 "value": configuration['network']['name']}],
@@ -55,9 +96,18 @@ class TapiTopology(Top):
             "node": [],
             "link": []}
 
+        if not populate:
+            return
+        if self.__listener is not None:
+            self.__listener("topology", self)
+
+        if "subtree" in configuration['network']:
+            self.__create_subtree(configuration['network']['subtree'])
+            return
+
         topology_structure: dict = configuration['network']['pattern']
         network_function_type: str = next(iter(topology_structure))
-        count: int = configuration['network']['pattern'][network_function_type]
+        count: int = self.count(network_function_type, "")
 
         if network_function_type == "smo":
             self.__create_smos(None, topology_structure, count)
@@ -105,6 +155,28 @@ class TapiTopology(Top):
         """
         return self.__configuration['network']['name']
 
+    def branch_counts(self) -> 'BranchCounts':
+        """
+        Getter returning the number of children per branch of a pattern with
+        lists or distributions.
+        :return BranchCounts object or None for a count per level.
+        """
+        return self.__counts
+
+    def count(self, node_type: str, parent_local_id: str) -> int:
+        """
+        Getter returning the number of children of a type below a parent.
+        :param node_type: The network function type, e.g. "o-du" or "o-ru".
+        :param parent_local_id: The local identifier of the parent, empty for
+                                the root level.
+        :return Number of children.
+        """
+        if self.__counts is not None:
+            return self.__counts.count(node_type, parent_local_id)
+        if node_type in ["o-cu-cp", "o-cu-up"]:
+            node_type = "o-cu"
+        return self.__configuration['network']['pattern'].get(node_type, 0)
+
     def json(self) -> dict:
         """
         Getter for a json object representing the TAPI Topology.
@@ -124,16 +196,12 @@ class TapiTopology(Top):
 
         return result
 
-    def svg(self, svg_x: int, svg_y: int) -> etree.Element:
+    def svg(self, svg_x: int, svg_y: int) -> 'etree.Element':
         """
         Getter for a xml Element object representing the TAPI Topology Context.
         :return TAPI Topology Context as svg object.
         """
-        group = etree.Element("g")
-        title = etree.Element("title")
-        title.text = "\n TAPI Topology \n id: " + \
-            self.identifier()  # + "\n name: " + self.name()
-        group.append(title)
+        group = self.svg_group()
 
         # nodes handling
         index_per_type: Dict = {}
@@ -143,11 +211,8 @@ class TapiTopology(Top):
                 index_per_type[type(node)] = index_per_type[type(node)] + 1
             else:
                 index_per_type[type(node)] = 0
-            index = index_per_type[type(node)]
-            node_x = svg_x + \
-                index*self.__svg_dynamic_x_offset_by_node_type(type(node)) + \
-                self.__svg_static_x_offset_by_node_type(type(node))
-            node_y = svg_y + self.__svg_y_offset_by_node_type(type(node))
+            node_x, node_y = self.svg_position(
+                node, index_per_type[type(node)], svg_x, svg_y)
             svg_nodes.append(node.svg(node_x, node_y))
             # group.append(node.svg(node_x, node_y))
 
@@ -161,6 +226,110 @@ class TapiTopology(Top):
 
         return group
 
+    def svg_group(self) -> 'etree.Element':
+        """
+        Getter for the empty svg group of the TAPI Topology, the nodes and
+        links are appended by the caller.
+        :return svg group with title.
+        """
+        from lxml import etree  # pylint: disable=import-outside-toplevel
+        group = etree.Element("g")
+        title = etree.Element("title")
+        title.text = "\n TAPI Topology \n id: " + \
+            self.identifier()  # + "\n name: " + self.name()
+        group.append(title)
+        return group
+
+    def svg_position(self, node: TapiNode, index: int,
+                     svg_x: int, svg_y: int) -> Tuple[int, int]:
+        """
+        Getter for the svg position of a TAPI Node.
+        :param node: A TAPI Node of this topology.
+        :param index: The index of the node among the nodes of its type.
+        :param svg_x: The x position of the topology.
+        :param svg_y: The y position of the topology.
+        :return x and y position of the node.
+        """
+        if self.__counts is not None:
+            node_x = svg_x + self.__svg_x_offset_by_branch_counts(node)
+        else:
+            node_x = svg_x + \
+                index*self.__svg_dynamic_x_offset_by_node_type(type(node)) + \
+                self.__svg_static_x_offset_by_node_type(type(node))
+        node_y = svg_y + self.__svg_y_offset_by_node_type(type(node))
+        return node_x, node_y
+
+    def svg_width(self) -> float:
+        """
+        Getter for the width of all nodes in svg.
+        :return Width in pixel.
+        """
+        if self.__counts is not None:
+            return self.__svg_layout_by_branch_counts()[1]
+        p = self.configuration()['network']['pattern']
+        return p['smo'] * p['near-rt-ric'] * p['o-cu'] * p['o-du'] * p['fronthaul-gateway'] * p['o-ru'] * p['user-equipment'] * 2*2*self.FONTSIZE
+
+    def __svg_x_offset_by_branch_counts(self, node: TapiNode) -> float:
+        """
+        Mapping function from nodes to x position in svg for counts per
+        branch, a node is centered above the subtrees of its children
+        return: float value
+        """
+        node_type = node.configuration()["node"]["type"]
+        index = self.__counts.index(node_type, node.local_id())
+        if node_type in ["o-cu-cp", "o-cu-up"]:
+            planes: Dict[str, float] = {"o-cu-cp": -12.5 * self.FONTSIZE,
+                                        "o-cu-up": 12.5 * self.FONTSIZE}
+            return self.__svg_layout_by_branch_counts()[0]["o-cu"].item(index) + \
+                planes[node_type]
+        return self.__svg_layout_by_branch_counts()[0][node_type].item(index)
+
+    def __svg_layout_by_branch_counts(self) -> Tuple[Dict[str, 'numpy.ndarray'], float]:
+        """
+        Method calculating the x positions of all nodes for counts per branch
+        once, the subtrees start at the left edge of a leaf centered at 0 like
+        for a count per level.
+        return: Center per node by level and the width of all nodes
+        """
+        if self.__svg_layout is None:
+            import numpy  # pylint: disable=import-outside-toplevel
+            boxes: Dict[str, numpy.ndarray] = {}
+            for level in ["smo", "o-cloud", "near-rt-ric", "o-du",
+                          "o-ru", "user-equipment"]:
+                boxes[level] = numpy.full(
+                    self.__counts.total(level), self.__svg_box_width(level))
+            # the O-CU-CP and O-CU-UP are placed beside each other
+            boxes["o-cu"] = numpy.full(
+                self.__counts.total("o-cu"), 25 * self.FONTSIZE + max(
+                    self.__svg_box_width("o-cu-cp"),
+                    self.__svg_box_width("o-cu-up")))
+            # the width of a fronthaul gateway depends on its O-RUs
+            southbound = self.__counts.counts("o-ru").tolist() or \
+                [0] * self.__counts.total("fronthaul-gateway")
+            widths = {count: self.__svg_box_width("fronthaul-gateway", count)
+                      for count in set(southbound)}
+            boxes["fronthaul-gateway"] = numpy.array(
+                [widths[count] for count in southbound], dtype=float)
+            centers, width = self.__counts.layout(boxes)
+            self.__svg_layout = (
+                {level: center - 2 * self.FONTSIZE
+                 for level, center in centers.items()},
+                width)
+        return self.__svg_layout
+
+    def __svg_box_width(self, node_type: str, southbound: int = 0) -> float:
+        """
+        Method creating a TAPI Node outside of the topology for the width of
+        its svg shape.
+        return: float value
+        """
+        configuration = {"node": {
+            "localId": "0",
+            "type": node_type,
+            "function": "o-ran-sc-topology-common:" + node_type,
+            "southbound-nep-count": southbound}}
+        return self.NODE_CLASSES[node_type](None, configuration).svg_width()
+
     def __svg_static_x_offset_by_node_type(self, node_type) -> int:
         """
         Mapping function from node types to y position in svg
@@ -248,6 +417,9 @@ class TapiTopology(Top):
         :return TAPI Topology object.
         """
         self.__data["node"].append(node)
+        instrumentation.count("node")
+        if self.__listener is not None:
+            self.__listener("node", node)
         return self
 
     def add_link(self, link: TapiLink):
@@ -256,26 +428,130 @@ class TapiTopology(Top):
         :return TAPI Topology object.
         """
         self.__data["link"].append(link)
+        instrumentation.count("link")
+        if self.__listener is not None:
+            self.__listener("link", link)
+        return self
+
+    def anchor(self, node_type: str, parent: TapiNode, local_id: str) -> TapiNode:
+        """
+        Method creating an already existing TAPI node, e.g. the parent of
+        nodes to be added to a previously generated topology. The node and its
+        links are not added to the TAPI Topology.
+        :param node_type: The network function type, e.g. "o-du" or "o-cu-cp".
+        :param parent: A TAPI node which acts a a parent node in the topology.
+        :param local_id: The local identifier of the node in the hierarchy.
+        :return TAPI Node object.
+        """
+        config = self.__node_configuration(node_type, local_id)
+        if node_type == "fronthaul-gateway":
+            config["node"]["southbound-nep-count"] = self.count("o-ru", local_id)
+        return self.NODE_CLASSES[node_type](parent, config)
+
+    def extend(self, node_type: str, parent: Union[TapiNode, Dict[str, TapiNode]],
+               first: int, count: int = None) -> 'TapiTopology':
+        """
+        Method adding TAPI nodes of a network function type including their
+        subtrees and links to the TAPI Topology.
+        :param node_type: The network function type, e.g. "o-du" or "o-ru".
+        :param parent: A TAPI node which acts a a parent node in the topology.
+                       For "o-du" the O-CU nodes per plane ("cp", "up").
+        :param first: Local index of the first instance to be created.
+        :param count: Local index after the last instance to be created,
+                      by default the value of the pattern.
+        :return TAPI Topology object.
+        """
+        structure = self.configuration()['network']['pattern']
+        if count is None:
+            anchor = parent["cp"] if isinstance(parent, dict) else parent
+            count = self.count(node_type, "" if anchor is None else anchor.local_id())
+        creators = {
+            "smo": self.__create_smos,
+            "o-cloud": self.__create_o_clouds,
+            "near-rt-ric": self.__create_near_rt_rics,
+            "o-cu": self.__create_o_cus,
+            "o-du": self.__create_o_dus,
+            "fronthaul-gateway": self.__create_fronthaul_gateways,
+            "o-ru": self.__create_o_rus,
+            "user-equipment": self.__create_ues
+        }
+        creators[node_type](parent, structure, count, first)
         return self
 
-    def __create_smos(self, parent: TapiNode, topology_structure: dict, count: int):
+    def subtree_error(self, name: str) -> str:
+        """
+        Getter checking the name of the root node of a subtree.
+        :param name: The name of the TAPI node as root of the subtree.
+        :return Error message or an empty string, if the node is part of the
+                pattern.
+        """
+        node_type, _, local_id = name.rpartition("-")
+        level = node_type
+        if node_type in ["o-cu-cp", "o-cu-up"]:
+            level = "o-cu"
+        depth = 1
+        if level in self.LEVELS:
+            depth = self.LEVELS.index(level)
+        elif level != "o-cloud":
+            return "Unknown network function type " + node_type
+
+        levels = self.LEVELS[:depth] + [level]
+        if not local_id.isdigit() or len(local_id) != len(levels) or \
+                any(int(local_id[index]) >= self.count(item, local_id[:index])
+                    for index, item in enumerate(levels)):
+            return "Node " + name + " is not part of the pattern"
+        return ""
+
+    def __create_subtree(self, name: str):
+        """
+        Method adding a single TAPI node, e.g. "o-du-0102", its descendants
+        and the links to its ancestors to the TAPI Topology. The ancestors
+        are calculated from the local identifier and are not added.
+        :param name: The name of the TAPI node as root of the subtree.
+        :return TAPI Topology object.
+        """
+        message = self.subtree_error(name)
+        if message:
+            print(message)
+            return self
+
+        node_type, _, local_id = name.rpartition("-")
+        level = "o-cu" if node_type in ["o-cu-cp", "o-cu-up"] else node_type
+        depth = self.LEVELS.index(level) if level in self.LEVELS else 1
+        parent = None
+        for index, item in enumerate(self.LEVELS[:depth]):
+            prefix = local_id[:index + 1]
+            if item == "o-cu":
+                parent = {plane: self.anchor("-".join([item, plane]), parent, prefix)
+                          for plane in ["cp", "up"]}
+            elif item == "o-du":
+                parent = self.anchor(item, parent["cp"], prefix)
+            else:
+                parent = self.anchor(item, parent, prefix)
+
+        first = int(local_id[-1])
+        return self.extend(level, parent, first, first + 1)
+
+    @instrumentation.timed("generation/smo")
+    def __create_smos(self, parent: TapiNode, topology_structure: dict, count: int,
+                      first: int = 0):
         """
         Method adding a TAPI node to TAPI Topology.
         :param parent: A TAPI node which acts a a parent node in the topology.
         :param topology_structure: Information about the next topology levels.
         :param count: Number of instance to be created
+        :param first: Local index of the first instance to be created
         :return TAPI Topology object.
         """
         current_type = "smo"
         next_type = "near-rt-ric"
-        for local_id in range(count):
+        for local_id in range(first, count):
             prefix = ""
 
             if parent is not None:
                 prefix = parent.data()["name"][1]["value"]
-            config = {"node": {"localId": prefix + str(local_id),
-                               "type": current_type,
-                               "function": "o-ran-sc-topology-common:"+current_type}}
+            config = self.__node_configuration(
+                current_type, prefix + str(local_id))
             node = TapiNodeSmo(parent, config)
             self.add_node(node)
 
@@ -283,7 +559,7 @@ class TapiTopology(Top):
             if "o-cloud" in topology_structure:
                 structure = topology_structure.copy()
                 self.__create_o_clouds(
-                    node, structure, structure["o-cloud"])
+                    node, structure, self.count("o-cloud", node.local_id()))
 
             if next_type in topology_structure:
                 structure = topology_structure.copy()
@@ -292,28 +568,29 @@ class TapiTopology(Top):
                 if current_type in structure:
                     del structure[current_type]
                 self.__create_near_rt_rics(
-                    node, structure, structure[next_type])
+                    node, structure, self.count(next_type, node.local_id()))
 
         return self
 
-    def __create_o_clouds(self, parent: TapiNode, topology_structure: dict, count: int):
+    @instrumentation.timed("generation/o-cloud")
+    def __create_o_clouds(self, parent: TapiNode, topology_structure: dict, count: int,
+                          first: int = 0):
         """
         Method adding a TAPI node to TAPI Topology.
         :param parent: A TAPI node which acts a a parent node in the topology.
         :param topology_structure: Information about the next topology levels.
         :param count: Number of instance to be created
+        :param first: Local index of the first instance to be created
         :return TAPI Topology object.
         """
         current_type = "o-cloud"
-        for local_id in range(count):
+        for local_id in range(first, count):
             # add node
             prefix = ""
             if parent is not None:
-                prefix = parent.json()["name"][1]["value"]
-            function = "o-ran-sc-topology-common:"+current_type
-            node_configuration = {"node": {"localId": prefix + str(local_id),
-                                           "type": current_type,
-                                           "function": function}}
+                prefix = parent.data()["name"][1]["value"]
+            node_configuration = self.__node_configuration(
+                current_type, prefix + str(local_id))
             node = TapiNodeOCloud(parent, node_configuration)
             self.add_node(node)
 
@@ -328,25 +605,26 @@ class TapiTopology(Top):
             self.add_link(TapiLink(link_configuration))
         return self
 
-    def __create_near_rt_rics(self, parent: TapiNode, topology_structure: dict, count: int):
+    @instrumentation.timed("generation/near-rt-ric")
+    def __create_near_rt_rics(self, parent: TapiNode, topology_structure: dict, count: int,
+                              first: int = 0):
         """
         Method adding a TAPI node to TAPI Topology.
         :param parent: A TAPI node which acts a a parent node in the topology.
         :param topology_structure: Information about the next topology levels.
         :param count: Number of instance to be created
+        :param first: Local index of the first instance to be created
         :return TAPI Topology object.
         """
         current_type = "near-rt-ric"
         next_type = "o-cu"
-        for local_id in range(count):
+        for local_id in range(first, count):
             # add node
             prefix = ""
             if parent is not None:
-                prefix = parent.json()["name"][1]["value"]
-            function = "o-ran-sc-topology-common:"+current_type
-            node_configuration = {"node": {"localId": prefix + str(local_id),
-                                           "type": current_type,
-                                           "function": function}}
+                prefix = parent.data()["name"][1]["value"]
+            node_configuration = self.__node_configuration(
+                current_type, prefix + str(local_id))
             node = TapiNodeNearRtRic(parent, node_configuration)
             self.add_node(node)
 
@@ -392,41 +670,54 @@ class TapiTopology(Top):
                 structure = topology_structure.copy()
                 if current_type in structure:
                     del structure[current_type]
-                self.__create_o_cus(node, structure, structure[next_type])
+                self.__create_o_cus(node, structure,
+                                    self.count(next_type, node.local_id()))
 
         return self
 
-    def __function_identity(self, function_type: str, plane: str) -> str:
-        """
-        Method to calculate the Function IDENTITY
-        """
-        return "".join([
-            "o-ran-sc-topology-common:",
-            function_type,
-            "-",
-            plane
-        ])
+    def __node_configuration(self, node_type: str, local_id: str) -> Dict[str, Dict]:
+        """
+        Method to calculate the configuration of a TAPI node.
+        The node identifier is derived from the topology identifier and the
+        node name. Therefore a node keeps its identifier in all generations of
+        the same topology.
+        :param node_type: The network function type, e.g. "o-du" or "o-cu-cp".
+        :param local_id: The local identifier of the node in the hierarchy.
+        :return TAPI Node configuration as json object.
+        """
+        name = "-".join([node_type, local_id])
+        result = {"node": {
+            "uuid": str(uuid.uuid5(uuid.UUID(self.identifier()), name)),
+            "localId": local_id,
+            "type": node_type,
+            "function": "o-ran-sc-topology-common:" + node_type}}
+        if self.__placement is not None:
+            result["node"]["geolocation"] = self.__placement.geolocation(
+                node_type, local_id)
+        return result
 
-    def __create_o_cus(self, parent: TapiNode, topology_structure: dict, count: int):
+    @instrumentation.timed("generation/o-cu")
+    def __create_o_cus(self, parent: TapiNode, topology_structure: dict, count: int,
+                       first: int = 0):
         """
         Method adding a TAPI node to TAPI Topology.
         :param parent: A TAPI node which acts a a parent node in the topology.
         :param topology_structure: Information about the next topology levels.
         :param count: Number of instance to be created
+        :param first: Local index of the first instance to be created
         :return TAPI Topology object.
         """
         current_type = "o-cu"
         next_type = "o-du"
-        for local_id in range(count):
+        for local_id in range(first, count):
             prefix = ""
             if parent is not None:
                 prefix = parent.data()["name"][1]["value"]
 
             node: Dict[str, Union[TapiNodeOCuCp, TapiNodeOCuUp]] = {}
             for plane in ["cp", "up"]:
-                config = {"node": {"localId": prefix + str(local_id),
-                                   "type": "-".join([current_type, plane]),
-                                   "function": self.__function_identity(current_type, plane)}}
+                config = self.__node_configuration(
+                    "-".join([current_type, plane]), prefix + str(local_id))
                 classes: Dict[str, Union[TapiNodeOCuCp, TapiNodeOCuUp]] = {
                     "cp": TapiNodeOCuCp,
                     "up": TapiNodeOCuUp}
@@ -485,26 +776,28 @@ class TapiTopology(Top):
                 if current_type in structure:
                     del structure[current_type]
                 self.__create_o_dus(
-                    node, structure, structure[next_type])
+                    node, structure, self.count(next_type, node["cp"].local_id()))
         return self
 
-    def __create_o_dus(self, parents: Dict[str, TapiNode], topology_structure: dict, count: int):
+    @instrumentation.timed("generation/o-du")
+    def __create_o_dus(self, parents: Dict[str, TapiNode], topology_structure: dict, count: int,
+                       first: int = 0):
         """
         Method adding a TAPI node to TAPI Topology.
         :param parent: A TAPI node which acts a a parent node in the topology.
         :param topology_structure: Information about the next topology levels.
         :param count: Number of instance to be created
+        :param first: Local index of the first instance to be created
         :return TAPI Topology object.
         """
         current_type = "o-du"
         next_type = "fronthaul-gateway"
-        for local_id in range(count):
+        for local_id in range(first, count):
             prefix = "000"
             if parents["cp"] is not None:
                 prefix = parents["cp"].data()["name"][1]["value"]
-            config = {"node": {"localId": prefix + str(local_id),
-                               "type": current_type,
-                               "function": "o-ran-sc-topology-common:"+current_type}}
+            config = self.__node_configuration(
+                current_type, prefix + str(local_id))
             node = TapiNodeODu(parents["cp"], config)
             self.add_node(node)
 
@@ -514,6 +807,7 @@ class TapiTopology(Top):
                 # E2
                 link_configuration = {
                     "topology_reference": self.data()["uuid"],
+                    "plane": plane,
                     "name_prefix": "e2-rest",
                     "provider": node,
                     "consumer": parent.parent()
@@ -523,6 +817,7 @@ class TapiTopology(Top):
                 # O1 NETCONF
                 link_configuration = {
                     "topology_reference": self.data()["uuid"],
+                    "plane": plane,
                     "name_prefix": "o1-netconf",
                     "provider": node,
                     "consumer": parent.parent().parent()
@@ -532,6 +827,7 @@ class TapiTopology(Top):
                 # O1 FILE
                 link_configuration = {
                     "topology_reference": self.data()["uuid"],
+                    "plane": plane,
                     "name_prefix": "o1-file",
                     "provider": node,
                     "consumer": parent.parent().parent()
@@ -541,6 +837,7 @@ class TapiTopology(Top):
                 # O1 VES
                 link_configuration = {
                     "topology_reference": self.data()["uuid"],
+                    "plane": plane,
                     "name_prefix": "o1-ves",
                     "provider": parent.parent().parent(),
                     "consumer": node
@@ -551,6 +848,7 @@ class TapiTopology(Top):
                 interfaces: Dict[str, str] = {"cp": "f1-c", "up": "f1-u"}
                 link_configuration = {
                     "topology_reference": self.data()["uuid"],
+                    "plane": plane,
                     "name_prefix": interfaces[plane]+"-unknown",
                     "provider": node,
                     "consumer": parent
@@ -563,31 +861,30 @@ class TapiTopology(Top):
                 if current_type in structure:
                     del structure[current_type]
                 self.__create_fronthaul_gateways(
-                    node, structure, structure[next_type])
+                    node, structure, self.count(next_type, node.local_id()))
         return self
 
-    def __create_fronthaul_gateways(self, parent: TapiNode, topology_structure: dict, count: int):
+    @instrumentation.timed("generation/fronthaul-gateway")
+    def __create_fronthaul_gateways(self, parent: TapiNode, topology_structure: dict, count: int,
+                                    first: int = 0):
         """
         Method adding a TAPI node to TAPI Topology.
         :param parent: A TAPI node which acts a a parent node in the topology.
         :param topology_structure: Information about the next topology levels.
         :param count: Number of instance to be created
+        :param first: Local index of the first instance to be created
         :return TAPI Topology object.
         """
         current_type = "fronthaul-gateway"
         next_type = "o-ru"
-        for local_id in range(count):
+        for local_id in range(first, count):
             prefix = ""
             if parent is not None:
                 prefix = parent.data()["name"][1]["value"]
-            node_configuration = {
-                "node": {
-                    "localId": prefix + str(local_id),
-                    "type": current_type,
-                    "function": "o-ran-sc-topology-common:"+current_type,
-                    "southbound-nep-count": topology_structure[next_type]
-                }
-            }
+            node_configuration = self.__node_configuration(
+                current_type, prefix + str(local_id))
+            node_configuration["node"]["southbound-nep-count"] = self.count(
+                next_type, prefix + str(local_id))
             node = TapiNodeFronthaulGateway(parent, node_configuration)
             self.add_node(node)
 
@@ -616,26 +913,29 @@ class TapiTopology(Top):
                 structure = topology_structure.copy()
                 if current_type in structure:
                     del structure[current_type]
-                self.__create_o_rus(node, structure, structure[next_type])
+                self.__create_o_rus(node, structure,
+                                    self.count(next_type, node.local_id()))
         return self
 
-    def __create_o_rus(self, parent: TapiNode, topology_structure: dict, count: int):
+    @instrumentation.timed("generation/o-ru")
+    def __create_o_rus(self, parent: TapiNode, topology_structure: dict, count: int,
+                       first: int = 0):
         """
         Method adding a TAPI node to TAPI Topology.
         :param parent: A TAPI node which acts a a parent node in the topology.
         :param topology_structure: Information about the next topology levels.
         :param count: Number of instance to be created
+        :param first: Local index of the first instance to be created
         :return TAPI Topology object.
         """
         current_type = "o-ru"
         next_type = "user-equipment"
-        for local_id in range(count):
+        for local_id in range(first, count):
             prefix = ""
             if parent is not None:
                 prefix = parent.data()["name"][1]["value"]
-            config = {"node": {"localId": prefix + str(local_id),
-                               "type": current_type,
-                               "function": "o-ran-sc-topology-common:"+current_type}}
+            config = self.__node_configuration(
+                current_type, prefix + str(local_id))
             node = TapiNodeORu(parent, config)
             self.add_node(node)
 
@@ -664,25 +964,28 @@ class TapiTopology(Top):
                 structure = topology_structure.copy()
                 if current_type in structure:
                     del structure[current_type]
-                self.__create_ues(node, structure, structure[next_type])
+                self.__create_ues(node, structure,
+                                  self.count(next_type, node.local_id()))
         return self
 
-    def __create_ues(self, parent: TapiNode, topology_structure: dict, count: int):
+    @instrumentation.timed("generation/user-equipment")
+    def __create_ues(self, parent: TapiNode, topology_structure: dict, count: int,
+                     first: int = 0):
         """
         Method adding a TAPI node to TAPI Topology.
         :param parent: A TAPI node which acts a a parent node in the topology.
         :param topology_structure: Information about the next topology levels.
         :param count: Number of instance to be created
+        :param first: Local index of the first instance to be created
         :return TAPI Topology object.
         """
         current_type = "user-equipment"
-        for local_id in range(count):
+        for local_id in range(first, count):
             prefix = ""
             if parent is not None:
                 prefix = parent.data()["name"][1]["value"]
-            config = {"node": {"localId": prefix + str(local_id),
-                               "type": current_type,
-                               "function": "o-ran-sc-topology-common:"+current_type}}
+            config = self.__node_configuration(
+                current_type, prefix + str(local_id))
             node = TapiNodeUserEquipment(parent, config)
             self.add_node(node)
 
@@ -16,27 +16,32 @@
 """
 Module for the TAPI Topology Context
 """
-from typing import Dict, List, Union
-from lxml import etree
+from typing import Callable, Dict, List, TYPE_CHECKING, Union
 from model.python.tapi_topology import TapiTopology
 from model.python.top import Top
 
+if TYPE_CHECKING:
+    from lxml import etree
+
 
 class TapiTopologyContext(Top):
     """
     Class providing a TAPI Topology Context object
     """
 
-    __data: Dict[str, Dict[str, List]] = {
-        "tapi-topology:topology-context": {
-            "topology": []}}
-    __tapi_topology: List[TapiTopology] = []
+    __configuration: dict = None
+    __data: Dict[str, Dict[str, List]] = None
+    __tapi_topology: List[TapiTopology] = None
 
     # constructor
-    def __init__(self, configuration: Dict[str, Union[str, Dict[str, int]]]):
+    def __init__(self, configuration: Dict[str, Union[str, Dict[str, int]]],
+                 listener: Callable[[str, Top], None] = None):
         super().__init__(configuration)
-        topology = TapiTopology(configuration)
-        self.__tapi_topology.append(topology)
+        self.__configuration = configuration
+        self.__data = {
+            "tapi-topology:topology-context": {
+                "topology": []}}
+        self.__tapi_topology = [TapiTopology(configuration, listener=listener)]
 
     # getter
     def configuration(self) -> dict:
@@ -68,27 +73,42 @@ class TapiTopologyContext(Top):
         """
         return self.name()
 
+    def topologies(self) -> List[TapiTopology]:
+        """
+        Getter for the next level objects (TapiTopology).
+        :return List of TAPI Topologies
+        """
+        return self.__tapi_topology
+
     def json(self) -> dict:
         """
         Getter for a json object representing the TAPI Topology Context.
         :return TAPI Topology Context as json object.
         """
-        result = self.__data.copy()
-        for topology in self.__tapi_topology:
-            result["tapi-topology:topology-context"]["topology"].append(
-                topology.json())
-        return result
+        return {
+            "tapi-topology:topology-context": {
+                "topology": [
+                    topology.json() for topology in self.__tapi_topology]}}
 
-    def svg(self, x, y) -> etree.Element:
+    def svg(self, x, y) -> 'etree.Element':
         """
         Getter for a xml Element object representing the TAPI Topology Context.
         :return TAPI Topology Context as svg object.
         """
+        group = self.svg_group()
+        for topology in self.__tapi_topology:
+            group.append(topology.svg(x, y))
+        return group
+
+    def svg_group(self) -> 'etree.Element':
+        """
+        Getter for the empty svg group of the TAPI Topology Context, the
+        topologies are appended by the caller.
+        :return svg group with title.
+        """
+        from lxml import etree  # pylint: disable=import-outside-toplevel
         group = etree.Element("g")
         title = etree.Element("title")
         title.text = "\n context: " + self.identifier() + "\n name: " + self.name()
         group.append(title)
-
-        for topology in self.__tapi_topology:
-            group.append(topology.svg(x, y))
         return group
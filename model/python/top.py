@@ -17,7 +17,10 @@
 Module for an abstract class called "Top".
 This calls should be inherited for common functions
 """
-from lxml import etree
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lxml import etree
 
 
 class Top:
@@ -63,7 +66,7 @@ class Top:
         """
         raise NotImplementedError('subclasses must override name()!')
 
-    def svg(self, svg_x: int, svg_y: int) -> etree.Element:
+    def svg(self, svg_x: int, svg_y: int) -> 'etree.Element':
         """
         Returns an lxml.etree.Element object.
         """
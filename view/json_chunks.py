@@ -0,0 +1,206 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+#!/usr/bin/python
+"""
+Module containing functions and a class to encode the json arrays of a TAPI
+topology in chunks, identical to json.dump with an indent of 2.
+"""
+import json
+from concurrent.futures import Executor, Future
+from typing import Callable, Dict, List, Tuple, TYPE_CHECKING, Union
+
+if TYPE_CHECKING:
+    from model.python.tapi_common_context import TapiCommonContext
+    from model.python.tapi_topology import TapiTopology
+    from model.python.top import Top
+
+# placeholder of an array item in a json skeleton
+SENTINEL: str = "@@json-chunks@@"
+
+
+def encode(items: List[Dict], indent: str, first: bool) -> bytes:
+    """
+    Function encoding json objects as items of a json array, executed by the
+    serializer processes. The result is identical to the items encoded by
+    json.dump with an indent of 2 at the given indentation.
+    :param items: The json objects.
+    :param indent: The indentation of the array items.
+    :param first: True, if the first item is the first of the array.
+    :return The utf-8 encoded items including the separators.
+    """
+    parts: List[str] = []
+    for item in items:
+        parts.append(("\n" if first else ",\n") + indent + json.dumps(
+            item, ensure_ascii=False, indent=2).replace("\n", "\n" + indent))
+        first = False
+    return "".join(parts).encode("utf-8")
+
+
+def split(text: str, sentinel: str = SENTINEL) -> Tuple[str, str, str, str]:
+    """
+    Function splitting an encoded json skeleton at an array, which contains
+    the sentinel as only item.
+    :param text: The skeleton encoded with an indent of 2.
+    :param sentinel: The array item.
+    :return The text up to the opening bracket, the indentation of the items,
+            the indentation of the closing bracket and the text from the
+            closing bracket.
+    """
+    before, after = text.split('"' + sentinel + '"', 1)
+    bracket = before.rindex("[")
+    return (before[:bracket + 1], before[bracket + 2:],
+            after[1:after.index("]")], after[after.index("]"):])
+
+
+def skeleton(content: Dict, indent: str) -> str:
+    """
+    Function encoding a json skeleton at an indentation.
+    :param content: The json object with sentinel arrays.
+    :param indent: The indentation of the object.
+    :return The encoded skeleton.
+    """
+    return json.dumps(content, ensure_ascii=False, indent=2).replace(
+        "\n", "\n" + indent)
+
+
+def close(count: int, indent: str) -> str:
+    """
+    Function returning the text before the closing bracket of an array.
+    :param count: The number of items in the array.
+    :param indent: The indentation of the closing bracket.
+    :return A line break and the indentation, or nothing for an empty array.
+    """
+    return "\n" + indent if count > 0 else ""
+
+
+class JsonChunks:
+    """
+    Class splicing the chunks of nodes and links of a TAPI topology into the
+    skeleton of the json document. The chunks are encoded by an executor.
+    The parts of the document are passed in the order of the document to an
+    output function as "write", except the chunks of links: they are passed
+    as "spool" during the traversal and belong at the position of the
+    following "flush-spool", after all nodes of their topology.
+    """
+
+    __executor: Executor = None
+    __output: Callable[[str, Union[bytes, Future, None]], None] = None
+    __chunk_size: int = 256
+    __chunks: Dict[str, List[Dict]] = None
+    __counts: Dict[str, int] = None
+    __template: Dict[str, Tuple[str, str, str, str]] = None
+
+    # constructor
+    def __init__(self, executor: Executor,
+                 output: Callable[[str, Union[bytes, Future, None]], None],
+                 chunk_size: int = 256):
+        self.__executor = executor
+        self.__output = output
+        self.__chunk_size = chunk_size
+        self.__chunks = {"node": [], "link": []}
+        self.__counts = {"topology": 0, "node": 0, "link": 0, "open": 0}
+        self.__template = {}
+
+    # getters
+    def counts(self) -> Dict[str, int]:
+        """
+        Getter returning the number of topologies and the number of nodes and
+        links of the last topology.
+        :return Number of items by kind.
+        """
+        return self.__counts
+
+    # methods
+    def begin(self, network: 'TapiCommonContext'):
+        """
+        Method passing the head of the document up to the topologies.
+        :param network: The TAPI Common Context.
+        """
+        context = {"tapi-common:context": network.data()[
+            "tapi-common:context"].copy()}
+        context["tapi-common:context"]["tapi-topology:topology-context"] = {
+            "topology": [SENTINEL]}
+        self.__template["context"] = split(skeleton(context, ""))
+        self.__output("write", self.__template["context"][0].encode("utf-8"))
+
+    def begin_topology(self, topology: 'TapiTopology'):
+        """
+        Method passing the head of a topology up to its nodes, a previous
+        topology is closed.
+        :param topology: The TAPI Topology.
+        """
+        self.end_topology()
+        content = topology.data().copy()
+        content["node"] = [SENTINEL]
+        content["link"] = [SENTINEL + "-link"]
+        indent = self.__template["context"][1]
+        self.__template["node"] = split(skeleton(content, indent))
+        # the link head starts with the closing bracket of the nodes
+        self.__template["link"] = split(
+            self.__template["node"][3], SENTINEL + "-link")
+        separator = "\n" if self.__counts["topology"] == 0 else ",\n"
+        self.__output("write", (separator + indent +
+                                self.__template["node"][0]).encode("utf-8"))
+        self.__counts.update({"topology": self.__counts["topology"] + 1,
+                              "node": 0, "link": 0, "open": 1})
+
+    def add(self, kind: str, item: 'Top'):
+        """
+        Method adding a node or link to the chunk of its kind, a full chunk
+        is submitted to the executor.
+        :param kind: "node" or "link".
+        :param item: The TAPI Node or TAPI Link.
+        """
+        self.__chunks[kind].append(item.json())
+        if len(self.__chunks[kind]) >= self.__chunk_size:
+            self.__flush(kind)
+
+    def end_topology(self):
+        """
+        Method passing the remaining chunks and the end of an open topology.
+        """
+        if self.__counts["open"] == 0:
+            return
+        self.__flush("node")
+        self.__flush("link")
+        self.__output("write", (close(
+            self.__counts["node"], self.__template["node"][2]) +
+            self.__template["link"][0]).encode("utf-8"))
+        self.__output("flush-spool", None)
+        self.__output("write", (close(
+            self.__counts["link"], self.__template["link"][2]) +
+            self.__template["link"][3]).encode("utf-8"))
+        self.__counts["open"] = 0
+
+    def end(self):
+        """
+        Method passing the end of the document, an open topology is closed.
+        """
+        self.end_topology()
+        self.__output("write", (close(
+            self.__counts["topology"], self.__template["context"][2]) +
+            self.__template["context"][3]).encode("utf-8"))
+
+    # private
+    def __flush(self, kind: str):
+        if len(self.__chunks[kind]) == 0:
+            return
+        future = self.__executor.submit(
+            encode, self.__chunks[kind], self.__template[kind][1],
+            self.__counts[kind] == 0)
+        self.__counts[kind] += len(self.__chunks[kind])
+        self.__chunks[kind] = []
+        self.__output("write" if kind == "node" else "spool", future)
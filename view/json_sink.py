@@ -0,0 +1,90 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+#!/usr/bin/python
+"""
+Module containing the output sink for the TAPI topology in json format.
+"""
+import json
+import os
+from typing import Dict, List, TYPE_CHECKING
+from controller import instrumentation
+from view.output_sink import OutputSink
+
+if TYPE_CHECKING:
+    from model.python.tapi_common_context import TapiCommonContext
+    from model.python.tapi_link import TapiLink
+    from model.python.tapi_node import TapiNode
+    from model.python.tapi_topology import TapiTopology
+
+
+class JsonSink(OutputSink):
+    """
+    Class building the TAPI topology as json object, identical to
+    TapiCommonContext.json().
+    """
+
+    EXTENSION: str = ".json"
+
+    __result: Dict = None
+    __topologies: List[Dict] = None
+    __topology: Dict = None
+
+    def begin(self, network: 'TapiCommonContext'):
+        self.__result = {"tapi-common:context": network.data()[
+            "tapi-common:context"].copy()}
+        self.__topologies = []
+
+    def begin_topology(self, topology: 'TapiTopology'):
+        self.__topology = topology.data().copy()
+        self.__topology["node"] = []
+        self.__topology["link"] = []
+
+    def node(self, node: 'TapiNode'):
+        self.__topology["node"].append(node.json())
+
+    def link(self, link: 'TapiLink'):
+        self.__topology["link"].append(link.json())
+
+    def end_topology(self, topology: 'TapiTopology'):
+        self.__topologies.append(self.__topology)
+        self.__topology = None
+
+    def end(self):
+        self.__result["tapi-common:context"].update({
+            "tapi-topology:topology-context": {"topology": self.__topologies}})
+
+    def json(self) -> Dict:
+        """
+        Getter returning the TAPI topology as json object.
+        :return TAPI Common Context as json object.
+        """
+        return self.__result
+
+    def document(self) -> bytes:
+        with instrumentation.phase("json-serialization"):
+            return json.dumps(self.__result,
+                              ensure_ascii=False, indent=2).encode("utf-8")
+
+    def save(self, filename: str):
+        with open(filename, "w", encoding='utf-8') as json_file:
+            with instrumentation.phase("json-write"):
+                json.dump(self.__result, json_file,
+                          ensure_ascii=False, indent=2)
+            for topology in self.__topologies:
+                print("Nodes:", len(topology["node"]))
+                print("Links:", len(topology["link"]))
+            print("File '" + filename + "' saved!")
+        instrumentation.count("bytes-written", os.path.getsize(filename))
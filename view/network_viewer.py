@@ -18,15 +18,17 @@ Provides functions to convert the Network into different formats
 """
 
 import encodings
-import json
-from lxml import etree
 from model.python.tapi_common_context import TapiCommonContext
+from view.output_pipeline import OutputPipeline
+from view.svg_sink import SvgSink
 
 
 class NetworkViewer:
     """
     This class contains all functions converting the Network into different formats
     """
+    SVG_DOCTYPE: str = SvgSink.SVG_DOCTYPE
+
     __network: TapiCommonContext = None
 
     # constructor
@@ -60,17 +62,14 @@ class NetworkViewer:
         :param filename: A valid path to a file on the system.
         :type filename: string
         """
-        with open(filename, "w", encoding='utf-8') as json_file:
-            output = self.__network.json()
-            json.dump(output, json_file,
-                      ensure_ascii=False, indent=2)
-            for key in ["Node", "Link"]:
-                print(key + "s:", len(output
-                                      ["tapi-common:context"]
-                                      ["tapi-topology:topology-context"]
-                                      ["topology"][0][key.lower()])
-                      )
-            print("File '" + filename + "' saved!")
+        OutputPipeline(self.__network, ["json"]).run().sink("json").save(filename)
+
+    def json_document(self) -> bytes:
+        """
+        Method returning the class content in json format.
+        :return The TAPI topology as utf-8 encoded json document.
+        """
+        return OutputPipeline(self.__network, ["json"]).document("json")
 
     def svg(self, filename: str):
         """
@@ -79,18 +78,11 @@ class NetworkViewer:
         :param filename: A valid path to a file on the system.
         :type filename: string
         """
-        root = self.__network.svg(0, 0)
-        root.addprevious(
-            etree.ProcessingInstruction("xml-stylesheet",
-                                        'href="svg.style.css" type="text/css"')
-        )
-        etree.ElementTree(root).write(filename,
-                                      encoding="utf-8",
-                                      xml_declaration=True,
-                                      doctype=(
-                                          '<!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN"\n'
-                                          '  "http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">'
-                                      ),
-                                      pretty_print=True
-                                      )
-        print("File '" + filename + "' saved!")
+        OutputPipeline(self.__network, ["svg"]).run().sink("svg").save(filename)
+
+    def svg_document(self) -> bytes:
+        """
+        Method returning the class content in xml/svg format.
+        :return The TAPI topology as utf-8 encoded svg document.
+        """
+        return OutputPipeline(self.__network, ["svg"]).document("svg")
@@ -0,0 +1,161 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+#!/usr/bin/python
+"""
+Module containing a class producing the selected output formats of a network
+in a single traversal.
+"""
+import importlib
+from typing import Dict, List, Optional, TYPE_CHECKING
+from controller import instrumentation
+from view.output_sink import OutputSink
+
+if TYPE_CHECKING:
+    from model.python.tapi_common_context import TapiCommonContext
+
+
+class OutputPipeline:
+    """
+    Class traversing the topologies, nodes and links of a network once and
+    passing each object to the sinks of the selected output formats. Formats
+    not selected are not built at all, e.g. no lxml tree is created for a
+    json only output. Further exporters are added to SINKS, exporters
+    encoding in worker processes to PARALLEL_SINKS. Exporters of the changes
+    to a previous version of the topology (DELTA) get the previous json.
+    The sinks are given by module and class name and are only imported, if
+    their format is selected, so that a run does not load e.g. the process
+    pool of the parallel json encoding without workers.
+    With enabled instrumentation, the calls of each sink are recorded as
+    phase of its format within the traversal, e.g. "svg-build".
+    """
+
+    SINKS: Dict[str, str] = {
+        "json": "view.json_sink.JsonSink",
+        "svg": "view.svg_sink.SvgSink",
+        "yang-patch": "view.patch_sink.YangPatchSink",
+        "json-patch": "view.patch_sink.JsonPatchSink"
+    }
+    PARALLEL_SINKS: Dict[str, str] = {
+        "json": "view.parallel_json_sink.ParallelJsonSink"
+    }
+
+    __network: 'TapiCommonContext' = None
+    __sinks: Dict[str, OutputSink] = None
+    __done: bool = False
+
+    # constructor
+    def __init__(self, network: 'TapiCommonContext', formats: List[str],
+                 workers: int = None, previous: Dict = None):
+        unknown = [name for name in formats if name not in self.SINKS]
+        if len(unknown) > 0:
+            raise ValueError("Unknown output format: " + ", ".join(unknown))
+        self.__network = network
+        self.__sinks = {}
+        for name in formats:
+            sink = self.__class(self.SINKS[name])
+            if sink.DELTA:
+                if previous is None:
+                    raise ValueError("Output format " + name +
+                                     " requires a previous topology")
+                self.__sinks[name] = sink(previous)
+            elif workers is not None and name in self.PARALLEL_SINKS:
+                self.__sinks[name] = self.__class(self.PARALLEL_SINKS[name])(workers)
+            else:
+                self.__sinks[name] = sink()
+        self.__done = False
+
+    # getters
+    def formats(self) -> List[str]:
+        """
+        Getter returning the selected output formats.
+        :return List of format names, e.g. ["json", "svg"].
+        """
+        return list(self.__sinks.keys())
+
+    def sink(self, output_format: str) -> OutputSink:
+        """
+        Getter returning the sink of an output format.
+        :param output_format: A selected format, e.g. "svg".
+        :return The OutputSink object.
+        """
+        return self.__sinks[output_format]
+
+    def document(self, output_format: str) -> bytes:
+        """
+        Getter returning an output format as document, the network is
+        traversed first, if not done yet.
+        :param output_format: A selected format, e.g. "svg".
+        :return The utf-8 encoded document.
+        """
+        return self.run().sink(output_format).document()
+
+    def json(self) -> Optional[Dict]:
+        """
+        Getter returning the TAPI topology as json object, if the json sink
+        builds it in this process, e.g. for the digests of the metadata.
+        :return TAPI Common Context as json object or None.
+        """
+        sink = self.__sinks.get("json")
+        if sink is None or not hasattr(sink, "json"):
+            return None
+        return self.run().sink("json").json()
+
+    # methods
+    def run(self) -> 'OutputPipeline':
+        """
+        Method passing all objects of the network to the sinks, once.
+        :return The OutputPipeline object.
+        """
+        if self.__done:
+            return self
+        with instrumentation.phase("output-traversal"):
+            self.__call("begin", self.__network)
+            for topology in self.__network.topology_context().topologies():
+                data = topology.data()
+                self.__call("begin_topology", topology)
+                for node in data["node"]:
+                    self.__call("node", node)
+                for link in data["link"]:
+                    self.__call("link", link)
+                self.__call("end_topology", topology)
+            self.__call("end")
+        self.__done = True
+        return self
+
+    def save(self, prefix: str):
+        """
+        Method saving all selected formats, the file name is the prefix and
+        the extension of the format.
+        :param prefix: A valid path on the system without extension.
+        :type prefix: string
+        """
+        self.run()
+        for sink in self.__sinks.values():
+            sink.save(prefix + sink.EXTENSION)
+
+    # private
+    def __call(self, method: str, *args):
+        if not instrumentation.RECORDER.enabled():
+            for sink in self.__sinks.values():
+                getattr(sink, method)(*args)
+            return
+        for name, sink in self.__sinks.items():
+            with instrumentation.phase(name + "-build"):
+                getattr(sink, method)(*args)
+
+    def __class(self, name: str) -> type:
+        module, _, class_name = name.rpartition(".")
+        return getattr(importlib.import_module(module), class_name)
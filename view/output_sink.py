@@ -0,0 +1,93 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+#!/usr/bin/python
+"""
+Module containing the base class of the output sinks.
+"""
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from model.python.tapi_common_context import TapiCommonContext
+    from model.python.tapi_link import TapiLink
+    from model.python.tapi_node import TapiNode
+    from model.python.tapi_topology import TapiTopology
+
+
+class OutputSink:
+    """
+    The abstract "OutputSink" class receives the objects of a network during
+    a single traversal by the OutputPipeline and builds one output format.
+    The begin and end methods do nothing by default.
+    """
+
+    # the file extension of the output format
+    EXTENSION: str = ""
+    # the sink compares the network with a previous version (json), which is
+    # passed to the constructor
+    DELTA: bool = False
+
+    def begin(self, network: 'TapiCommonContext'):
+        """
+        Method called before the traversal.
+        :param network: The TAPI Common Context.
+        """
+
+    def begin_topology(self, topology: 'TapiTopology'):
+        """
+        Method called before the nodes and links of a topology.
+        :param topology: The TAPI Topology.
+        """
+
+    def node(self, node: 'TapiNode'):
+        """
+        Method called for each node of the current topology.
+        :param node: The TAPI Node.
+        """
+        raise NotImplementedError('subclasses must override node()!')
+
+    def link(self, link: 'TapiLink'):
+        """
+        Method called for each link of the current topology, after its
+        nodes.
+        :param link: The TAPI Link.
+        """
+        raise NotImplementedError('subclasses must override link()!')
+
+    def end_topology(self, topology: 'TapiTopology'):
+        """
+        Method called after the nodes and links of a topology.
+        :param topology: The TAPI Topology.
+        """
+
+    def end(self):
+        """
+        Method called after the traversal.
+        """
+
+    def document(self) -> bytes:
+        """
+        Getter returning the output.
+        :return The output as utf-8 encoded document.
+        """
+        raise NotImplementedError('subclasses must override document()!')
+
+    def save(self, filename: str):
+        """
+        Method saving the output to a file.
+        :param filename: A valid path to a file on the system.
+        :type filename: string
+        """
+        raise NotImplementedError('subclasses must override save()!')
@@ -0,0 +1,119 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+#!/usr/bin/python
+"""
+Module containing the output sink encoding the json format in parallel.
+"""
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List, Tuple, TYPE_CHECKING, Union
+from controller import instrumentation
+from view import json_chunks
+from view.output_sink import OutputSink
+
+if TYPE_CHECKING:
+    from model.python.tapi_common_context import TapiCommonContext
+    from model.python.tapi_link import TapiLink
+    from model.python.tapi_node import TapiNode
+    from model.python.tapi_topology import TapiTopology
+
+
+class ParallelJsonSink(OutputSink):
+    """
+    Class encoding the TAPI topology in json format with a pool of worker
+    processes. The nodes and links are collected into chunks during the
+    traversal, each chunk is encoded by a worker into bytes. The chunks are
+    spliced into the "node" and "link" arrays of the document in the order
+    of the traversal, so the document is byte-identical to the one of the
+    JsonSink.
+    """
+
+    EXTENSION: str = ".json"
+    CHUNK_SIZE: int = 256
+    WRITE_BUFFER: int = 1024 * 1024
+
+    __workers: int = None
+    __executor: ProcessPoolExecutor = None
+    __chunks: json_chunks.JsonChunks = None
+    __parts: List[Union[bytes, Future]] = None
+    __links: List[Union[bytes, Future]] = None
+    __nodes: List[Tuple[int, int]] = None
+
+    # constructor
+    def __init__(self, workers: int = None):
+        self.__workers = workers
+
+    def begin(self, network: 'TapiCommonContext'):
+        self.__executor = ProcessPoolExecutor(self.__workers)
+        self.__parts = []
+        self.__links = []
+        self.__nodes = []
+        self.__chunks = json_chunks.JsonChunks(
+            self.__executor, self.__output, self.CHUNK_SIZE)
+        self.__chunks.begin(network)
+
+    def begin_topology(self, topology: 'TapiTopology'):
+        self.__chunks.begin_topology(topology)
+
+    def node(self, node: 'TapiNode'):
+        self.__chunks.add("node", node)
+
+    def link(self, link: 'TapiLink'):
+        self.__chunks.add("link", link)
+
+    def end_topology(self, topology: 'TapiTopology'):
+        self.__chunks.end_topology()
+        counts = self.__chunks.counts()
+        self.__nodes.append((counts["node"], counts["link"]))
+
+    def end(self):
+        self.__chunks.end()
+
+    def document(self) -> bytes:
+        with instrumentation.phase("json-serialization"):
+            return b"".join(self.__resolve())
+
+    def save(self, filename: str):
+        with instrumentation.phase("json-write"):
+            with open(filename, "wb", buffering=self.WRITE_BUFFER) as json_file:
+                for part in self.__resolve():
+                    json_file.write(part)
+        for nodes, links in self.__nodes:
+            print("Nodes:", nodes)
+            print("Links:", links)
+        print("File '" + filename + "' saved!")
+        instrumentation.count("bytes-written", os.path.getsize(filename))
+
+    # private
+    def __output(self, kind: str, part: Union[bytes, Future, None]):
+        # the link chunks of a topology follow all of its nodes
+        if kind == "write":
+            self.__parts.append(part)
+        elif kind == "spool":
+            self.__links.append(part)
+        else:
+            self.__parts.extend(self.__links)
+            self.__links = []
+
+    def __resolve(self) -> List[bytes]:
+        # waits for the workers in the order of the document, the pool is
+        # released when all chunks are encoded
+        if self.__executor is not None:
+            self.__parts = [part.result() if isinstance(part, Future) else part
+                            for part in self.__parts]
+            self.__executor.shutdown()
+            self.__executor = None
+        return self.__parts
@@ -0,0 +1,276 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+#!/usr/bin/python
+"""
+Module containing the output sinks for the changes of a TAPI topology as
+YANG-Patch (RFC 8072) or JSON Patch (RFC 6902) documents.
+"""
+import bisect
+import json
+from typing import Dict, List, Tuple, TYPE_CHECKING, Union
+from view.output_sink import OutputSink
+
+if TYPE_CHECKING:
+    from model.python.tapi_common_context import TapiCommonContext
+    from model.python.tapi_link import TapiLink
+    from model.python.tapi_node import TapiNode
+    from model.python.tapi_topology import TapiTopology
+
+
+class PatchSink(OutputSink):
+    """
+    The abstract "PatchSink" class compares the nodes and links of the
+    network with a previous version of the TAPI topology (json) by their
+    uuids and collects the edits changing the previous into the current
+    version. The edits are ordered, so that each link refers to existing
+    nodes and node-edge-points after every step:
+    link deletes, node-edge-point deletes, node deletes, node creates, node
+    merges, link creates and link merges. The edits are split into patches
+    of at most max_edits edits and max_bytes bytes, to be applied in order.
+    """
+
+    DELTA: bool = True
+
+    __previous: Dict[str, Tuple[int, Dict[str, Dict[str, Tuple[int, Dict]]]]] = None
+    __max_edits: int = 1000
+    __max_bytes: int = 1024 * 1024
+    __topology: str = None
+    __seen: Dict[str, set] = None
+    __edits: Dict[str, List[Dict]] = None
+    __patches: List[Tuple[str, List[Dict]]] = None
+
+    # constructor
+    def __init__(self, previous: Dict, max_edits: int = 1000,
+                 max_bytes: int = 1024 * 1024):
+        self.__previous = {}
+        topologies = (previous["tapi-common:context"]
+                      ["tapi-topology:topology-context"]["topology"])
+        for topology_index, topology in enumerate(topologies):
+            self.__previous[topology["uuid"]] = (topology_index, {
+                kind: {item["uuid"]: (index, item)
+                       for index, item in enumerate(topology[kind])}
+                for kind in ["node", "link"]})
+        self.__max_edits = max_edits
+        self.__max_bytes = max_bytes
+        self.__patches = []
+
+    # getters
+    def patches(self) -> List[Dict]:
+        """
+        Getter returning the patch documents.
+        :return List of patches as json objects.
+        """
+        return [self.patch(target, edits, index + 1)
+                for index, (target, edits) in enumerate(self.__patches)]
+
+    def patch(self, target: str, edits: List[Dict],
+              number: int) -> Union[Dict, List[Dict]]:
+        """
+        Getter returning a patch document, implemented by the subclasses.
+        :param target: The resource of the topology.
+        :param edits: The edits of the patch.
+        :param number: The position of the patch in the order of application.
+        :return The patch as json object.
+        """
+        raise NotImplementedError('subclasses must override patch()!')
+
+    def edits(self, edit: Dict, target: str) -> List[Dict]:
+        """
+        Getter returning the edits of the format for a change, implemented by
+        the subclasses.
+        :param edit: The change with operation, kind, uuid, index and value.
+        :param target: The resource of the topology.
+        :return List of edits as json objects, applied together.
+        """
+        raise NotImplementedError('subclasses must override edits()!')
+
+    # methods
+    def begin_topology(self, topology: 'TapiTopology'):
+        if topology.identifier() not in self.__previous:
+            raise ValueError("Topology " + topology.identifier() +
+                             " not found in the previous version.")
+        self.__topology = topology.identifier()
+        self.__seen = {"node": set(), "link": set()}
+        self.__edits = {operation: [] for operation in [
+            "delete-link", "delete-node-edge-point", "delete-node",
+            "create-node", "merge-node", "create-link", "merge-link"]}
+
+    def node(self, node: 'TapiNode'):
+        self.__compare("node", node.identifier(), node.json())
+
+    def link(self, link: 'TapiLink'):
+        self.__compare("link", link.identifier(), link.json())
+
+    def end_topology(self, topology: 'TapiTopology'):
+        previous = self.__previous[self.__topology][1]
+        for kind in ["link", "node"]:
+            deleted = [(index, item) for uuid, (index, item)
+                       in previous[kind].items()
+                       if uuid not in self.__seen[kind]]
+            # descending indexes keep the smaller indexes valid
+            for index, item in sorted(deleted, key=lambda entry: -entry[0]):
+                self.__edits["delete-" + kind].append({
+                    "operation": "delete", "kind": kind, "uuid": item["uuid"],
+                    "index": index})
+
+        # the indexes after the deletes of the array elements before
+        for kind in ["node", "link"]:
+            deleted = sorted([edit["index"] for edit
+                              in self.__edits["delete-" + kind]])
+            for edit in self.__edits["merge-" + kind]:
+                edit["index"] -= bisect.bisect_left(deleted, edit["index"])
+
+        target = "/".join([
+            "tapi-common:context", "tapi-topology:topology-context",
+            "topology=" + self.__topology])
+        changes: List[List[Dict]] = []
+        for edits in self.__edits.values():
+            changes.extend([self.edits(edit, target) for edit in edits])
+        self.__split(target, changes)
+
+    def document(self) -> bytes:
+        return json.dumps(self.patches(), ensure_ascii=False,
+                          indent=2).encode("utf-8")
+
+    def save(self, filename: str):
+        """
+        Method saving each patch to a file, numbered in the order of
+        application, e.g. "network.yang-patch.0001.json".
+        :param filename: A valid path to a file on the system.
+        :type filename: string
+        """
+        prefix = filename[:-len(".json")] if filename.endswith(".json") \
+            else filename
+        counts: Dict[str, int] = {}
+        for _, edits in self.__patches:
+            for edit in edits:
+                operation = edit.get("operation", edit.get("op"))
+                counts[operation] = counts.get(operation, 0) + 1
+        print("Edits:", ", ".join([str(count) + " " + operation
+                                   for operation, count in counts.items()]))
+        for index, patch in enumerate(self.patches()):
+            name = prefix + "." + str(index + 1).zfill(4) + ".json"
+            with open(name, "w", encoding='utf-8') as json_file:
+                json.dump(patch, json_file, ensure_ascii=False, indent=2)
+            print("File '" + name + "' saved!")
+
+    # private
+    def __compare(self, kind: str, uuid: str, value: Dict):
+        self.__seen[kind].add(uuid)
+        previous = self.__previous[self.__topology][1][kind].get(uuid)
+        if previous is None:
+            self.__edits["create-" + kind].append({
+                "operation": "create", "kind": kind, "uuid": uuid,
+                "value": value})
+        elif previous[1] != value:
+            self.__edits["merge-" + kind].append({
+                "operation": "merge", "kind": kind, "uuid": uuid,
+                "index": previous[0], "value": value})
+            if kind == "node":
+                # a merge does not remove the node-edge-points of the previous
+                # node
+                current = set([nep["uuid"] for nep
+                               in value["owned-node-edge-point"]])
+                for nep in previous[1]["owned-node-edge-point"]:
+                    if nep["uuid"] not in current:
+                        self.__edits["delete-node-edge-point"].append({
+                            "operation": "delete", "kind": "node-edge-point",
+                            "uuid": nep["uuid"], "node": uuid})
+
+    def __split(self, target: str, changes: List[List[Dict]]):
+        edits: List[Dict] = []
+        size = 0
+        for change in changes:
+            change_size = sum([len(json.dumps(edit, ensure_ascii=False)) + 1
+                               for edit in change])
+            if len(edits) > 0 and (
+                    len(edits) + len(change) > self.__max_edits or
+                    size + change_size > self.__max_bytes):
+                self.__patches.append((target, edits))
+                edits = []
+                size = 0
+            edits.extend(change)
+            size += change_size
+        if len(edits) > 0:
+            self.__patches.append((target, edits))
+
+
+class YangPatchSink(PatchSink):
+    """
+    Class providing the changes as RFC 8072 YANG-Patch documents for the
+    resource "tapi-common:context/tapi-topology:topology-context/topology=<uuid>".
+    """
+
+    EXTENSION: str = ".yang-patch.json"
+
+    def patch(self, target: str, edits: List[Dict], number: int) -> Dict:
+        return {"ietf-yang-patch:yang-patch": {
+            "patch-id": target.rpartition("=")[2] + "-" + str(number).zfill(4),
+            "edit": edits}}
+
+    def edits(self, edit: Dict, target: str) -> List[Dict]:
+        path = "/" + edit["kind"] + "=" + edit["uuid"]
+        if edit["kind"] == "node-edge-point":
+            path = "/node=" + edit["node"] + "/owned-node-edge-point=" + edit["uuid"]
+        result = {"edit-id": edit["operation"] + "-" + edit["kind"] + "-" + edit["uuid"],
+                  "operation": edit["operation"],
+                  "target": path}
+        if "value" in edit:
+            result["value"] = {"tapi-topology:" + edit["kind"]: [edit["value"]]}
+        return [result]
+
+
+class JsonPatchSink(PatchSink):
+    """
+    Class providing the changes as RFC 6902 JSON Patch documents for the json
+    file of the TAPI topology. The array elements are addressed by their
+    index in the previous version, shifted by the preceding removes. Each
+    remove and replace is preceded by a test of the uuid. A merge replaces
+    the node or link.
+    """
+
+    EXTENSION: str = ".json-patch.json"
+
+    __topologies: Dict[str, int] = None
+
+    def __init__(self, previous: Dict, max_edits: int = 1000,
+                 max_bytes: int = 1024 * 1024):
+        super().__init__(previous, max_edits, max_bytes)
+        self.__topologies = {
+            topology["uuid"]: index for index, topology in enumerate(
+                previous["tapi-common:context"]
+                ["tapi-topology:topology-context"]["topology"])}
+
+    def patch(self, target: str, edits: List[Dict], number: int) -> List[Dict]:
+        return edits
+
+    def edits(self, edit: Dict, target: str) -> List[Dict]:
+        if edit["kind"] == "node-edge-point":
+            # part of the replaced node
+            return []
+        path = "/".join([
+            "", "tapi-common:context", "tapi-topology:topology-context",
+            "topology", str(self.__topologies[target.rpartition("=")[2]]),
+            edit["kind"]])
+        if edit["operation"] == "create":
+            return [{"op": "add", "path": path + "/-", "value": edit["value"]}]
+        path = path + "/" + str(edit["index"])
+        result = [{"op": "test", "path": path + "/uuid", "value": edit["uuid"]}]
+        if edit["operation"] == "delete":
+            result.append({"op": "remove", "path": path})
+        else:
+            result.append({"op": "replace", "path": path, "value": edit["value"]})
+        return result
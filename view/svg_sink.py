@@ -0,0 +1,116 @@
+# Copyright 2022 highstreet technologies GmbH
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+#!/usr/bin/python
+"""
+Module containing the output sink for the TAPI topology in svg format.
+"""
+import os
+from typing import Dict, List, TYPE_CHECKING
+from controller import instrumentation
+from view.output_sink import OutputSink
+
+if TYPE_CHECKING:
+    from lxml import etree
+    from model.python.tapi_common_context import TapiCommonContext
+    from model.python.tapi_link import TapiLink
+    from model.python.tapi_node import TapiNode
+    from model.python.tapi_topology import TapiTopology
+
+
+class SvgSink(OutputSink):
+    """
+    Class building the lxml tree of the svg representation, identical to
+    TapiCommonContext.svg(0, 0). The nodes are rendered before the links,
+    because the links are drawn between the positions of the node-edge-points,
+    but the links are drawn below the nodes.
+    """
+
+    SVG_DOCTYPE: str = (
+        '<!DOCTYPE svg PUBLIC "-//W3C//DTD SVG 1.1//EN"\n'
+        '  "http://www.w3.org/Graphics/SVG/1.1/DTD/svg11.dtd">'
+    )
+
+    EXTENSION: str = ".svg"
+
+    __root: 'etree.Element' = None
+    __context: 'etree.Element' = None
+    __topology: 'TapiTopology' = None
+    __group: 'etree.Element' = None
+    __index_per_type: Dict[type, int] = None
+    __nodes: List['etree.Element'] = None
+    __tree: 'etree.ElementTree' = None
+
+    def begin(self, network: 'TapiCommonContext'):
+        self.__root = network.svg_root()
+        self.__context = network.topology_context().svg_group()
+        self.__root.append(self.__context)
+
+    def begin_topology(self, topology: 'TapiTopology'):
+        self.__topology = topology
+        self.__group = topology.svg_group()
+        self.__index_per_type = {}
+        self.__nodes = []
+
+    def node(self, node: 'TapiNode'):
+        index = self.__index_per_type.get(type(node), -1) + 1
+        self.__index_per_type[type(node)] = index
+        node_x, node_y = self.__topology.svg_position(node, index, 0, 0)
+        self.__nodes.append(node.svg(node_x, node_y))
+
+    def link(self, link: 'TapiLink'):
+        self.__group.append(link.svg(0, 0))
+
+    def end_topology(self, topology: 'TapiTopology'):
+        for svg_node in self.__nodes:
+            self.__group.append(svg_node)
+        self.__context.append(self.__group)
+        self.__topology, self.__group, self.__nodes = None, None, None
+
+    def end(self):
+        from lxml import etree  # pylint: disable=import-outside-toplevel
+        self.__root.addprevious(
+            etree.ProcessingInstruction("xml-stylesheet",
+                                        'href="svg.style.css" type="text/css"')
+        )
+        self.__tree = etree.ElementTree(self.__root)
+
+    def tree(self) -> 'etree.ElementTree':
+        """
+        Getter returning the svg representation.
+        :return The lxml tree of the svg document.
+        """
+        return self.__tree
+
+    def document(self) -> bytes:
+        from lxml import etree  # pylint: disable=import-outside-toplevel
+        with instrumentation.phase("svg-serialization"):
+            return etree.tostring(self.__tree,
+                                  encoding="UTF-8",
+                                  xml_declaration=True,
+                                  doctype=self.SVG_DOCTYPE,
+                                  pretty_print=True
+                                  )
+
+    def save(self, filename: str):
+        with instrumentation.phase("svg-write"):
+            self.__tree.write(filename,
+                              encoding="utf-8",
+                              xml_declaration=True,
+                              doctype=self.SVG_DOCTYPE,
+                              pretty_print=True
+                              )
+        instrumentation.count("bytes-written", os.path.getsize(filename))
+        print("File '" + filename + "' saved!")